@@ -0,0 +1,41 @@
+"""
+Compares the active engine with the scan engine on sparse wrapped universes.
+
+    python -m benchmarks.active_engine
+"""
+import random
+import time
+from life import ActiveEngine, ScanEngine, WrappedUniverse
+
+
+SIZE = 256
+DENSITIES = (.001, .01, .1)
+GENERATIONS = 5
+
+
+def measure(engine, universe) -> float:
+    """Returns seconds per generation."""
+    start = time.perf_counter()
+
+    for _ in range(GENERATIONS):
+        universe = engine.step(universe, lambda: 1)
+
+    return (time.perf_counter() - start) / GENERATIONS
+
+
+def main():
+    random.seed(0)
+
+    print('{:>8} {:>12} {:>12} {:>8}'.format('density', 'scan, ms', 'active, ms', 'speedup'))
+
+    for density in DENSITIES:
+        universe = WrappedUniverse.random(SIZE, SIZE, lambda: 1 if random.random() < density else None)
+
+        scan = measure(ScanEngine(), universe)
+        active = measure(ActiveEngine(), universe)
+
+        print('{:>8.1%} {:>12.2f} {:>12.2f} {:>7.0f}x'.format(density, scan * 1000, active * 1000, scan / active))
+
+
+if __name__ == '__main__':
+    main()
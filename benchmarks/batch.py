@@ -0,0 +1,41 @@
+"""
+Compares stepping many small universes one by one with the active engine and all at once with a batch.
+
+    python -m benchmarks.batch [boards]
+"""
+import random
+import sys
+import time
+from life import ActiveEngine, Batch, WrappedUniverse
+
+
+BOARDS = 1000
+SIZE = 32
+GENERATIONS = 5
+
+
+def main(boards: int):
+    random.seed(0)
+    universes = [WrappedUniverse.random(SIZE, SIZE, lambda: random.choice([1, None])) for _ in range(boards)]
+    batch = Batch.from_universes(universes)
+
+    engine = ActiveEngine()
+    start = time.perf_counter()
+
+    for _ in range(GENERATIONS):
+        universes = [engine.step(universe, lambda: 1) for universe in universes]
+
+    active = (time.perf_counter() - start) / GENERATIONS
+    start = time.perf_counter()
+
+    for _ in range(GENERATIONS):
+        batch.step()
+
+    batched = (time.perf_counter() - start) / GENERATIONS
+
+    print('{:>8} {:>12} {:>12} {:>8}'.format('boards', 'active, ms', 'batch, ms', 'speedup'))
+    print('{:>8} {:>12.2f} {:>12.2f} {:>7.0f}x'.format(boards, active * 1000, batched * 1000, active / batched))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else BOARDS)
@@ -0,0 +1,39 @@
+"""
+Measures the bit-packed engine on random soups of 50% density.
+
+    python -m benchmarks.bit_packed_engine [size ...]
+"""
+import random
+import sys
+import time
+from life import BitPackedEngine, WrappedBitPackedUniverse
+
+
+SIZES = (1024, 4096)
+GENERATIONS = 3
+
+
+def main(sizes):
+    print('{:>8} {:>12} {:>12}'.format('size', 'memory, MiB', 'step, ms'))
+
+    for size in sizes:
+        random.seed(0)
+
+        universe = WrappedBitPackedUniverse(size, size)
+        universe._rows = [random.getrandbits(size) for _ in range(size)]
+
+        memory = sum(sys.getsizeof(row) for row in universe._rows) + sys.getsizeof(universe._rows)
+
+        engine = BitPackedEngine()
+        start = time.perf_counter()
+
+        for _ in range(GENERATIONS):
+            universe = engine.step(universe, None)
+
+        step = (time.perf_counter() - start) / GENERATIONS
+
+        print('{:>8} {:>12.1f} {:>12.2f}'.format(size, memory / 2 ** 20, step * 1000))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,55 @@
+"""
+Compares the chunked engine with the dense engine on a board of stable blocks with a few blinkers.
+
+    python -m benchmarks.chunked_engine [size]
+"""
+import sys
+import time
+from life import ChunkedEngine, DenseEngine, WrappedChunkedUniverse, WrappedDenseUniverse
+
+
+SIZE = 2048
+GENERATIONS = 10
+# Blocks are placed on a grid of this step, and every row of the grid that is a multiple of 'BLINKERS' has a blinker.
+STEP = 16
+BLINKERS = 32
+
+
+def seed(cls, size: int):
+    """Returns a universe of blocks on a grid with a few blinkers."""
+    universe = cls(size, size)
+
+    for y in range(0, size, STEP):
+        for x in range(0, size, STEP):
+            for dx, dy in ((0, 0), (1, 0), (0, 1), (1, 1)):
+                universe[x + dx, y + dy] = 1
+
+        if y // STEP % BLINKERS == 0:
+            for dx in range(3):
+                universe[size // 2 + dx + STEP // 2, y + STEP // 2] = 1
+
+    return universe
+
+
+def measure(engine, universe) -> float:
+    """Returns seconds per generation once stable chunks are asleep."""
+    universe = engine.step(universe, lambda: 1)
+    start = time.perf_counter()
+
+    for _ in range(GENERATIONS):
+        universe = engine.step(universe, lambda: 1)
+
+    return (time.perf_counter() - start) / GENERATIONS
+
+
+def main(size: int):
+    print('{:>8} {:>12} {:>12} {:>8}'.format('size', 'dense, ms', 'chunked, ms', 'speedup'))
+
+    dense = measure(DenseEngine(), seed(WrappedDenseUniverse, size))
+    chunked = measure(ChunkedEngine(), seed(WrappedChunkedUniverse, size))
+
+    print('{:>8} {:>12.2f} {:>12.2f} {:>7.0f}x'.format(size, dense * 1000, chunked * 1000, dense / chunked))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
@@ -0,0 +1,40 @@
+"""
+Compares the dense engine with the active engine on random soups of 50% density.
+
+    python -m benchmarks.dense_engine [size ...]
+"""
+import random
+import sys
+import time
+from life import ActiveEngine, DenseEngine, WrappedDenseUniverse, WrappedUniverse
+
+
+SIZES = (256, 1024)
+GENERATIONS = 3
+
+
+def measure(engine, universe) -> float:
+    """Returns seconds per generation."""
+    start = time.perf_counter()
+
+    for _ in range(GENERATIONS):
+        universe = engine.step(universe, lambda: 1)
+
+    return (time.perf_counter() - start) / GENERATIONS
+
+
+def main(sizes):
+    print('{:>8} {:>12} {:>12} {:>8}'.format('size', 'active, ms', 'dense, ms', 'speedup'))
+
+    for size in sizes:
+        random.seed(0)
+        data = [[random.choice([1, None]) for _ in range(size)] for _ in range(size)]
+
+        active = measure(ActiveEngine(), WrappedUniverse.from_data(data))
+        dense = measure(DenseEngine(), WrappedDenseUniverse.from_data(data))
+
+        print('{:>8} {:>12.2f} {:>12.2f} {:>7.0f}x'.format(size, active * 1000, dense * 1000, active / dense))
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or SIZES)
@@ -0,0 +1,60 @@
+"""
+Compares memory allocations of the active engine and the double-buffered engine with tracemalloc.
+
+    python -m benchmarks.double_buffered_engine [size]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from life import ActiveEngine, DoubleBufferedEngine, WrappedUniverse
+
+
+SIZE = 256
+GENERATIONS = 20
+
+
+def measure(engine, universe):
+    """Returns seconds per generation and the largest memory allocated within a step above the memory before it."""
+    start = time.perf_counter()
+
+    for _ in range(GENERATIONS):
+        universe = engine.step(universe, lambda: 1)
+
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    allocated = 0
+
+    for _ in range(GENERATIONS):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        universe = engine.step(universe, lambda: 1)
+
+        allocated = max(allocated, tracemalloc.get_traced_memory()[1] - before)
+
+    tracemalloc.stop()
+
+    return elapsed / GENERATIONS, allocated
+
+
+def main(size: int):
+    random.seed(0)
+    universe = WrappedUniverse.random(size, size, lambda: random.choice([1, None]))
+
+    engines = (
+        ('active', ActiveEngine()),
+        ('double', DoubleBufferedEngine())
+    )
+
+    print('{:>10} {:>12} {:>16}'.format('engine', 'step, ms', 'step peak, KiB'))
+
+    for name, engine in engines:
+        step, allocated = measure(engine, universe)
+
+        print('{:>10} {:>12.2f} {:>16.0f}'.format(name, step * 1000, allocated / 2 ** 10))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if sys.argv[1:] else SIZE)
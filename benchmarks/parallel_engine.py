@@ -0,0 +1,42 @@
+"""
+Measures how the parallel engine scales with the number of workers on a random soup of 50% density.
+
+    python -m benchmarks.parallel_engine [size]
+"""
+import random
+import sys
+import time
+from life import ParallelEngine, WrappedDenseUniverse
+
+
+SIZE = 2048
+WORKERS = (1, 2, 4, 8, 16)
+GENERATIONS = 5
+
+
+def main(size: int):
+    random.seed(0)
+    universe = WrappedDenseUniverse.random(size, size, lambda: random.choice([1, None]))
+
+    print('{:>8} {:>12} {:>8}'.format('workers', 'step, ms', 'speedup'))
+
+    baseline = None
+
+    for workers in WORKERS:
+        with ParallelEngine(workers) as engine:
+            # The first step starts the processes and attaches them to shared memory.
+            next_universe = engine.step(universe, lambda: 1)
+            start = time.perf_counter()
+
+            for _ in range(GENERATIONS):
+                next_universe = engine.step(next_universe, lambda: 1)
+
+            step = (time.perf_counter() - start) / GENERATIONS
+
+        baseline = baseline or step
+
+        print('{:>8} {:>12.2f} {:>7.1f}x'.format(workers, step * 1000, baseline / step))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if sys.argv[1:] else SIZE)
@@ -0,0 +1,213 @@
+"""
+Runs seeded workloads on every engine and universe type and compares the results with a stored baseline.
+Workloads are random soups of several densities and canonical patterns in the center of the universe.
+Every case runs in a fresh process, so its peak RSS is not affected by other cases.
+Cases whose cost would not fit a benchmark run are skipped: see 'ENGINES' and 'MAX_SOUP_AREA'.
+
+    python -m benchmarks.suite [--engines ...] [--sizes ...] [--densities ...] [--patterns ...]
+                               [--seconds S] [--output results.json] [--baseline baseline.json] [--save-baseline]
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import numpy
+from life import (
+    ActiveEngine, BitPackedEngine, ChunkedEngine, ClosedBitPackedUniverse, ClosedChunkedUniverse, ClosedDenseUniverse,
+    ClosedUniverse, DenseEngine, HashLifeEngine, ScanEngine, WrappedBitPackedUniverse, WrappedChunkedUniverse,
+    WrappedDenseUniverse, WrappedUniverse, BitPackedUniverse, originate_from, read_rle
+)
+
+
+SIZES = (64, 512, 8192)
+DENSITIES = (.001, .05, .5)
+TOPOLOGIES = ('closed', 'wrapped')
+SEED = 0
+SECONDS = .5
+MAX_GENERATIONS = 1000
+TOLERANCE = .25
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+PATTERNS = {
+    'r_pentomino': 'x = 3, y = 3\nb2o$2o$bo!',
+    'acorn': 'x = 7, y = 3\nbo$3bo$2o2b3o!',
+    'gosper_gun': 'x = 36, y = 9\n24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$2o8bo5bo3b2o$2o8bo3bob2o4bobo$'
+                  '10bo5bo7bo$11bo3bo$12b2o!'
+}
+
+# Engines with their closed and wrapped universes and the largest area and population they are run for.
+ENGINES = {
+    'scan': (ScanEngine, ClosedUniverse, WrappedUniverse, 2 ** 16, None),
+    'active': (ActiveEngine, ClosedUniverse, WrappedUniverse, None, 2 ** 17),
+    'dense': (DenseEngine, ClosedDenseUniverse, WrappedDenseUniverse, 2 ** 26, None),
+    'bit_packed': (BitPackedEngine, ClosedBitPackedUniverse, WrappedBitPackedUniverse, None, None),
+    'chunked': (ChunkedEngine, ClosedChunkedUniverse, WrappedChunkedUniverse, None, None),
+    'hashlife': (HashLifeEngine, ClosedUniverse, WrappedUniverse, None, 2 ** 14)
+}
+
+# Soups of sparse universes are seeded cell by cell with 'BaseUniverse.random'.
+MAX_SOUP_AREA = 2 ** 20
+
+
+def cases(engines, topologies, sizes, densities, patterns):
+    """Returns cases that fit the limits of their engines."""
+    workloads = [('soup', density) for density in densities] + [(pattern, None) for pattern in patterns]
+
+    for name in engines:
+        _, closed, _, max_area, max_population = ENGINES[name]
+
+        for topology in topologies:
+            for size in sizes:
+                for workload, density in workloads:
+                    area = size * size
+                    population = area * density if density else 0
+
+                    if max_area is not None and area > max_area:
+                        continue
+
+                    if max_population is not None and population > max_population:
+                        continue
+
+                    if density and area > MAX_SOUP_AREA and not issubclass(closed, BitPackedUniverse):
+                        continue
+
+                    yield dict(engine=name, topology=topology, size=size, workload=workload, density=density)
+
+
+def seed(cls, size, workload, density):
+    """Returns a universe with a seeded soup or a pattern in its center."""
+    if workload != 'soup':
+        pattern, _ = read_rle(io.StringIO(PATTERNS[workload]), ClosedUniverse, lambda: 1)
+        universe = cls(size, size)
+        left, top = (size - pattern.width) // 2, (size - pattern.height) // 2
+
+        for x, y in pattern.alive():
+            universe[left + x, top + y] = 1
+
+        return universe
+
+    if issubclass(cls, BitPackedUniverse):
+        generator = numpy.random.default_rng(SEED)
+        universe = cls(size, size)
+
+        for y in range(size):
+            bits = numpy.packbits(generator.random(size) < density, bitorder='little')
+            universe._rows[y] = int.from_bytes(bits.tobytes(), 'little')
+
+        return universe
+
+    generator = random.Random(SEED)
+
+    return cls.random(size, size, lambda: 1 if generator.random() < density else None)
+
+
+def run(case, seconds, max_generations):
+    """Returns the case with generations/sec, cell-updates/sec and peak RSS of the process in KiB."""
+    engine, closed, wrapped, _, _ = ENGINES[case['engine']]
+    universe = seed(closed if case['topology'] == 'closed' else wrapped, case['size'], case['workload'],
+                    case['density'])
+
+    generations = 0
+    start = time.perf_counter()
+
+    for _ in originate_from(universe, lambda: 1, engine()):
+        generations += 1
+
+        if generations >= max_generations or time.perf_counter() - start >= seconds:
+            break
+
+    elapsed = time.perf_counter() - start
+    # 'ru_maxrss' is in KiB on Linux and in bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (2 ** 10 if sys.platform == 'darwin' else 1)
+
+    return dict(case, generations=generations, seconds=elapsed, generations_per_second=generations / elapsed,
+                cell_updates_per_second=generations * case['size'] ** 2 / elapsed, peak_rss_kib=peak_rss)
+
+
+def key_of(result):
+    """Returns a key that identifies the case of a result."""
+    return result['engine'], result['topology'], result['size'], result['workload'], result['density']
+
+
+def compare(results, baseline, tolerance):
+    """Returns results that are slower than in the baseline by more than the tolerance."""
+    expected = {key_of(result): result for result in baseline['results']}
+
+    return [
+        (result, expected[key_of(result)]) for result in results
+        if key_of(result) in expected and
+        result['generations_per_second'] < expected[key_of(result)]['generations_per_second'] * (1 - tolerance)
+    ]
+
+
+def main(arguments):
+    print('{:>10} {:>8} {:>6} {:>12} {:>8} {:>8} {:>14} {:>10}'.format(
+        'engine', 'topology', 'size', 'workload', 'density', 'gens/s', 'cell-updates/s', 'RSS, MiB'))
+
+    results = []
+    context = get_context('spawn')
+
+    for case in cases(arguments.engines, arguments.topologies, arguments.sizes, arguments.densities,
+                      arguments.patterns):
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            result = executor.submit(run, case, arguments.seconds, arguments.generations).result()
+
+        results.append(result)
+
+        print('{engine:>10} {topology:>8} {size:>6} {workload:>12} {density:>8} {generations_per_second:>8.1f} '
+              '{cell_updates_per_second:>14.3g} {rss:>10.1f}'.format(
+                  **dict(result, density=result['density'] or '-', rss=result['peak_rss_kib'] / 2 ** 10)))
+
+    report = dict(python=platform.python_version(), machine=platform.machine(), processor=platform.processor(),
+                  seed=SEED, results=results)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+
+        return 0
+
+    if not os.path.exists(arguments.baseline):
+        return 0
+
+    with open(arguments.baseline) as file:
+        regressions = compare(results, json.load(file), arguments.tolerance)
+
+    for result, expected in regressions:
+        print('regression: {} {} {} {} {}: {:.1f} gens/s, baseline {:.1f} gens/s'.format(
+            *key_of(result), result['generations_per_second'], expected['generations_per_second']))
+
+    return 1 if regressions else 0
+
+
+def parse(argv):
+    """Returns command line arguments."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=sorted(ENGINES))
+    parser.add_argument('--topologies', nargs='+', choices=TOPOLOGIES, default=TOPOLOGIES)
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--densities', nargs='+', type=float, default=DENSITIES)
+    parser.add_argument('--patterns', nargs='*', choices=sorted(PATTERNS), default=sorted(PATTERNS))
+    parser.add_argument('--seconds', type=float, default=SECONDS, help='time limit of a case')
+    parser.add_argument('--generations', type=int, default=MAX_GENERATIONS, help='generation limit of a case')
+    parser.add_argument('--output', help='path of a JSON report')
+    parser.add_argument('--baseline', default=BASELINE, help='path of a JSON report to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='store the report as the baseline')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='allowed slowdown against the baseline')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    sys.exit(main(parse(sys.argv[1:])))
@@ -1,7 +1,52 @@
-__all__ = ['Cell', 'originate_from', 'live', 'Universe', 'ClosedUniverse', 'WrappedUniverse']
+__all__ = [
+    'Batch', 'Census', 'Cell', 'CellPool', 'PooledCell', 'Changes',
+    'Rule', 'Dying', 'CONWAY', 'HIGHLIFE', 'DAY_AND_NIGHT', 'SEEDS', 'BRIANS_BRAIN',
+    'Driver', 'Frame', 'Subscription', 'Broadcaster', 'Recorder',
+    'CycleDetector', 'originate_from', 'originate_changes_from', 'originate_deltas_from', 'changes_between', 'live',
+    'advance',
+    'clusters_of', 'render', 'Soup', 'SoupSearch', 'SpatialIndex',
+    'View', 'TranslatedView', 'WindowView', 'WrappedView',
+    'Metrics', 'Monitor', 'Timings', 'CsvSink', 'Histogram', 'JsonLinesSink',
+    'Checkpoint', 'DeltaReader', 'DeltaWriter', 'load_checkpoint', 'save_checkpoint', 'read_plaintext', 'read_rle',
+    'write_plaintext', 'write_rle',
+    'Engine', 'ActiveEngine', 'BitPackedEngine', 'ChunkedEngine', 'DenseEngine', 'DoubleBufferedEngine',
+    'HashLifeEngine', 'ParallelEngine', 'ScanEngine',
+    'Universe', 'ClosedUniverse', 'WrappedUniverse', 'InfiniteUniverse', 'DenseUniverse', 'ClosedDenseUniverse',
+    'WrappedDenseUniverse',
+    'BitPackedUniverse', 'ClosedBitPackedUniverse', 'WrappedBitPackedUniverse',
+    'ChunkedUniverse', 'ClosedChunkedUniverse', 'WrappedChunkedUniverse'
+]
 
 
+from .batch import Batch
 from .cell import Cell
-from .life import originate_from, live
+from .census import Census, clusters_of
+from .cell_pool import CellPool, PooledCell
+from .consumers import Broadcaster, Recorder
+from .cycle_detector import CycleDetector
+from .driver import Driver
+from .changes import Changes, changes_between
+from .life import originate_from, originate_changes_from, originate_deltas_from, live
+from .engine import Engine, Timings
+from .monitor import Metrics, Monitor
+from .renderer import render
+from .soup_search import Soup, SoupSearch
+from .spatial_index import SpatialIndex
+from .formats import (
+    Checkpoint, DeltaReader, DeltaWriter, load_checkpoint, save_checkpoint, read_plaintext, read_rle, write_plaintext,
+    write_rle
+)
+from .rules import Rule, Dying, CONWAY, HIGHLIFE, DAY_AND_NIGHT, SEEDS, BRIANS_BRAIN
+from .engines import (
+    ActiveEngine, BitPackedEngine, ChunkedEngine, DenseEngine, DoubleBufferedEngine, HashLifeEngine, ParallelEngine,
+    ScanEngine, advance
+)
+from .sinks import CsvSink, Histogram, JsonLinesSink
+from .subscription import Frame, Subscription
 from .universe import Universe
-from .universes import ClosedUniverse, WrappedUniverse
+from .universes import (
+    ClosedUniverse, WrappedUniverse, InfiniteUniverse, DenseUniverse, ClosedDenseUniverse, WrappedDenseUniverse,
+    BitPackedUniverse, ClosedBitPackedUniverse, WrappedBitPackedUniverse,
+    ChunkedUniverse, ClosedChunkedUniverse, WrappedChunkedUniverse
+)
+from .views import View, TranslatedView, WindowView, WrappedView
@@ -0,0 +1,145 @@
+from typing import Any, Callable, Iterable, Type, TypeVar
+import numpy
+from .engines.dense_engine import padded_neighbour_counts, table_of
+from .rules import CONWAY, Rule, state_of
+from .universe import Universe
+from .universes.base_universe import BaseUniverse
+from .universes.wrapped_universe import WrappedUniverse
+
+
+T = TypeVar('T')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+
+class Batch():
+    """
+    Represents a batch of independent universes of the same size and topology that are stepped together.
+    States of all boards are stacked into a single (N, H, W) array, so a generation of the whole batch
+    is computed with a few vectorized operations instead of N Python generators.
+    A board is finished once it is extinct, stable or oscillates with a period of 2:
+    finished boards are not stepped any longer and can be replaced with new seeds in place.
+    """
+
+    def __init__(self, size: int, width: int, height: int, cls: Type[BaseUniverse]=WrappedUniverse,
+                 rule: Rule=CONWAY):
+        if size <= 0:
+            raise ValueError('size is zero or a negative number.')
+
+        if width <= 0:
+            raise ValueError('width is zero or a negative number.')
+
+        if height <= 0:
+            raise ValueError('height is zero or a negative number.')
+
+        self.cls = cls
+        self.rule = rule
+        self.wrapped = cls(1, 1).is_position_in_range(-1, -1)
+
+        self._states = numpy.zeros((size, height, width), dtype=numpy.uint8)
+        self._previous = numpy.zeros_like(self._states)
+        self._padded = numpy.zeros((size, height + 2, width + 2), dtype=numpy.uint8)
+
+        self.generations = numpy.zeros(size, dtype=numpy.int64)
+        self.finished = numpy.zeros(size, dtype=bool)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of boards."""
+        return self._states.shape[0]
+
+    @property
+    def width(self) -> int:
+        """Returns the width of boards."""
+        return self._states.shape[2]
+
+    @property
+    def height(self) -> int:
+        """Returns the height of boards."""
+        return self._states.shape[1]
+
+    @property
+    def population(self) -> numpy.ndarray:
+        """Returns the number of alive cells of every board."""
+        return numpy.count_nonzero(self._states == 1, axis=(1, 2))
+
+    def step(self):
+        """Advances every board that is not finished by one generation and updates termination flags."""
+        padded = self._padded
+        padded[:, 1:-1, 1:-1] = self._states == 1
+
+        if self.wrapped:
+            padded[:, 0, 1:-1] = padded[:, -2, 1:-1]
+            padded[:, -1, 1:-1] = padded[:, 1, 1:-1]
+            padded[:, :, 0] = padded[:, :, -2]
+            padded[:, :, -1] = padded[:, :, 1]
+
+        next_states = table_of(self.rule)[self._states, padded_neighbour_counts(padded)]
+
+        running = ~self.finished
+        stable = (next_states == self._states).all(axis=(1, 2))
+        oscillating = (next_states == self._previous).all(axis=(1, 2)) & (self.generations > 0)
+        extinct = ~next_states.any(axis=(1, 2))
+
+        self._previous[running] = self._states[running]
+        self._states[running] = next_states[running]
+        self.generations[running] += 1
+        self.finished |= running & (stable | oscillating | extinct)
+
+    def load(self, index: int, universe: Universe[Any]):
+        """Replaces the board at the index with states of the universe and resets its flags."""
+        if (universe.width, universe.height) != (self.width, self.height):
+            raise ValueError('universe is not of the size of the batch.')
+
+        states = self._states[index]
+        states.fill(0)
+
+        if isinstance(universe, BaseUniverse):
+            cells = universe._data.items()
+        else:
+            cells = ((position, universe[position]) for position in universe.alive())
+
+        for (x, y), cell in cells:
+            states[y, x] = state_of(cell)
+
+        self._previous[index] = 0
+        self.generations[index] = 0
+        self.finished[index] = False
+
+    def reseed(self, get_random: Callable[[], Any], indices: Iterable[int]=None) -> numpy.ndarray:
+        """
+        Replaces finished boards, or boards at the indices, with random universes from 'BaseUniverse.random'.
+        Returns indices of replaced boards.
+        """
+        indices = numpy.flatnonzero(self.finished) if indices is None else numpy.asarray(list(indices), dtype=int)
+
+        for index in indices:
+            self.load(index, self.cls.random(self.width, self.height, get_random))
+
+        return indices
+
+    def to_universe(self, index: int, regenerate: Callable[[], T]) -> UniverseType:
+        """Creates a universe of the class of the batch from the board at the index."""
+        states = self._states[index]
+        universe = self.cls(self.width, self.height)
+
+        for y, x in zip(*numpy.nonzero(states)):
+            state = int(states[y, x])
+            universe[int(x), int(y)] = regenerate() if state == 1 else self.rule.dying[state]
+
+        return universe
+
+    @classmethod
+    def from_universes(cls, universes: Iterable[Universe[Any]], rule: Rule=CONWAY) -> 'Batch':
+        """Creates a batch of universes of the same size and class."""
+        universes = list(universes)
+
+        if not universes:
+            raise ValueError('universes is empty.')
+
+        first = universes[0]
+        batch = cls(len(universes), first.width, first.height, type(first), rule)
+
+        for index, universe in enumerate(universes):
+            batch.load(index, universe)
+
+        return batch
@@ -6,15 +6,29 @@ CellType = TypeVar('CellType', bound='Cell')
 
 
 class Cell():
-    """Represents a cell of 'The Game of Life'."""
+    """
+    Represents a cell of 'The Game of Life'.
+    A cell has no state, so it has no '__dict__', and 'Cell.shared' can be used instead of 'Cell'
+    to make every alive cell the same flyweight instance. Cells with a state can be kept in a 'CellPool'.
+    """
+    __slots__ = ()
 
     def __str__(self) -> str:
         """Returns a string representation of the cell."""
         return '*'
 
+    @classmethod
+    def shared(cls) -> CellType:
+        """Returns the single shared instance of the cell class."""
+        instance = cls.__dict__.get('_instance')
+
+        if instance is None:
+            instance = cls()
+            setattr(cls, '_instance', instance)
+
+        return instance
+
     @classmethod
     def likely(cls) -> CellType:
         """Randomly creates a new cell or nothing."""
-        possible_cell = random.choice([cls(), None])
-
-        return possible_cell
+        return cls() if random.random() < .5 else None
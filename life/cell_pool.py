@@ -0,0 +1,107 @@
+from typing import Any
+import numpy
+from .universe import Universe
+
+
+INITIAL_CAPACITY = 1024
+
+
+class PooledCell(int):
+    """
+    Represents a cell whose state is stored in parallel arrays of a 'CellPool'.
+    The cell is a slotted integer index into the arrays, so it costs as much as an integer.
+    Indices start at 1, so every cell is truthy.
+    """
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        """Returns a string representation of the cell."""
+        return '*'
+
+    def __repr__(self) -> str:
+        """Returns a representation of the cell with its index."""
+        return 'PooledCell({})'.format(int(self))
+
+
+class CellPool():
+    """
+    Represents a pool of cells with a state, such as an age, a colour or a lineage,
+    that is stored in parallel NumPy arrays, one per field, instead of attributes of every cell.
+    Fields are read and written by cells: 'pool.age[cell] += 1', or in bulk by arrays of cells.
+    The pool can be passed as 'regenerate' to create cells. Indices of died cells are reused
+    after 'collect' is called with all universes whose cells are still in use.
+    """
+
+    def __init__(self, **fields: Any):
+        if not fields:
+            raise ValueError('fields are empty.')
+
+        self.fields = {name: numpy.dtype(dtype) for name, dtype in fields.items()}
+        self._arrays = {name: numpy.zeros(INITIAL_CAPACITY, dtype=dtype) for name, dtype in self.fields.items()}
+        self._capacity = INITIAL_CAPACITY
+        self._next = 1
+        self._free = []
+
+    def __getattr__(self, name: str) -> numpy.ndarray:
+        """Returns the array of the field, indexed by cells."""
+        arrays = self.__dict__.get('_arrays')
+
+        if arrays is None or name not in arrays:
+            raise AttributeError(name)
+
+        return arrays[name]
+
+    def __len__(self) -> int:
+        """Returns the number of cells in use."""
+        return self._next - 1 - len(self._free)
+
+    def __call__(self, **values: Any) -> PooledCell:
+        """Creates a cell with the specified values of fields, other fields are zero."""
+        if self._free:
+            index = self._free.pop()
+
+            for array in self._arrays.values():
+                array[index] = 0
+        else:
+            index = self._next
+            self._next += 1
+
+            if index >= self._capacity:
+                self._grow()
+
+        for name, value in values.items():
+            self._arrays[name][index] = value
+
+        return PooledCell(index)
+
+    def cells(self, universe: Universe[Any]) -> numpy.ndarray:
+        """Returns an array of pooled cells of the universe that can index field arrays in bulk."""
+        if hasattr(universe, '_data'):
+            cells = universe._data.values()
+        else:
+            cells = (universe[position] for position in universe.alive())
+
+        return numpy.fromiter((cell for cell in cells if isinstance(cell, PooledCell)), dtype=numpy.int64)
+
+    def collect(self, *universes: Universe[Any]) -> int:
+        """Frees cells that are not in any of the universes for reuse and returns the number of freed cells."""
+        used = numpy.zeros(self._next, dtype=bool)
+        used[0] = True
+
+        for universe in universes:
+            used[self.cells(universe)] = True
+
+        used[self._free] = True
+        freed = numpy.flatnonzero(~used)
+        self._free.extend(freed.tolist())
+
+        return len(freed)
+
+    def _grow(self):
+        """Doubles the capacity of the arrays."""
+        self._capacity *= 2
+
+        for name, array in self._arrays.items():
+            grown = numpy.zeros(self._capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            self._arrays[name] = grown
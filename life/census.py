@@ -0,0 +1,247 @@
+from collections import Counter
+from itertools import chain, islice
+from typing import Any, Iterable, List, Tuple
+from .life import originate_from
+from .rules import state_of
+from .universes.base_universe import BaseUniverse
+from .universes.infinite_universe import InfiniteUniverse
+from .universes.wrapped_universe import WrappedUniverse
+
+
+# A shape is the width and the height of a bounding box with a bit per position of the box, row by row.
+Shape = Tuple[int, int, int]
+
+# Still lifes, oscillators and spaceships that are common in the debris of random soups, with their periods.
+OBJECTS = (
+    ('block', 1, ('**', '**')),
+    ('beehive', 1, ('.**.', '*..*', '.**.')),
+    ('loaf', 1, ('.**.', '*..*', '.*.*', '..*.')),
+    ('boat', 1, ('**.', '*.*', '.*.')),
+    ('ship', 1, ('**.', '*.*', '.**')),
+    ('tub', 1, ('.*.', '*.*', '.*.')),
+    ('pond', 1, ('.**.', '*..*', '*..*', '.**.')),
+    ('long boat', 1, ('**..', '*.*.', '.*.*', '..*.')),
+    ('barge', 1, ('.*..', '*.*.', '.*.*', '..*.')),
+    ('mango', 1, ('.**..', '*..*.', '.*..*', '..**.')),
+    ('eater', 1, ('**..', '*.*.', '..*.', '..**')),
+    ('snake', 1, ('**.*', '*.**')),
+    ('aircraft carrier', 1, ('**..', '*..*', '..**')),
+    ('blinker', 2, ('***',)),
+    ('toad', 2, ('.***', '***.')),
+    ('beacon', 2, ('**..', '**..', '..**', '..**')),
+    ('glider', 4, ('.*.', '..*', '***')),
+    ('lightweight spaceship', 4, ('.*..*', '*....', '*...*', '****.')),
+    ('middleweight spaceship', 4, ('...*..', '.*...*', '*.....', '*....*', '*****.')),
+    ('heavyweight spaceship', 4, ('...**..', '.*....*', '*......', '*.....*', '******.'))
+)
+
+# Offsets of neighbours after a position, the rest of neighbours are found from the other side.
+FORWARD_OFFSETS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+# Offsets of positions after a position that are at most two cells away from it.
+NEARBY_OFFSETS = tuple((dx, dy) for dy in range(3) for dx in range(-2, 3) if dy > 0 or dx > 0)
+
+# Rotations and reflections of a position.
+TRANSFORMS = (
+    lambda x, y: (x, y), lambda x, y: (-x, y), lambda x, y: (x, -y), lambda x, y: (-x, -y),
+    lambda x, y: (y, x), lambda x, y: (-y, x), lambda x, y: (y, -x), lambda x, y: (-y, -x)
+)
+
+MEMO_SIZE = 1 << 16
+
+
+class Census():
+    """
+    Represents a census of objects in universes, such as the stable debris of random soups.
+    Alive cells are split into clusters of touching cells, and every cluster is canonicalized
+    under rotations and reflections and looked up in the table of known objects.
+    Names of shapes are memoized as they are found on the board, so a repeated shape costs a hash lookup
+    and is canonicalized only once. Unknown objects are named by rows of their canonical form.
+    """
+
+    def __init__(self, objects: Iterable[Tuple[str, int, Iterable[str]]]=OBJECTS, memo_size: int=MEMO_SIZE):
+        if memo_size <= 0:
+            raise ValueError('memo_size is zero or a negative number.')
+
+        self.known = dict()
+        self.memo_size = memo_size
+        self._memo = dict()
+
+        for name, period, rows in objects:
+            for positions in phases_of(rows, period):
+                self.known[canonical(shape_of(positions))] = name
+
+        self.names = set(self.known.values())
+
+    def __call__(self, universe: BaseUniverse[Any]) -> Counter:
+        """Returns numbers of objects of the universe by their names."""
+        return Counter(name for name, _ in self.objects(universe))
+
+    def objects(self, universe: BaseUniverse[Any]) -> List[Tuple[str, List[Tuple[int, int]]]]:
+        """Returns objects of the universe as their names with positions of their cells."""
+        size = (universe.width, universe.height) if isinstance(universe, WrappedUniverse) else ()
+        objects, pieces = [], []
+
+        for positions in clusters_of(universe):
+            name = self.classify(positions)
+
+            if name in self.names:
+                objects.append((name, positions))
+            else:
+                pieces += positions
+
+        # Some objects, such as the aircraft carrier or a phase of the beacon, are made of pieces that do not touch,
+        # so unknown pieces that are close are classified together and apart if that does not help.
+        if size:
+            pieces = [(x % size[0], y % size[1]) for x, y in pieces]
+
+        for group in clusters_of_positions(pieces, NEARBY_OFFSETS, *size):
+            group = unwrapped(group, *size) if size else group
+            name = self.classify(group)
+
+            if name in self.names:
+                objects.append((name, group))
+            else:
+                objects += [(self.classify(positions), positions) for positions in clusters_of_positions(group)]
+
+        return objects
+
+    def classify(self, positions: Iterable[Tuple[int, int]]) -> str:
+        """Returns the name of the object at the positions."""
+        shape = shape_of(positions)
+        name = self._memo.get(shape)
+
+        if name is None:
+            form = canonical(shape)
+            name = self.known.get(form) or code_of(form)
+
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+
+            self._memo[shape] = name
+
+        return name
+
+
+def clusters_of(universe: BaseUniverse[Any]) -> List[List[Tuple[int, int]]]:
+    """
+    Returns positions of alive cells of the universe split into clusters of touching cells.
+    Clusters that cross edges of a wrapped universe are unwrapped, so they have adjacent positions.
+    """
+    alive = [position for position, cell in universe._data.items() if state_of(cell) == 1]
+
+    if not isinstance(universe, WrappedUniverse):
+        return clusters_of_positions(alive)
+
+    width, height = universe.width, universe.height
+    clusters = clusters_of_positions(alive, FORWARD_OFFSETS, width, height)
+
+    return [unwrapped(positions, width, height) for positions in clusters]
+
+
+def clusters_of_positions(positions: List[Tuple[int, int]],
+                          offsets: Iterable[Tuple[int, int]]=FORWARD_OFFSETS, width: int=None,
+                          height: int=None) -> List[List[Tuple[int, int]]]:
+    """
+    Returns the positions split into clusters of connected positions with a union-find:
+    a position is connected to positions at the offsets from it, touching positions by default.
+    With a width and a height, positions wrap around edges of the rectangle.
+    """
+    indices = {position: index for index, position in enumerate(positions)}
+    parents = list(range(len(positions)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+
+        return index
+
+    for index, (x, y) in enumerate(positions):
+        for dx, dy in offsets:
+            neighbour = (x + dx, y + dy) if width is None else ((x + dx) % width, (y + dy) % height)
+            other = indices.get(neighbour)
+
+            if other is not None:
+                root, other_root = find(index), find(other)
+
+                if root != other_root:
+                    parents[other_root] = root
+
+    clusters = dict()
+
+    for index, position in enumerate(positions):
+        clusters.setdefault(find(index), []).append(position)
+
+    return list(clusters.values())
+
+
+def unwrapped(positions: List[Tuple[int, int]], width: int, height: int) -> List[Tuple[int, int]]:
+    """Returns positions of a cluster shifted past edges of a wrapped universe, so the cluster is contiguous."""
+    start_x = seam_of([x for x, _ in positions], width)
+    start_y = seam_of([y for _, y in positions], height)
+
+    if not start_x and not start_y:
+        return positions
+
+    return [(x + width if x < start_x else x, y + height if y < start_y else y) for x, y in positions]
+
+
+def seam_of(coordinates: List[int], size: int) -> int:
+    """
+    Returns the coordinate that starts a cluster along a wrapped axis: the first one after the largest gap,
+    or 0 if the cluster does not cross the edge.
+    """
+    occupied = sorted(set(coordinates))
+
+    if occupied[0] != 0 or occupied[-1] != size - 1:
+        return 0
+
+    gap, start = max((next_coordinate - coordinate, next_coordinate)
+                     for coordinate, next_coordinate in zip(occupied, occupied[1:] + [occupied[0] + size]))
+
+    return start % size if gap > 1 else 0
+
+
+def shape_of(positions: Iterable[Tuple[int, int]]) -> Shape:
+    """Returns the shape of positions regardless of where they are."""
+    xs, ys = zip(*positions)
+    left, top = min(xs), min(ys)
+    width = max(xs) - left + 1
+
+    mask = 0
+
+    for x, y in zip(xs, ys):
+        mask |= 1 << ((y - top) * width + x - left)
+
+    return width, max(ys) - top + 1, mask
+
+
+def canonical(shape: Shape) -> Shape:
+    """Returns the least of shapes of all rotations and reflections of the shape."""
+    width, height, mask = shape
+    positions = [(index % width, index // width) for index in range(width * height) if mask >> index & 1]
+
+    return min(shape_of([transform(x, y) for x, y in positions]) for transform in TRANSFORMS)
+
+
+def code_of(shape: Shape) -> str:
+    """Returns rows of the shape with '*' for alive cells and '.' for dead ones separated by '/'."""
+    width, height, mask = shape
+
+    return '/'.join(''.join('*' if mask >> (y * width + x) & 1 else '.' for x in range(width))
+                    for y in range(height))
+
+
+def phases_of(rows: Iterable[str], period: int) -> List[List[Tuple[int, int]]]:
+    """Returns positions of alive cells of every phase of an object drawn by rows."""
+    universe = InfiniteUniverse()
+
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char == '*':
+                universe[x, y] = True
+
+    universes = chain([universe], originate_from(universe, lambda: True))
+
+    return [list(phase.alive()) for phase in islice(universes, period)]
@@ -0,0 +1,38 @@
+from typing import Any, Dict, Iterable, NamedTuple, Set, Tuple
+from .rules import state_of
+from .universe import Universe
+
+
+Changes = NamedTuple('Changes', [
+    ('born', Set[Tuple[int, int]]),
+    ('died', Set[Tuple[int, int]]),
+    ('changed', Set[Tuple[int, int]])
+])
+
+# Cells of two-state rules never change their state, so changes of them are empty by default.
+Changes.__new__.__defaults__ = (frozenset(),)
+
+
+def changes_between(universe: Universe[Any], next_universe: Universe[Any]) -> Changes:
+    """
+    Returns positions of cells that were born or died between two universe states
+    and positions of cells that are in both states but changed their state, such as dying cells of 'Generations'.
+    It compares whole states, so it costs O(population) and is used only for engines that do not report transitions.
+    """
+    alive = set(universe.alive())
+    next_alive = set(next_universe.alive())
+    changed = {position for position in alive & next_alive
+               if state_of(universe[position]) != state_of(next_universe[position])}
+
+    return Changes(born=next_alive - alive, died=alive - next_alive, changed=changed)
+
+
+def changes_of(data: Dict[Tuple[int, int], Any], born: Dict[Tuple[int, int], Any],
+               died: Iterable[Tuple[int, int]]) -> Changes:
+    """
+    Returns changes of transitions of an engine from occupied positions:
+    a cell written over an occupied position changed its state, otherwise it was born.
+    It costs O(transitions) instead of comparing universe states.
+    """
+    return Changes(born={position for position in born if position not in data}, died=set(died),
+                   changed={position for position in born if position in data})
@@ -0,0 +1,5 @@
+__all__ = ['Broadcaster', 'Recorder']
+
+
+from .broadcaster import Broadcaster
+from .recorder import Recorder
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any
+from ..driver import Driver
+from .recorder import to_json
+
+
+class Broadcaster():
+    """
+    Represents a consumer that serves frames of a driver to viewers over a local socket in JSON lines format.
+    Every viewer gets its own subscription: the first frame holds all alive cells,
+    and a viewer that reads slowly gets coalesced changes instead of holding back the simulation.
+    """
+
+    def __init__(self, driver: Driver, maxsize: int=1, frames_per_second: float=None):
+        self.driver = driver
+        self.maxsize = maxsize
+        self.frames_per_second = frames_per_second
+        self._server = None
+
+    async def serve(self, host: str='127.0.0.1', port: int=0) -> Any:
+        """Starts serving viewers and returns the server, 'port' 0 picks a free port."""
+        self._server = await asyncio.start_server(self._serve_viewer, host, port)
+
+        return self._server
+
+    async def _serve_viewer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Writes frames to a viewer until the simulation ends or the viewer disconnects."""
+        subscription = self.driver.subscribe(self.maxsize, 'coalesce', self.frames_per_second)
+
+        try:
+            async for frame in subscription:
+                writer.write((to_json(frame) + '\n').encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.driver.unsubscribe(subscription)
+            writer.close()
+
+    def close(self):
+        """Stops accepting viewers."""
+        if self._server is not None:
+            self._server.close()
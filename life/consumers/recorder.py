@@ -0,0 +1,26 @@
+import json
+from typing import IO
+from ..subscription import Frame, Subscription
+
+
+class Recorder():
+    """
+    Represents a consumer that writes frames of a subscription to a file in JSON lines format,
+    one object with the generation and sorted positions of born and died cells per frame.
+    """
+
+    def __init__(self, file: IO[str]):
+        self._file = file
+
+    async def __call__(self, subscription: Subscription):
+        """Writes frames until the subscription is closed."""
+        async for frame in subscription:
+            self._file.write(to_json(frame) + '\n')
+
+        self._file.flush()
+
+
+def to_json(frame: Frame) -> str:
+    """Returns a JSON representation of changes of a frame."""
+    return json.dumps(dict(generation=frame.generation, born=sorted(frame.changes.born),
+                           died=sorted(frame.changes.died)))
@@ -0,0 +1,122 @@
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List, Tuple
+from .changes import Changes
+from .rules import state_of
+from .universe import Universe
+from .universes.base_universe import BaseUniverse
+
+
+MASK = (1 << 64) - 1
+
+# A change of a position from a state to the next state, where 0 stands for an empty position.
+Change = Tuple[Tuple[int, int], int, int]
+
+
+class CycleDetector():
+    """
+    Detects that universe states repeat, which means the universe is a still life or an oscillator.
+    Every state is hashed with Zobrist hashing: the hash is a XOR of a key per occupied position and cell state,
+    so it is updated incrementally with changes reported by the engine in O(changes) per generation.
+    The last 'history' hashes are kept with generations when they were seen, so cycles with a period
+    up to 'history' are detected. Changes of the last 'history' generations are kept as well,
+    so a hash that was seen before is confirmed by replaying changes since then: a collision is never reported.
+    """
+
+    def __init__(self, history: int=1024):
+        if history <= 0:
+            raise ValueError('history is zero or a negative number.')
+
+        self.history = history
+        self.generation = -1
+        self.hash = 0
+        self.period = None
+        self.start = None
+        self._states = dict()
+        self._seen = dict()
+        self._order = deque()
+        self._log = deque(maxlen=history)
+
+    def observe(self, universe: Universe[Any], changes: Changes=None) -> bool:
+        """
+        Records the next universe state, starting from generation 0.
+        With changes since the last observed state, only changed positions are visited,
+        otherwise the whole state is compared with the last one.
+        Returns 'True' once the state has been seen before: 'period' and 'start' tell when the cycle starts.
+        """
+        log = self._changes_of(universe, changes)
+
+        for (x, y), state, next_state in log:
+            self.hash ^= zobrist(x, y, state) ^ zobrist(x, y, next_state)
+
+            if next_state:
+                self._states[x, y] = next_state
+            else:
+                del self._states[x, y]
+
+        self._log.append(log)
+        self.generation += 1
+
+        start = self._seen.get(self.hash, None)
+
+        if start is not None and self._repeats(self.generation - start):
+            self.start = start
+            self.period = self.generation - start
+            return True
+
+        # A colliding hash keeps the generation it was first seen in.
+        if start is None:
+            self._seen[self.hash] = self.generation
+            self._order.append(self.hash)
+
+        if len(self._order) > self.history:
+            del self._seen[self._order.popleft()]
+
+        return False
+
+    def _changes_of(self, universe: Universe[Any], changes: Changes=None) -> List[Change]:
+        """Returns changes of positions between the last observed state and the universe."""
+        states = self._states
+
+        if changes is None:
+            next_states = states_of(universe)
+
+            return [(position, states.get(position, 0), next_states.get(position, 0))
+                    for position in states.keys() | next_states.keys()
+                    if states.get(position, 0) != next_states.get(position, 0)]
+
+        log = [(position, 0, state_of(universe[position])) for position in changes.born]
+        log += [(position, states[position], 0) for position in changes.died]
+        log += [(position, states[position], state_of(universe[position])) for position in changes.changed]
+
+        return log
+
+    def _repeats(self, period: int) -> bool:
+        """Returns whether changes of the last generations of the period cancel out, so the state repeats."""
+        net = dict()
+
+        for log in islice(reversed(self._log), period):
+            for position, state, next_state in log:
+                net[position] = (state, net[position][1] if position in net else next_state)
+
+        return all(state == next_state for state, next_state in net.values())
+
+
+def states_of(universe: Universe[Any]) -> Dict[Tuple[int, int], int]:
+    """Returns states of cells by occupied positions."""
+    if isinstance(universe, BaseUniverse):
+        return {position: state_of(cell) for position, cell in universe._data.items()}
+
+    return dict.fromkeys(universe.alive(), 1)
+
+
+def zobrist(x: int, y: int, state: int) -> int:
+    """Returns a pseudo-random 64-bit key of the position and the state, or 0 for an empty position."""
+    if not state:
+        return 0
+
+    key = (x * 0x9E3779B97F4A7C15 + y * 0xC2B2AE3D27D4EB4F + state * 0x165667B19E3779F9) & MASK
+    key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & MASK
+
+    return key ^ (key >> 31)
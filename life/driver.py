@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable
+from .changes import Changes
+from .cycle_detector import CycleDetector
+from .engine import Engine
+from .life import originate_changes_from
+from .rules import CONWAY, Rule
+from .subscription import Frame, Subscription
+from .universe import Universe
+
+
+class Driver():
+    """
+    Represents an asynchronous driver of a simulation that publishes generations to several consumers.
+    Generations are computed in an executor, so a slow step never stalls input, rendering or network I/O
+    running on the event loop. Every consumer reads frames from its own bounded subscription,
+    so a slow consumer only loses or coalesces its own frames and never holds back the others,
+    unless it subscribes with the 'block' policy.
+    The step rate is limited by steps per second, and it is unlimited by default.
+    """
+
+    def __init__(self, universe: Universe[Any], regenerate: Callable[[], Any], engine: Engine=None,
+                 rule: Rule=CONWAY, detector: CycleDetector=None, steps_per_second: float=None,
+                 executor: Executor=None):
+        if steps_per_second is not None and steps_per_second <= 0:
+            raise ValueError('steps_per_second is zero or a negative number.')
+
+        self.universe = universe
+        self.generation = 0
+        self.steps_per_second = steps_per_second
+        self.subscriptions = list()
+        self._life = originate_changes_from(universe, regenerate, engine, rule, detector)
+        self._executor = executor
+        self._running = False
+
+    def subscribe(self, maxsize: int=1, policy: str='coalesce', frames_per_second: float=None) -> Subscription:
+        """
+        Returns a new subscription to generations.
+        The first frame of a subscription holds all alive cells of the current generation as born.
+        """
+        subscription = Subscription(maxsize, policy, frames_per_second)
+        subscription.put_nowait(Frame(self.generation, self.universe, Changes(born=set(self.universe.alive()),
+                                                                              died=set())))
+
+        self.subscriptions.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Closes the subscription and stops publishing to it."""
+        subscription.close()
+
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+
+    async def run(self, generations: int=None):
+        """
+        Steps the simulation and publishes every generation until it is stopped, the number of generations
+        is reached or the cycle detector finds a cycle. Subscriptions are closed once the simulation ends.
+        """
+        loop = asyncio.get_event_loop()
+        interval = 1 / self.steps_per_second if self.steps_per_second else 0
+        self._running = True
+
+        try:
+            while self._running and (generations is None or generations > 0):
+                start = loop.time()
+                result = await loop.run_in_executor(self._executor, next, self._life, None)
+
+                if result is None:
+                    break
+
+                self.universe, changes = result
+                self.generation += 1
+                frame = Frame(self.generation, self.universe, changes)
+
+                for subscription in list(self.subscriptions):
+                    await subscription.put(frame)
+
+                if generations is not None:
+                    generations -= 1
+
+                # The step interval includes the time spent on the step, so the rate does not drift.
+                await asyncio.sleep(max(0, interval - (loop.time() - start)))
+        finally:
+            self._running = False
+
+            for subscription in self.subscriptions:
+                subscription.close()
+
+    def stop(self):
+        """Stops the simulation after the current step."""
+        self._running = False
@@ -0,0 +1,44 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, NamedTuple, Tuple
+from .changes import Changes, changes_between
+from .rules import CONWAY, Rule
+from .universe import Universe
+
+
+Timings = NamedTuple('Timings', [('counting', float), ('evaluating', float), ('copying', float)])
+
+
+class Engine():
+    """Represents a stepping engine of 'The Game of Life'."""
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def step(self, universe: Universe[Any], regenerate: Callable[[], Any], rule: Rule=CONWAY) -> Universe[Any]:
+        """Returns the next generation of the universe under the rule."""
+        pass
+
+    def timed_step(self, universe: Universe[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[Universe[Any], Timings]:
+        """
+        Returns the next generation of the universe along with seconds spent in counting neighbours,
+        evaluating the rule and copying the universe. Phases that an engine does not separate are 'None'.
+        """
+        return self.step(universe, regenerate, rule), Timings(None, None, None)
+
+    def transition(self, universe: Universe[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[Universe[Any], Changes]:
+        """
+        Returns the next generation of the universe along with positions of cells that were born, died
+        or changed their state. Engines that know transitions of a step report them,
+        others compare the universe states.
+        """
+        next_universe = self.step(universe, regenerate, rule)
+
+        return next_universe, changes_between(universe, next_universe)
+
+    def timed_transition(self, universe: Universe[Any], regenerate: Callable[[], Any],
+                         rule: Rule=CONWAY) -> Tuple[Universe[Any], Changes, Timings]:
+        """Returns the next generation of the universe along with its changes and seconds spent in phases."""
+        next_universe, timings = self.timed_step(universe, regenerate, rule)
+
+        return next_universe, changes_between(universe, next_universe), timings
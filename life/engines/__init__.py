@@ -0,0 +1,14 @@
+__all__ = [
+    'ActiveEngine', 'BitPackedEngine', 'ChunkedEngine', 'DenseEngine', 'DoubleBufferedEngine', 'HashLifeEngine',
+    'ParallelEngine', 'ScanEngine', 'advance'
+]
+
+
+from .active_engine import ActiveEngine
+from .bit_packed_engine import BitPackedEngine
+from .chunked_engine import ChunkedEngine
+from .dense_engine import DenseEngine
+from .double_buffered_engine import DoubleBufferedEngine
+from .hashlife_engine import HashLifeEngine, advance
+from .parallel_engine import ParallelEngine
+from .scan_engine import ScanEngine
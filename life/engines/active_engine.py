@@ -0,0 +1,132 @@
+import time
+from collections import Counter
+from copy import copy
+from typing import Any, Callable, Dict, List, Tuple
+from ..changes import Changes, changes_of
+from ..engine import Engine, Timings
+from ..rules import CONWAY, Dying, Rule
+from ..universes.base_universe import BaseUniverse
+
+
+class ActiveEngine(Engine):
+    """
+    Represents an engine that visits only alive cells and their neighbours on each generation.
+    A generation costs O(population) instead of O(width x height) since dead regions are never visited.
+    Rules that bring cells to life without alive neighbours (B0) cannot be handled.
+    """
+
+    def step(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> BaseUniverse[Any]:
+        """Returns the next generation of the universe under the rule."""
+        next_universe = copy(universe)
+
+        apply_transitions(next_universe, *transitions(universe, regenerate, rule))
+
+        return next_universe
+
+    def transition(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[BaseUniverse[Any], Changes]:
+        """Returns the next generation of the universe along with changes of its transitions."""
+        born, died = transitions(universe, regenerate, rule)
+        changes = changes_of(universe._data, born, died)
+
+        next_universe = copy(universe)
+        apply_transitions(next_universe, born, died)
+
+        return next_universe, changes
+
+    def timed_step(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[BaseUniverse[Any], Timings]:
+        """Returns the next generation of the universe along with seconds spent in phases of the step."""
+        next_universe, _, timings = self.timed_transition(universe, regenerate, rule)
+
+        return next_universe, timings
+
+    def timed_transition(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                         rule: Rule=CONWAY) -> Tuple[BaseUniverse[Any], Changes, Timings]:
+        """Returns the next generation of the universe along with its changes and seconds spent in phases."""
+        start = time.perf_counter()
+        counts = count_neighbours(universe, rule)
+        counted = time.perf_counter()
+        born, died = evaluate(universe, counts, regenerate, rule)
+        evaluated = time.perf_counter()
+
+        changes = changes_of(universe._data, born, died)
+        next_universe = copy(universe)
+        apply_transitions(next_universe, born, died)
+
+        return next_universe, changes, Timings(counted - start, evaluated - counted,
+                                               time.perf_counter() - evaluated)
+
+
+def transitions(universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                rule: Rule=CONWAY) -> Tuple[Dict[Tuple[int, int], Any], List[Tuple[int, int]]]:
+    """
+    Returns cells that were born or changed their state by their positions
+    and positions of died cells for the next generation of the universe.
+    """
+    return evaluate(universe, count_neighbours(universe, rule), regenerate, rule)
+
+
+def count_neighbours(universe: BaseUniverse[Any], rule: Rule=CONWAY) -> Counter:
+    """Returns numbers of alive neighbours by positions that have at least one alive neighbour."""
+    if 0 in rule.birth:
+        raise ValueError('rule {} brings cells to life without alive neighbours.'.format(rule))
+
+    data = universe._data
+    alive = data if rule.states == 2 else [position for position, cell in data.items() if not isinstance(cell, Dying)]
+
+    return universe.neighbour_counts(alive)
+
+
+def evaluate(universe: BaseUniverse[Any], counts: Counter, regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> Tuple[Dict[Tuple[int, int], Any], List[Tuple[int, int]]]:
+    """Applies the rule to occupied positions and positions with alive neighbours and returns transitions."""
+    data = universe._data
+    born = dict()
+    died = []
+
+    # Cells without alive neighbours are not counted at all.
+    for position, cell in data.items():
+        if position not in counts:
+            next_cell = rule.apply(cell, 0, regenerate)
+
+            if next_cell is None:
+                died.append(position)
+            elif next_cell is not cell:
+                born[position] = next_cell
+
+    for position, count in counts.items():
+        cell = data.get(position, None)
+        next_cell = rule.apply(cell, count, regenerate)
+
+        if next_cell is cell:
+            continue
+
+        if next_cell is None:
+            died.append(position)
+        else:
+            born[position] = next_cell
+
+    return born, died
+
+
+def apply_transitions(universe: BaseUniverse[Any], born: Dict[Tuple[int, int], Any], died: List[Tuple[int, int]]):
+    """
+    Writes born and died cells to the universe. Positions of transitions are already adjusted,
+    so they are written to the data directly unless the universe keeps more than its data in sync.
+    """
+    if type(universe).__setitem__ is not BaseUniverse.__setitem__ or universe._index is not None:
+        for position in died:
+            universe[position] = None
+
+        for position, cell in born.items():
+            universe[position] = cell
+        return
+
+    data = universe._data
+
+    for position in died:
+        del data[position]
+
+    data.update(born)
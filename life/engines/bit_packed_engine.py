@@ -0,0 +1,120 @@
+import time
+from typing import Any, Callable, List, Tuple
+from ..engine import Engine, Timings
+from ..rules import CONWAY, Rule
+from ..universes.bit_packed_universe import BitPackedUniverse
+
+
+class BitPackedEngine(Engine):
+    """
+    Represents an engine that computes a generation of a bit-packed universe with word-parallel bitwise logic.
+    Neighbours of a whole row are added up at once into bit planes of a 4-bit counter using half adders.
+    Since no cell objects are kept, 'regenerate' is never called and only two-state rules are supported.
+    """
+
+    def step(self, universe: BitPackedUniverse, regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> BitPackedUniverse:
+        """Returns the next generation of the universe under the rule."""
+        if rule.states > 2:
+            raise ValueError('rule {} has more than two states.'.format(rule))
+
+        return evaluate(universe, count_rows(universe), rule)
+
+    def timed_step(self, universe: BitPackedUniverse, regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[BitPackedUniverse, Timings]:
+        """
+        Returns the next generation of the universe along with seconds spent in phases of the step.
+        Rows of the next generation are built from scratch, so nothing is copied.
+        """
+        if rule.states > 2:
+            raise ValueError('rule {} has more than two states.'.format(rule))
+
+        start = time.perf_counter()
+        planes = count_rows(universe)
+        counted = time.perf_counter()
+        next_universe = evaluate(universe, planes, rule)
+
+        return next_universe, Timings(counted - start, time.perf_counter() - counted, 0.0)
+
+
+def count_rows(universe: BitPackedUniverse) -> List[List[int]]:
+    """Returns bit planes of numbers of alive neighbours for every row of the universe."""
+    width, height = universe.width, universe.height
+    mask = (1 << width) - 1
+    rows = universe._rows
+
+    if universe.wrapped:
+        wests = [((row << 1) | (row >> (width - 1))) & mask for row in rows]
+        easts = [(row >> 1) | ((row & 1) << (width - 1)) for row in rows]
+    else:
+        wests = [(row << 1) & mask for row in rows]
+        easts = [row >> 1 for row in rows]
+
+    planes = []
+
+    for y in range(height):
+        neighbours = [wests[y], easts[y]]
+
+        for ny in (y - 1, y + 1):
+            if universe.wrapped or 0 <= ny < height:
+                ny %= height
+                neighbours += [rows[ny], wests[ny], easts[ny]]
+
+        planes.append(count_planes(neighbours))
+
+    return planes
+
+
+def evaluate(universe: BitPackedUniverse, planes: List[List[int]], rule: Rule=CONWAY) -> BitPackedUniverse:
+    """Returns the next generation of the universe from bit planes of its rows under the rule."""
+    mask = (1 << universe.width) - 1
+    rows = universe._rows
+
+    next_universe = type(universe)(universe.width, universe.height)
+    next_rows = next_universe._rows
+
+    for y, (b0, b1, b2, b3) in enumerate(planes):
+        if rule == CONWAY:
+            # 2 or 3 neighbours keep an alive cell, exactly 3 neighbours bring a dead cell to life.
+            next_rows[y] = b1 & ~b2 & ~b3 & (b0 | rows[y])
+            continue
+
+        row = rows[y]
+        next_row = 0
+
+        for count in rule.birth:
+            next_row |= equal_to((b0, b1, b2, b3), count, mask) & ~row
+
+        for count in rule.survival:
+            next_row |= equal_to((b0, b1, b2, b3), count, mask) & row
+
+        next_rows[y] = next_row
+
+    return next_universe
+
+
+def equal_to(planes: Tuple[int, ...], count: int, mask: int) -> int:
+    """Returns a row with bits set where the bit planes hold the count."""
+    row = mask
+
+    for i, plane in enumerate(planes):
+        row &= plane if count >> i & 1 else ~plane
+
+    return row
+
+
+def count_planes(neighbours: List[int]) -> List[int]:
+    """
+    Adds up neighbour rows bit by bit and returns 4 bit planes of the counts.
+    Bit x of plane i is bit i of the number of alive neighbours at x.
+    """
+    planes = [0, 0, 0, 0]
+
+    for carry in neighbours:
+        for i in range(4):
+            if not carry:
+                break
+
+            planes[i], carry = planes[i] ^ carry, planes[i] & carry
+
+    return planes
@@ -0,0 +1,66 @@
+from copy import copy
+from typing import Any, Callable
+import numpy
+from ..engine import Engine
+from ..rules import CONWAY, Rule
+from ..universes.chunked_universe import ChunkedUniverse
+from .dense_engine import padded_neighbour_counts, table_of, write_changes
+
+
+# Directions of neighbouring chunks with the part of a chunk that lies in their halo.
+HALOS = (
+    (0, -1, (0, slice(None))), (0, 1, (-1, slice(None))),
+    (-1, 0, (slice(None), 0)), (1, 0, (slice(None), -1)),
+    (-1, -1, (0, 0)), (1, -1, (0, -1)), (-1, 1, (-1, 0)), (1, 1, (-1, -1))
+)
+
+
+class ChunkedEngine(Engine):
+    """
+    Represents an engine that computes only awake chunks of a chunked universe with vectorized NumPy operations.
+    A chunk that did not change falls asleep, and it is skipped until a change reaches it:
+    either a change in the chunk itself or a change on the border of a neighbouring chunk.
+    A generation of a board of stable debris with a few active areas costs only as much as the active areas.
+    Rules that bring cells to life without alive neighbours (B0) cannot be handled, since empty chunks sleep.
+    """
+
+    def step(self, universe: ChunkedUniverse[Any], regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> ChunkedUniverse[Any]:
+        """Returns the next generation of the universe under the rule."""
+        if 0 in rule.birth:
+            raise ValueError('rule {} brings cells to life without alive neighbours.'.format(rule))
+
+        size = universe.chunk_size
+        table = table_of(rule)
+
+        next_universe = copy(universe)
+        next_universe._awake = set()
+
+        for cx, cy in universe._awake:
+            padded = universe.padded_chunk(cx, cy)
+            states = padded[1:-1, 1:-1]
+            next_states = table[states, padded_neighbour_counts((padded == 1).view(numpy.uint8))]
+
+            changed = states != next_states
+
+            if not changed.any():
+                continue
+
+            write_changes(next_universe._data, states, next_states, regenerate, rule, cx * size, cy * size)
+
+            if next_states.any():
+                next_universe._chunks[cx, cy] = next_states
+                next_universe._owned.add((cx, cy))
+            else:
+                next_universe._chunks.pop((cx, cy), None)
+
+            next_universe._awake.add((cx, cy))
+
+            for dx, dy, halo in HALOS:
+                if changed[halo].any():
+                    chunk = universe.neighbour_chunk(cx, cy, dx, dy)
+
+                    if chunk is not None:
+                        next_universe._awake.add(chunk)
+
+        return next_universe
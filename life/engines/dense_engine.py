@@ -0,0 +1,103 @@
+import time
+from copy import copy
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+import numpy
+from ..engine import Engine, Timings
+from ..rules import CONWAY, Rule
+from ..universes.dense_universe import DenseUniverse
+
+
+OFFSETS = ((-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0))
+
+
+class DenseEngine(Engine):
+    """
+    Represents an engine that computes a generation of a dense universe with vectorized NumPy operations.
+    Neighbours are counted by summing shifted views of the padded array of alive cells,
+    and next states are looked up in the table of the rule for all cells at once.
+    Only changed cells are written back to the side table of cells.
+    """
+
+    def step(self, universe: DenseUniverse[Any], regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> DenseUniverse[Any]:
+        """Returns the next generation of the universe under the rule."""
+        states = universe._states
+        counts = neighbour_counts((states == 1).view(numpy.uint8), universe.padding)
+
+        next_states = table_of(rule)[states, counts]
+
+        next_universe = copy(universe)
+        next_universe._states = next_states
+
+        write_changes(next_universe._data, states, next_states, regenerate, rule)
+
+        return next_universe
+
+    def timed_step(self, universe: DenseUniverse[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[DenseUniverse[Any], Timings]:
+        """Returns the next generation of the universe along with seconds spent in phases of the step."""
+        start = time.perf_counter()
+        states = universe._states
+        counts = neighbour_counts((states == 1).view(numpy.uint8), universe.padding)
+        counted = time.perf_counter()
+
+        next_states = table_of(rule)[states, counts]
+        evaluated = time.perf_counter()
+
+        next_universe = copy(universe)
+        next_universe._states = next_states
+
+        write_changes(next_universe._data, states, next_states, regenerate, rule)
+
+        return next_universe, Timings(counted - start, evaluated - counted, time.perf_counter() - evaluated)
+
+
+@lru_cache(maxsize=None)
+def table_of(rule: Rule) -> numpy.ndarray:
+    """Returns the lookup table of the rule as an array indexed by a state and a number of alive neighbours."""
+    return numpy.array(rule.table, dtype=numpy.uint8)
+
+
+def write_changes(data: Dict[Tuple[int, int], Any], states: numpy.ndarray, next_states: numpy.ndarray,
+                  regenerate: Callable[[], Any], rule: Rule=CONWAY, left: int=0, top: int=0):
+    """
+    Removes died cells from the side table of cells, adds a new cell for every born one
+    and a dying cell for every dying one. Arrays of states may be a region at (left, top).
+    """
+    changed_y, changed_x = numpy.nonzero(states != next_states)
+    changed_states = next_states[changed_y, changed_x]
+    changed_x, changed_y = changed_x + left, changed_y + top
+
+    for position in zip(changed_x[changed_states == 0].tolist(), changed_y[changed_states == 0].tolist()):
+        del data[position]
+
+    born = changed_states == 1
+    cells = [regenerate() for _ in range(numpy.count_nonzero(born))]
+    data.update(zip(zip(changed_x[born].tolist(), changed_y[born].tolist()), cells))
+
+    if rule.states > 2:
+        dying = changed_states > 1
+
+        cells = [rule.dying[state] for state in changed_states[dying].tolist()]
+        data.update(zip(zip(changed_x[dying].tolist(), changed_y[dying].tolist()), cells))
+
+
+def neighbour_counts(alive: numpy.ndarray, padding: str) -> numpy.ndarray:
+    """Returns the number of alive neighbours for every position of the array of alive cells."""
+    return padded_neighbour_counts(numpy.pad(alive, 1, mode=padding))
+
+
+def padded_neighbour_counts(padded: numpy.ndarray) -> numpy.ndarray:
+    """
+    Returns the number of alive neighbours for every position inside the one-cell border of alive cells.
+    Leading dimensions, such as boards of a batch, are counted independently.
+    """
+    height, width = padded.shape[-2] - 2, padded.shape[-1] - 2
+
+    counts = numpy.zeros(padded.shape[:-2] + (height, width), dtype=padded.dtype)
+
+    for dx, dy in OFFSETS:
+        counts += padded[..., 1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+    return counts
@@ -0,0 +1,84 @@
+import time
+from copy import copy
+from typing import Any, Callable, Dict, List, Tuple
+from ..changes import Changes, changes_of
+from ..engine import Engine, Timings
+from ..rules import CONWAY, Rule
+from ..universes.base_universe import BaseUniverse
+from .active_engine import apply_transitions, count_neighbours, evaluate, transitions
+
+
+class DoubleBufferedEngine(Engine):
+    """
+    Represents an engine that swaps between two preallocated universes instead of copying one per generation.
+    The back universe lags behind the front one by a generation, so it is brought up to date
+    by replaying the last transitions and then the new ones: only real transitions are written.
+    The buffer itself is returned, so a generation is a view that is valid only until the next step:
+    keep a copy of it to keep it longer. The engine saves the allocation of a universe per generation,
+    not time, since counting neighbours dominates a step.
+    """
+
+    def __init__(self):
+        self._front = None
+        self._back = None
+        self._last = None
+        self._born = dict()
+        self._died = []
+
+    def step(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> BaseUniverse[Any]:
+        """Returns the next generation of the universe under the rule."""
+        self._prepare(universe)
+
+        return self._swap(*transitions(self._front, regenerate, rule))
+
+    def transition(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[BaseUniverse[Any], Changes]:
+        """Returns the next generation of the universe along with changes of its transitions."""
+        self._prepare(universe)
+        born, died = transitions(self._front, regenerate, rule)
+        changes = changes_of(self._front._data, born, died)
+
+        return self._swap(born, died), changes
+
+    def timed_step(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[BaseUniverse[Any], Timings]:
+        """Returns the next generation of the universe along with seconds spent in phases of the step."""
+        next_universe, _, timings = self.timed_transition(universe, regenerate, rule)
+
+        return next_universe, timings
+
+    def timed_transition(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+                         rule: Rule=CONWAY) -> Tuple[BaseUniverse[Any], Changes, Timings]:
+        """Returns the next generation of the universe along with its changes and seconds spent in phases."""
+        start = time.perf_counter()
+        self._prepare(universe)
+        prepared = time.perf_counter()
+
+        counts = count_neighbours(self._front, rule)
+        counted = time.perf_counter()
+        born, died = evaluate(self._front, counts, regenerate, rule)
+        evaluated = time.perf_counter()
+
+        changes = changes_of(self._front._data, born, died)
+        next_universe = self._swap(born, died)
+
+        return next_universe, changes, Timings(counted - prepared, evaluated - counted,
+                                               prepared - start + time.perf_counter() - evaluated)
+
+    def _prepare(self, universe: BaseUniverse[Any]):
+        """Copies the universe to both buffers unless it is the last returned generation."""
+        if universe is not self._last:
+            self._front, self._back = copy(universe), copy(universe)
+            self._born, self._died = dict(), []
+
+    def _swap(self, born: Dict[Tuple[int, int], Any], died: List[Tuple[int, int]]) -> BaseUniverse[Any]:
+        """Brings the back universe up to date with the transitions, swaps buffers and returns the generation."""
+        apply_transitions(self._back, self._born, self._died)
+        apply_transitions(self._back, born, died)
+
+        self._front, self._back = self._back, self._front
+        self._born, self._died = born, died
+        self._last = self._front
+
+        return self._last
@@ -0,0 +1,400 @@
+from typing import Any, Callable, List, Tuple
+from ..engine import Engine
+from ..rules import CONWAY, Rule
+from ..universe import Universe
+from ..universes.infinite_universe import InfiniteUniverse
+
+
+class Node():
+    """
+    Represents a square quadtree node of HashLife.
+    Nodes are canonical: equal nodes created by the same engine are always the same object,
+    so they can be compared and hashed by identity.
+    """
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population')
+
+    def __init__(self, level: int, nw: 'Node', ne: 'Node', sw: 'Node', se: 'Node', population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+DEAD = Node(0, None, None, None, None, 0)
+ALIVE = Node(0, None, None, None, None, 1)
+# A wall is a cell beyond the edges of a closed universe: it is never alive and never changes.
+WALL = Node(0, None, None, None, None, 0)
+
+
+class HashLifeEngine(Engine):
+    """
+    Represents an engine that implements HashLife to jump over 2^k generations at once.
+    Nodes are hash-consed and their results are memoized, so repeated patterns are computed only once.
+    The node table never outgrows 'max_nodes': once it is full, even in the middle of a jump,
+    memoized results and nodes are dropped, and nodes in use stay valid but are no longer shared.
+    Between jumps, only the nodes reachable from the current state are kept once the table is half full,
+    so a small cap costs recomputation rather than memory.
+    Closed, wrapped and infinite universes are supported: an infinite universe is advanced on a plane of dead cells.
+    Only two-state rules are supported, and results are memoized for the last used rule.
+    """
+
+    def __init__(self, max_nodes: int=2 ** 22):
+        if max_nodes <= 0:
+            raise ValueError('max_nodes is zero or a negative number.')
+
+        self.max_nodes = max_nodes
+        self._nodes = dict()
+        self._results = dict()
+        self._uniforms = {DEAD: [DEAD], WALL: [WALL]}
+        self._rule = CONWAY
+
+    def step(self, universe: Universe[Any], regenerate: Callable[[], Any], rule: Rule=CONWAY) -> Universe[Any]:
+        """Returns the next generation of the universe under the rule."""
+        return self.advance(universe, 1, regenerate, rule)
+
+    def advance(self, universe: Universe[Any], generations: int, regenerate: Callable[[], Any],
+                rule: Rule=CONWAY) -> Universe[Any]:
+        """
+        Returns the universe after the specified number of generations under the rule.
+        Every alive cell of the returned universe is created by 'regenerate'.
+        """
+        if generations < 0:
+            raise ValueError('generations is a negative number.')
+
+        if rule.states > 2:
+            raise ValueError('rule {} has more than two states.'.format(rule))
+
+        if rule != self._rule:
+            self._results = dict()
+            self._rule = rule
+
+        width, height = universe.width, universe.height
+        positions = list(universe.alive())
+
+        if isinstance(universe, InfiniteUniverse):
+            positions = self._advance_infinite(positions, generations)
+        elif not universe.is_position_in_range(-1, -1):
+            positions = self._advance_closed(positions, width, height, generations)
+        elif is_power_of_two(width) and is_power_of_two(height):
+            positions = self._advance_tiled(positions, width, height, generations)
+        else:
+            positions = self._advance_wrapped(positions, width, height, generations)
+
+        next_universe = type(universe)(width, height)
+
+        for position in positions:
+            next_universe[position] = regenerate()
+
+        return next_universe
+
+    def _advance_closed(self, positions: List[Tuple[int, int]], width: int, height: int,
+                        generations: int) -> List[Tuple[int, int]]:
+        """Advances a closed universe surrounded by walls. Jumps are not limited by the size of the universe."""
+        level = (max(width, height) - 1).bit_length() + 2
+        half = 1 << (level - 1)
+
+        root = self._build(level, -half, -half, positions, (width, height))
+
+        for jump in jumps(generations):
+            while root.level < max(level, jump + 2):
+                root = self._expand(root)
+
+            root = self._successor(root, jump)
+            self._collect_if_full(root)
+
+        half = 1 << (root.level - 1)
+
+        return self._alive_in(root, -half, -half, width, height)
+
+    def _advance_infinite(self, positions: List[Tuple[int, int]], generations: int) -> List[Tuple[int, int]]:
+        """
+        Advances an infinite universe on a plane of dead cells. Before every jump, the root is expanded
+        until the pattern lies in its inner quarter and the jump fits into the level,
+        so nothing can travel out of the center that is returned. Jumps are not limited.
+        """
+        if not positions:
+            return positions
+
+        xs, ys = zip(*positions)
+        left, top = min(xs), min(ys)
+        level = max(max(xs) - left, max(ys) - top).bit_length() + 1
+        half = 1 << (level - 1)
+
+        root = self._build(level, 0, 0, [(x - left + half, y - top + half) for x, y in positions], None)
+
+        for jump in jumps(generations):
+            while root.level < jump + 3 or self._inner(root).population != root.population:
+                root = self._expand(root, DEAD)
+
+            root = self._successor(root, jump)
+            self._collect_if_full(root)
+
+        size = 1 << root.level
+
+        # The center of the root stays at the center of the first root.
+        return [(x - size // 2 + left, y - size // 2 + top) for x, y in self._alive_in(root, 0, 0, size, size)]
+
+    def _advance_tiled(self, positions: List[Tuple[int, int]], width: int, height: int,
+                       generations: int) -> List[Tuple[int, int]]:
+        """
+        Advances a wrapped universe with power-of-two dimensions.
+        The universe is a tile of a periodic plane, so a state stays a node and jumps are not limited.
+        """
+        size = max(width, height)
+        level = size.bit_length() - 1
+
+        positions = [(x + tx, y + ty) for x, y in positions
+                                      for tx in range(0, size, width)
+                                      for ty in range(0, size, height)]
+
+        tile = self._build(level, 0, 0, positions, None)
+
+        for jump in jumps(generations):
+            plane = tile
+
+            # The center of a plane of tiles is aligned with tiles when a quarter of it is a multiple of a tile.
+            while plane.level < max(level, jump) + 2:
+                plane = self._node(plane, plane, plane, plane)
+
+            tile = self._successor(plane, jump)
+
+            while tile.level > level:
+                tile = tile.nw
+
+            self._collect_if_full(tile)
+
+        return self._alive_in(tile, 0, 0, width, height)
+
+    def _advance_wrapped(self, positions: List[Tuple[int, int]], width: int, height: int,
+                         generations: int) -> List[Tuple[int, int]]:
+        """
+        Advances a wrapped universe of any dimensions.
+        The plane of tiles is rebuilt for every jump, so jumps are limited by the size of the universe.
+        """
+        level = (max(width, height) - 1).bit_length() + 2
+        half = 1 << (level - 1)
+        max_jump = level - 2
+
+        remaining = generations
+
+        while remaining:
+            jump = min(remaining.bit_length() - 1, max_jump)
+            remaining -= 1 << jump
+
+            plane = [(x + tx, y + ty) for x, y in positions
+                                      for tx in range(-half // width * width, half, width)
+                                      for ty in range(-half // height * height, half, height)
+                                      if -half <= x + tx < half and -half <= y + ty < half]
+
+            root = self._successor(self._build(level, -half, -half, plane, None), jump)
+            positions = self._alive_in(root, -half // 2, -half // 2, width, height)
+
+            self._collect_if_full(root)
+
+        return positions
+
+    def _node(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """Returns the canonical node of the specified quadrants."""
+        key = nw, ne, sw, se
+        node = self._nodes.get(key, None)
+
+        if node is None:
+            if len(self._nodes) >= self.max_nodes:
+                self._clear()
+
+            node = Node(nw.level + 1, nw, ne, sw, se, nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+
+        return node
+
+    def _uniform(self, leaf: Node, level: int) -> Node:
+        """Returns the canonical node of the specified level filled with the leaf."""
+        uniforms = self._uniforms[leaf]
+
+        while len(uniforms) <= level:
+            node = uniforms[-1]
+            uniforms.append(self._node(node, node, node, node))
+
+        return uniforms[level]
+
+    def _build(self, level: int, x: int, y: int, positions: List[Tuple[int, int]],
+               box: Tuple[int, int]) -> Node:
+        """
+        Builds a node of alive positions for the square at (x, y).
+        Cells beyond the box are walls unless the box is 'None'.
+        """
+        size = 1 << level
+
+        if box is not None:
+            width, height = box
+
+            if x >= width or y >= height or x + size <= 0 or y + size <= 0:
+                return self._uniform(WALL, level)
+
+            if not positions and 0 <= x and 0 <= y and x + size <= width and y + size <= height:
+                return self._uniform(DEAD, level)
+        elif not positions:
+            return self._uniform(DEAD, level)
+
+        if level == 0:
+            return ALIVE if positions else DEAD
+
+        half = size >> 1
+        quadrants = [[], [], [], []]
+
+        for position in positions:
+            quadrants[(position[0] >= x + half) + 2 * (position[1] >= y + half)].append(position)
+
+        return self._node(
+            self._build(level - 1, x, y, quadrants[0], box),
+            self._build(level - 1, x + half, y, quadrants[1], box),
+            self._build(level - 1, x, y + half, quadrants[2], box),
+            self._build(level - 1, x + half, y + half, quadrants[3], box))
+
+    def _alive_in(self, node: Node, x: int, y: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """Returns alive positions of the node at (x, y) that are within the box from (0, 0) to (width, height)."""
+        positions = []
+        nodes = [(node, x, y)]
+
+        while nodes:
+            node, x, y = nodes.pop()
+            size = 1 << node.level
+
+            if not node.population or x >= width or y >= height or x + size <= 0 or y + size <= 0:
+                continue
+
+            if node.level == 0:
+                positions.append((x, y))
+                continue
+
+            half = size >> 1
+            nodes += [(node.nw, x, y), (node.ne, x + half, y), (node.sw, x, y + half), (node.se, x + half, y + half)]
+
+        return positions
+
+    def _expand(self, node: Node, leaf: Node=WALL) -> Node:
+        """Returns a node of the next level with the node in the center surrounded by walls or dead cells."""
+        wall = self._uniform(leaf, node.level - 1)
+
+        return self._node(
+            self._node(wall, wall, wall, node.nw),
+            self._node(wall, wall, node.ne, wall),
+            self._node(wall, node.sw, wall, wall),
+            self._node(node.se, wall, wall, wall))
+
+    def _inner(self, node: Node) -> Node:
+        """Returns the center of the center of the node, a node two levels below it."""
+        return self._node(node.nw.se.se, node.ne.sw.sw, node.sw.ne.ne, node.se.nw.nw)
+
+    def _successor(self, node: Node, jump: int) -> Node:
+        """
+        Returns the center of the node (a node of the previous level) after 2^jump generations.
+        The jump cannot exceed the level of the node minus 2.
+        """
+        key = node, jump
+        result = self._results.get(key, None)
+
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._base(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+            squares = [
+                nw, self._node(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                self._node(nw.sw, nw.se, sw.nw, sw.ne), self._node(nw.se, ne.sw, sw.ne, se.nw),
+                self._node(ne.sw, ne.se, se.nw, se.ne),
+                sw, self._node(sw.ne, se.nw, sw.se, se.sw), se
+            ]
+
+            if jump == node.level - 2:
+                squares = [self._successor(square, jump - 1) for square in squares]
+                jump -= 1
+            else:
+                squares = [self._node(square.nw.se, square.ne.sw, square.sw.ne, square.se.nw) for square in squares]
+
+            result = self._node(
+                self._successor(self._node(squares[0], squares[1], squares[3], squares[4]), jump),
+                self._successor(self._node(squares[1], squares[2], squares[4], squares[5]), jump),
+                self._successor(self._node(squares[3], squares[4], squares[6], squares[7]), jump),
+                self._successor(self._node(squares[4], squares[5], squares[7], squares[8]), jump))
+
+        self._results[key] = result
+
+        return result
+
+    def _base(self, node: Node) -> Node:
+        """Returns the center of a node of level 2 after one generation."""
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+        grid = [
+            [nw.nw, nw.ne, ne.nw, ne.ne],
+            [nw.sw, nw.se, ne.sw, ne.se],
+            [sw.nw, sw.ne, se.nw, se.ne],
+            [sw.sw, sw.se, se.sw, se.se]
+        ]
+
+        table = self._rule.table
+        cells = []
+
+        for y in (1, 2):
+            for x in (1, 2):
+                cell = grid[y][x]
+
+                if cell is WALL:
+                    cells.append(WALL)
+                    continue
+
+                alive = sum(grid[y + dy][x + dx] is ALIVE for dy in (-1, 0, 1)
+                                                           for dx in (-1, 0, 1) if dx or dy)
+
+                cells.append(ALIVE if table[cell is ALIVE][alive] else DEAD)
+
+        return self._node(*cells)
+
+    def _collect_if_full(self, root: Node):
+        """Drops memoized results and nodes that are unreachable from the root once the node table is half full."""
+        if len(self._nodes) <= self.max_nodes // 2:
+            return
+
+        self._clear()
+
+        nodes = [root]
+
+        while nodes:
+            node = nodes.pop()
+
+            if node.level == 0 or self._nodes.get((node.nw, node.ne, node.sw, node.se), None) is node:
+                continue
+
+            self._nodes[node.nw, node.ne, node.sw, node.se] = node
+            nodes += [node.nw, node.ne, node.sw, node.se]
+
+    def _clear(self):
+        """Drops memoized results and all nodes."""
+        self._results = dict()
+        self._nodes = dict()
+        self._uniforms = {DEAD: [DEAD], WALL: [WALL]}
+
+
+def jumps(generations: int) -> List[int]:
+    """Returns powers of two that add up to the number of generations, from the largest."""
+    return [jump for jump in reversed(range(generations.bit_length())) if generations >> jump & 1]
+
+
+def is_power_of_two(value: int) -> bool:
+    """Indicates whether the value is a power of two."""
+    return value & (value - 1) == 0
+
+
+def advance(universe: Universe[Any], generations: int, regenerate: Callable[[], Any],
+            rule: Rule=CONWAY) -> Universe[Any]:
+    """
+    Returns the universe after the specified number of generations computed with HashLife.
+    Use 'HashLifeEngine' directly to keep memoized results between calls.
+    """
+    return HashLifeEngine().advance(universe, generations, regenerate, rule)
@@ -0,0 +1,154 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Tuple
+import numpy
+from ..engine import Engine
+from ..rules import CONWAY, Rule, state_of
+from ..universes.base_universe import BaseUniverse
+from ..universes.dense_universe import DenseUniverse
+from ..universes.infinite_universe import InfiniteUniverse
+from .dense_engine import neighbour_counts, table_of, write_changes
+
+
+class ParallelEngine(Engine):
+    """
+    Represents an engine that splits a universe into bands of rows and steps them on a pool of processes.
+    The current and the next generation are kept in shared memory: every worker reads its band
+    with a one-row halo above and below, and writes the next generation of the band in place,
+    so no cells are pickled. Only born and died cells are written back to the side table of cells.
+    The engine holds processes and shared memory, so it should be closed or used as a context manager.
+    """
+
+    def __init__(self, workers: int=None):
+        workers = workers or os.cpu_count()
+
+        if workers <= 0:
+            raise ValueError('workers is zero or a negative number.')
+
+        self.workers = workers
+        self._executor = None
+        self._buffers = None
+
+    def step(self, universe: BaseUniverse[Any], regenerate: Callable[[], Any],
+             rule: Rule=CONWAY) -> BaseUniverse[Any]:
+        """Returns the next generation of the universe under the rule."""
+        if isinstance(universe, InfiniteUniverse):
+            raise ValueError('infinite universes are not supported, shared arrays have a fixed size.')
+
+        width, height = universe.width, universe.height
+        states, next_states = self._arrays(width, height)
+
+        if isinstance(universe, DenseUniverse):
+            states[...] = universe._states
+        else:
+            states.fill(0)
+
+            if universe._data:
+                xs, ys = zip(*universe._data)
+                states[ys, xs] = [state_of(cell) for cell in universe._data.values()]
+
+        wrapped = universe.is_position_in_range(-1, -1)
+        names = self._buffers[0].name, self._buffers[1].name
+        bands = numpy.linspace(0, height, min(self.workers, height) + 1).astype(int)
+
+        futures = [self._executor.submit(step_band, names, width, height, start, stop, wrapped, table_of(rule))
+                   for start, stop in zip(bands, bands[1:])]
+
+        for future in futures:
+            future.result()
+
+        next_universe = copy(universe)
+
+        if isinstance(next_universe, DenseUniverse):
+            next_universe._states = next_states.copy()
+
+        # Chunked universes and universes with a spatial index keep more than the side table of cells in sync.
+        plain = type(next_universe).__setitem__ is BaseUniverse.__setitem__
+
+        if next_universe._index is None and (plain or isinstance(next_universe, DenseUniverse)):
+            write_changes(next_universe._data, states, next_states, regenerate, rule)
+        else:
+            write_cells(next_universe, states, next_states, regenerate, rule)
+
+        return next_universe
+
+    def close(self):
+        """Shuts the pool of processes down and releases shared memory."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        if self._buffers is not None:
+            for buffer in self._buffers:
+                buffer.close()
+                buffer.unlink()
+
+            self._buffers = None
+
+    def __enter__(self) -> 'ParallelEngine':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _arrays(self, width: int, height: int) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Returns the current and the next generation arrays, allocating shared memory for new dimensions."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+
+        if self._buffers is None or self._buffers[0].size < width * height:
+            if self._buffers is not None:
+                for buffer in self._buffers:
+                    buffer.close()
+                    buffer.unlink()
+
+            self._buffers = [shared_memory.SharedMemory(create=True, size=width * height) for _ in range(2)]
+
+        return tuple(numpy.ndarray((height, width), numpy.uint8, buffer.buf) for buffer in self._buffers)
+
+
+def write_cells(universe: BaseUniverse[Any], states: numpy.ndarray, next_states: numpy.ndarray,
+                regenerate: Callable[[], Any], rule: Rule=CONWAY):
+    """Writes born, died and dying cells to the universe through 'self[x, y]'."""
+    changed_y, changed_x = numpy.nonzero(states != next_states)
+
+    for x, y, state in zip(changed_x.tolist(), changed_y.tolist(), next_states[changed_y, changed_x].tolist()):
+        universe[x, y] = None if state == 0 else regenerate() if state == 1 else rule.dying[state]
+
+
+_attached: Dict[str, shared_memory.SharedMemory] = dict()
+
+
+def attach(name: str, width: int, height: int) -> numpy.ndarray:
+    """Returns an array over shared memory, attaching to it once per worker."""
+    buffer = _attached.get(name, None)
+
+    if buffer is None:
+        buffer = _attached[name] = shared_memory.SharedMemory(name=name)
+
+    return numpy.ndarray((height, width), numpy.uint8, buffer.buf)
+
+
+def step_band(names: Tuple[str, str], width: int, height: int, start: int, stop: int, wrapped: bool,
+              table: numpy.ndarray):
+    """
+    Writes the next generation of rows from 'start' to 'stop' using a one-row halo around them
+    and the lookup table of the rule.
+    """
+    states = attach(names[0], width, height)
+    next_states = attach(names[1], width, height)
+
+    rows = numpy.arange(start - 1, stop + 1)
+
+    if wrapped:
+        band = states[rows % height]
+    else:
+        band = numpy.zeros((len(rows), width), numpy.uint8)
+        inside = (0 <= rows) & (rows < height)
+        band[inside] = states[rows[inside]]
+
+    counts = neighbour_counts((band == 1).view(numpy.uint8), 'wrap' if wrapped else 'constant')[1:-1]
+
+    next_states[start:stop] = table[band[1:-1], counts]
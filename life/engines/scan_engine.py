@@ -0,0 +1,61 @@
+import time
+from copy import copy
+from typing import Any, Callable, Iterable, Tuple
+from ..engine import Engine, Timings
+from ..rules import CONWAY, Rule, state_of
+from ..universe import Universe
+from ..universes.infinite_universe import InfiniteUniverse
+
+
+class ScanEngine(Engine):
+    """
+    Represents an engine that visits every position of the universe on each generation.
+    The engine can handle any universe-like object of any cells.
+    Positions of an infinite universe are the ones of its bounding box grown by a cell,
+    since cells can be born next to the box but not farther.
+    """
+
+    def step(self, universe: Universe[Any], regenerate: Callable[[], Any], rule: Rule=CONWAY) -> Universe[Any]:
+        """Returns the next generation of the universe under the rule."""
+        next_universe = copy(universe)
+
+        for x, y in positions_of(universe):
+            cell = universe[x, y]
+            neighbours_alive = sum(state_of(neighbour) == 1 for neighbour in universe.neighbours_of(x, y))
+
+            next_universe[x, y] = rule.apply(cell, neighbours_alive, regenerate)
+
+        return next_universe
+
+    def timed_step(self, universe: Universe[Any], regenerate: Callable[[], Any],
+                   rule: Rule=CONWAY) -> Tuple[Universe[Any], Timings]:
+        """
+        Returns the next generation of the universe along with seconds spent in phases of the step.
+        Neighbours of all positions are counted before the rule is evaluated to time the phases apart.
+        """
+        start = time.perf_counter()
+        next_universe = copy(universe)
+        copied = time.perf_counter()
+
+        positions = list(positions_of(universe))
+        counts = [sum(state_of(neighbour) == 1 for neighbour in universe.neighbours_of(x, y)) for x, y in positions]
+        counted = time.perf_counter()
+
+        for (x, y), neighbours_alive in zip(positions, counts):
+            next_universe[x, y] = rule.apply(universe[x, y], neighbours_alive, regenerate)
+
+        return next_universe, Timings(counted - copied, time.perf_counter() - counted, copied - start)
+
+
+def positions_of(universe: Universe[Any]) -> Iterable[Tuple[int, int]]:
+    """Returns positions where cells of the next generation of the universe can be."""
+    if not isinstance(universe, InfiniteUniverse):
+        return universe.through()
+
+    if universe.bounds is None:
+        return iter(())
+
+    left, top, right, bottom = universe.bounds
+
+    return ((x, y) for y in range(top - 1, bottom + 2)
+                   for x in range(left - 1, right + 2))
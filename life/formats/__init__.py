@@ -0,0 +1,10 @@
+__all__ = [
+    'Checkpoint', 'DeltaReader', 'DeltaWriter', 'load_checkpoint', 'read_plaintext', 'read_rle', 'save_checkpoint',
+    'write_plaintext', 'write_rle'
+]
+
+
+from .checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from .delta import DeltaReader, DeltaWriter
+from .plaintext import read_plaintext, write_plaintext
+from .rle import read_rle, write_rle
@@ -0,0 +1,206 @@
+import mmap
+import struct
+from typing import Any, Callable, Tuple, Type, TypeVar
+import numpy
+from ..rules import state_of
+from ..universe import Universe
+from ..universes.base_universe import BaseUniverse
+from ..universes.closed_universe import ClosedUniverse
+from ..universes.dense_universe import DenseUniverse
+from ..universes.infinite_universe import InfiniteUniverse
+from ..universes.wrapped_universe import WrappedUniverse
+
+
+T = TypeVar('T')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+MAGIC = b'LIFE'
+VERSION = 1
+# Magic, version, topology, encoding, width, height, generation and population, padded to align the data.
+HEADER = struct.Struct('<4sHBBQQQQ')
+HEADER_SIZE = 64
+
+CLOSED, WRAPPED = 0, 1
+BITMAP, COORDINATES = 0, 1
+
+BAND_SIZE = 1024
+
+
+class Checkpoint():
+    """
+    Represents a checkpoint of a universe opened with 'mmap'.
+    A checkpoint is a header with the width, the height, the topology and the generation of a universe
+    followed by either a bitmap of rows, one bit per cell, or a sorted array of 'y * width + x' keys of alive cells.
+    Only the pages of a requested region are read, so a region of a huge universe can be viewed
+    without loading the whole checkpoint. The checkpoint holds the file, so it should be closed
+    or used as a context manager.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError('file "{}" is not a checkpoint.'.format(path))
+
+        if len(self._mmap) < HEADER_SIZE or self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError('file "{}" is not a checkpoint.'.format(path))
+
+        _, version, topology, encoding, width, height, generation, population = HEADER.unpack_from(self._mmap)
+
+        if version != VERSION:
+            self.close()
+            raise ValueError('checkpoint version {} is not supported.'.format(version))
+
+        self.width = width
+        self.height = height
+        self.wrapped = topology == WRAPPED
+        self.generation = generation
+        self.population = population
+
+        if encoding == BITMAP:
+            self._bitmap = numpy.frombuffer(self._mmap, numpy.uint8, height * row_size(width), HEADER_SIZE) \
+                .reshape(height, row_size(width))
+            self._keys = None
+        else:
+            self._bitmap = None
+            self._keys = numpy.frombuffer(self._mmap, numpy.uint64, population, HEADER_SIZE)
+
+    def region(self, x: int, y: int, width: int, height: int) -> numpy.ndarray:
+        """Returns a boolean array of alive cells in the region of the specified size at (x, y)."""
+        if x < 0 or y < 0 or width < 0 or height < 0 or x + width > self.width or y + height > self.height:
+            raise IndexError('region is out of the universe.')
+
+        if self._bitmap is not None:
+            start, stop = x >> 3, (x + width + 7) >> 3
+            bits = numpy.unpackbits(self._bitmap[y:y + height, start:stop], axis=1, bitorder='little')
+
+            return bits[:, x - (start << 3):x - (start << 3) + width].astype(bool)
+
+        region = numpy.zeros((height, width), dtype=bool)
+        rows = numpy.arange(y, y + height, dtype=numpy.uint64) * numpy.uint64(self.width)
+        starts = numpy.searchsorted(self._keys, rows + numpy.uint64(x))
+        stops = numpy.searchsorted(self._keys, rows + numpy.uint64(x + width))
+
+        for row, (start, stop) in enumerate(zip(starts, stops)):
+            region[row, (self._keys[start:stop] - rows[row]).astype(numpy.int64) - x] = True
+
+        return region
+
+    def positions(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Returns arrays of columns and rows of alive cells ordered by rows."""
+        if self._bitmap is None:
+            keys = self._keys.astype(numpy.int64)
+
+            return keys % self.width, keys // self.width
+
+        columns, rows = [], []
+
+        for start in range(0, self.height, BAND_SIZE):
+            ys, xs = numpy.nonzero(self.region(0, start, self.width, min(BAND_SIZE, self.height - start)))
+            columns.append(xs)
+            rows.append(ys + start)
+
+        return numpy.concatenate(columns), numpy.concatenate(rows)
+
+    def to_universe(self, cls: Type[UniverseType], regenerate: Callable[[], T]) -> UniverseType:
+        """Returns a universe of the specified class with alive cells created by 'regenerate'."""
+        universe = cls(self.width, self.height)
+
+        for x, y in zip(*self.positions()):
+            universe[int(x), int(y)] = regenerate()
+
+        return universe
+
+    def close(self):
+        """Releases the memory map and closes the file."""
+        self._bitmap = None
+        self._keys = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        self._file.close()
+
+    def __enter__(self) -> 'Checkpoint':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def save_checkpoint(universe: Universe[Any], path: str, generation: int=0):
+    """
+    Saves alive cells of a universe to a checkpoint file in bulk.
+    The smaller of a bitmap and an array of keys is chosen, and a bitmap is written through a memory map,
+    so only pages with alive cells are touched. Dying cells of 'Generations' rules are not saved.
+    An infinite universe is saved as a closed universe of its bounding box.
+    """
+    if generation < 0:
+        raise ValueError('generation is a negative number.')
+
+    if isinstance(universe, InfiniteUniverse):
+        universe = universe.to_universe()
+
+    width, height = universe.width, universe.height
+    xs, ys = alive_positions(universe)
+    population = len(xs)
+
+    topology = WRAPPED if universe.is_position_in_range(-1, -1) else CLOSED
+    encoding = BITMAP if height * row_size(width) <= population * 8 else COORDINATES
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, topology, encoding, width, height, generation, population)
+                   .ljust(HEADER_SIZE, b'\0'))
+
+        if encoding == COORDINATES:
+            keys = ys.astype(numpy.uint64) * numpy.uint64(width) + xs.astype(numpy.uint64)
+            keys.sort()
+            file.write(keys.tobytes())
+            return
+
+        file.truncate(HEADER_SIZE + height * row_size(width))
+
+    bitmap = numpy.memmap(path, numpy.uint8, 'r+', HEADER_SIZE, (height, row_size(width)))
+    numpy.bitwise_or.at(bitmap, (ys, xs >> 3), numpy.left_shift(1, xs & 7).astype(numpy.uint8))
+    bitmap.flush()
+
+    del bitmap
+
+
+def load_checkpoint(path: str, regenerate: Callable[[], T],
+                    cls: Type[UniverseType]=None) -> Tuple[UniverseType, int]:
+    """
+    Loads a universe and its generation from a checkpoint file.
+    Unless a class is specified, the universe is a 'ClosedUniverse' or a 'WrappedUniverse' as it was saved.
+    """
+    with Checkpoint(path) as checkpoint:
+        cls = cls or (WrappedUniverse if checkpoint.wrapped else ClosedUniverse)
+
+        return checkpoint.to_universe(cls, regenerate), checkpoint.generation
+
+
+def alive_positions(universe: Universe[Any]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns arrays of columns and rows of alive cells of a universe."""
+    if isinstance(universe, DenseUniverse):
+        ys, xs = numpy.nonzero(universe._states == 1)
+
+        return xs, ys
+
+    if isinstance(universe, BaseUniverse):
+        positions = [position for position, cell in universe._data.items() if state_of(cell) == 1]
+    else:
+        positions = list(universe.alive())
+
+    positions = numpy.array(positions, dtype=numpy.int64).reshape(-1, 2)
+
+    return positions[:, 0], positions[:, 1]
+
+
+def row_size(width: int) -> int:
+    """Returns the number of bytes of a bitmap row."""
+    return (width + 7) >> 3
@@ -0,0 +1,359 @@
+import os
+import struct
+import zlib
+from copy import copy
+from typing import Any, Callable, Generator, Iterable, List, Tuple, Type, TypeVar
+import numpy
+from ..changes import Changes
+from ..rules import CONWAY, Dying, Rule
+from ..universe import Universe
+from ..universes.closed_universe import ClosedUniverse
+from ..universes.infinite_universe import InfiniteUniverse
+from ..universes.wrapped_universe import WrappedUniverse
+
+
+T = TypeVar('T')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+MAGIC = b'LIFD'
+VERSION = 1
+# Magic, version, topology, flags, width, height and the keyframe interval, padded to align blocks.
+HEADER = struct.Struct('<4sHBBQQI')
+HEADER_SIZE = 32
+# The first generation of a block, the number of generations in it and the size of its payload.
+BLOCK = struct.Struct('<QQQ')
+# Magic of the index and its offset at the end of a closed log.
+TRAILER = struct.Struct('<4sQ')
+INDEX_MAGIC = b'LIDX'
+
+CLOSED, WRAPPED = 0, 1
+COMPRESSED = 1
+
+KEYFRAME_INTERVAL = 64
+
+# Offsets of 7-bit groups of a 64-bit varint.
+SHIFTS = numpy.arange(0, 64, 7, dtype=numpy.uint64)
+
+
+class DeltaWriter():
+    """
+    Represents a writer of a delta log: a run recorded as positions of cells that were born or died
+    in every generation, with a keyframe of all alive cells every 'keyframe_interval' generations.
+    A keyframe and the deltas that follow it form a block that is optionally compressed with zlib.
+    Positions are stored as sorted 'y * width + x' keys, and every key is stored as a varint of its gap
+    from the previous one, so a delta of a few changes takes a few bytes.
+    The writer tracks alive cells by itself, so it needs only the changes of every generation
+    and memory proportional to the population. The log is complete once the writer is closed.
+    Only births and deaths are recorded, so runs of 'Generations' rules, where cells change their state
+    while dying, are rejected rather than replayed wrong.
+    """
+
+    def __init__(self, path: str, universe: Universe[Any], generation: int=0,
+                 keyframe_interval: int=KEYFRAME_INTERVAL, compress: bool=True, rule: Rule=CONWAY):
+        if rule.states > 2:
+            raise ValueError('rule {} has more than two states.'.format(rule))
+
+        if generation < 0:
+            raise ValueError('generation is a negative number.')
+
+        if keyframe_interval <= 0:
+            raise ValueError('keyframe_interval is zero or a negative number.')
+
+        if isinstance(universe, InfiniteUniverse):
+            raise ValueError('an infinite universe cannot be recorded, record a bounded viewport of it instead.')
+
+        if any(isinstance(universe[position], Dying) for position in universe.alive()):
+            raise ValueError('a universe with dying cells cannot be recorded.')
+
+        self.width = universe.width
+        self.height = universe.height
+        self.generation = generation
+        self.keyframe_interval = keyframe_interval
+        self.compress = compress
+
+        self._alive = set(y * self.width + x for x, y in universe.alive())
+        self._payload = []  # type: List[bytes]
+        self._first = generation
+        self._index = []  # type: List[Tuple[int, int]]
+
+        topology = WRAPPED if universe.is_position_in_range(-1, -1) else CLOSED
+
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, topology, COMPRESSED if compress else 0, self.width,
+                                     self.height, keyframe_interval).ljust(HEADER_SIZE, b'\0'))
+        self._payload.append(encode_keys(self._alive))
+
+    def write(self, changes: Changes):
+        """Appends positions of cells that were born or died in the next generation."""
+        if changes.changed:
+            raise ValueError('changes of cell states cannot be recorded.')
+
+        width = self.width
+        born = [y * width + x for x, y in changes.born]
+        died = [y * width + x for x, y in changes.died]
+
+        self._alive.difference_update(died)
+        self._alive.update(born)
+
+        if self.generation + 1 - self._first < self.keyframe_interval:
+            self._payload.append(encode_keys(born) + encode_keys(died))
+            self.generation += 1
+            return
+
+        self._flush()
+        self.generation += 1
+        self._first = self.generation
+        self._payload.append(encode_keys(self._alive))
+
+    def close(self):
+        """Writes the last block and the index of blocks and closes the file."""
+        if self._file.closed:
+            return
+
+        self._flush()
+
+        offset = self._file.tell()
+        self._file.write(numpy.array(self._index, dtype=numpy.uint64).reshape(-1, 2).tobytes())
+        self._file.write(TRAILER.pack(INDEX_MAGIC, offset))
+        self._file.close()
+
+    def _flush(self):
+        """Writes the keyframe and the deltas of the current block."""
+        payload = b''.join(self._payload)
+
+        if self.compress:
+            payload = zlib.compress(payload)
+
+        self._index.append((self._first, self._file.tell()))
+        self._file.write(BLOCK.pack(self._first, self.generation - self._first + 1, len(payload)))
+        self._file.write(payload)
+        self._payload = []
+
+    def __enter__(self) -> 'DeltaWriter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class DeltaReader():
+    """
+    Represents a reader of a delta log written by 'DeltaWriter'.
+    A universe at any generation is rebuilt from the nearest keyframe before it and at most
+    'keyframe_interval' deltas, and a run is replayed by applying deltas without recomputing the rule.
+    A log that was not closed has no index: its blocks are found by walking their headers.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+
+        try:
+            header = self._file.read(HEADER_SIZE)
+
+            if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+                raise ValueError('file "{}" is not a delta log.'.format(path))
+
+            _, version, topology, flags, width, height, keyframe_interval = HEADER.unpack_from(header)
+
+            if version != VERSION:
+                raise ValueError('delta log version {} is not supported.'.format(version))
+
+            self.width = width
+            self.height = height
+            self.wrapped = topology == WRAPPED
+            self.compressed = bool(flags & COMPRESSED)
+            self.keyframe_interval = keyframe_interval
+            self._blocks = self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    @property
+    def start(self) -> int:
+        """Returns the first recorded generation."""
+        return self._blocks[0][0] if self._blocks else 0
+
+    @property
+    def stop(self) -> int:
+        """Returns the generation after the last recorded one."""
+        if not self._blocks:
+            return 0
+
+        self._file.seek(self._blocks[-1][1])
+        first, count, _ = BLOCK.unpack(self._file.read(BLOCK.size))
+
+        return first + count
+
+    def seek(self, generation: int, regenerate: Callable[[], T], cls: Type[UniverseType]=None) -> UniverseType:
+        """Returns the universe at the generation with alive cells created by 'regenerate'."""
+        return next(self.replay(regenerate, cls, generation))
+
+    def replay(self, regenerate: Callable[[], T], cls: Type[UniverseType]=None,
+               start: int=None) -> Generator[UniverseType, None, None]:
+        """
+        Returns a generator iterator of universes from the start generation to the last recorded one.
+        Unless a class is specified, universes are 'ClosedUniverse' or 'WrappedUniverse' as they were recorded.
+        Cells that survive keep their identity, and only born cells are created by 'regenerate'.
+        """
+        cls = cls or (WrappedUniverse if self.wrapped else ClosedUniverse)
+        start = self.start if start is None else start
+        universe = None
+
+        for generation, born, died in self._records(start):
+            if universe is None:
+                universe = cls(self.width, self.height)
+            elif generation > start:
+                # The previous universe was yielded, so it must not be changed.
+                universe = copy(universe)
+
+            for x, y in zip(*self._positions_of(died)):
+                universe[x, y] = None
+
+            for x, y in zip(*self._positions_of(born)):
+                universe[x, y] = regenerate()
+
+            if generation >= start:
+                yield universe
+
+    def changes(self, start: int=None) -> Generator[Tuple[int, Changes], None, None]:
+        """Returns a generator iterator of generations after the start with positions of born and died cells."""
+        start = self.start if start is None else start
+
+        for generation, born, died in self._records(start):
+            if generation > start:
+                yield generation, Changes(born=set(zip(*self._positions_of(born))),
+                                          died=set(zip(*self._positions_of(died))))
+
+    def close(self):
+        """Closes the file."""
+        self._file.close()
+
+    def __enter__(self) -> 'DeltaReader':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _records(self, start: int) -> Iterable[Tuple[int, numpy.ndarray, numpy.ndarray]]:
+        """
+        Returns records from the keyframe before the start generation as (generation, born, died) keys.
+        The first record holds all alive cells as born, and later keyframes are turned into deltas.
+        """
+        if start < self.start or start >= self.stop:
+            raise IndexError('generation {} is not recorded.'.format(start))
+
+        index = int(numpy.searchsorted([first for first, _ in self._blocks], start, side='right')) - 1
+        alive = None
+
+        for offset in (offset for _, offset in self._blocks[index:]):
+            first, count, payload = self._read_block(offset)
+            values = decode_varints(payload)
+            keys, position = read_keys(values, 0)
+
+            if alive is None:
+                alive = set(keys.tolist())
+                yield first, keys, keys[:0]
+            else:
+                next_alive = set(keys.tolist())
+                yield first, as_keys(next_alive - alive), as_keys(alive - next_alive)
+                alive = next_alive
+
+            for generation in range(first + 1, first + count):
+                born, position = read_keys(values, position)
+                died, position = read_keys(values, position)
+
+                alive.difference_update(died.tolist())
+                alive.update(born.tolist())
+
+                yield generation, born, died
+
+    def _read_index(self) -> List[Tuple[int, int]]:
+        """Returns the first generation and the offset of every block."""
+        size = self._file.seek(0, os.SEEK_END)
+
+        if size >= HEADER_SIZE + TRAILER.size:
+            self._file.seek(size - TRAILER.size)
+            magic, offset = TRAILER.unpack(self._file.read(TRAILER.size))
+
+            if magic == INDEX_MAGIC:
+                self._file.seek(offset)
+                index = numpy.frombuffer(self._file.read(size - TRAILER.size - offset), dtype=numpy.uint64)
+
+                return [(int(first), int(offset)) for first, offset in index.reshape(-1, 2)]
+
+        blocks = []
+        offset = HEADER_SIZE
+
+        while offset + BLOCK.size <= size:
+            self._file.seek(offset)
+            first, _, length = BLOCK.unpack(self._file.read(BLOCK.size))
+
+            if offset + BLOCK.size + length > size:
+                break
+
+            blocks.append((first, offset))
+            offset += BLOCK.size + length
+
+        return blocks
+
+    def _read_block(self, offset: int) -> Tuple[int, int, bytes]:
+        """Returns the first generation, the number of generations and the decompressed payload of a block."""
+        self._file.seek(offset)
+        first, count, length = BLOCK.unpack(self._file.read(BLOCK.size))
+        payload = self._file.read(length)
+
+        return first, count, zlib.decompress(payload) if self.compressed else payload
+
+    def _positions_of(self, keys: numpy.ndarray) -> Tuple[List[int], List[int]]:
+        """Returns columns and rows of keys."""
+        return (keys % self.width).tolist(), (keys // self.width).tolist()
+
+
+def encode_keys(keys: Iterable[int]) -> bytes:
+    """Returns varints of the number of keys followed by gaps between sorted keys."""
+    keys = numpy.sort(numpy.fromiter(keys, dtype=numpy.uint64))
+    values = numpy.empty(len(keys) + 1, dtype=numpy.uint64)
+    values[0] = len(keys)
+    values[1:] = numpy.diff(keys, prepend=numpy.uint64(0))
+
+    return encode_varints(values)
+
+
+def read_keys(values: numpy.ndarray, position: int) -> Tuple[numpy.ndarray, int]:
+    """Returns keys from the number of keys and gaps at the position and the position after them."""
+    count = int(values[position])
+    keys = numpy.cumsum(values[position + 1:position + 1 + count]).astype(numpy.int64)
+
+    return keys, position + 1 + count
+
+
+def as_keys(keys: Iterable[int]) -> numpy.ndarray:
+    """Returns an array of keys."""
+    return numpy.fromiter(keys, dtype=numpy.int64)
+
+
+def encode_varints(values: numpy.ndarray) -> bytes:
+    """Returns unsigned LEB128 varints of values: 7 bits per byte with the high bit set on all but the last byte."""
+    groups = (values[:, None] >> SHIFTS) & numpy.uint64(0x7f)
+    lengths = numpy.maximum(numpy.count_nonzero(values[:, None] >> SHIFTS, axis=1), 1)
+    continued = numpy.arange(len(SHIFTS)) < (lengths - 1)[:, None]
+
+    groups = groups.astype(numpy.uint8) | (continued.astype(numpy.uint8) << 7)
+
+    return groups[numpy.arange(len(SHIFTS)) < lengths[:, None]].tobytes()
+
+
+def decode_varints(data: bytes) -> numpy.ndarray:
+    """Returns values of unsigned LEB128 varints."""
+    data = numpy.frombuffer(data, dtype=numpy.uint8)
+
+    if not len(data):
+        return numpy.zeros(0, dtype=numpy.uint64)
+
+    ends = numpy.flatnonzero(data < 0x80)
+    starts = numpy.concatenate(([0], ends[:-1] + 1))
+    groups = numpy.arange(len(data)) - numpy.repeat(starts, ends - starts + 1)
+
+    parts = (data & 0x7f).astype(numpy.uint64) << (groups.astype(numpy.uint64) * numpy.uint64(7))
+
+    return numpy.add.reduceat(parts, starts)
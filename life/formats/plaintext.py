@@ -0,0 +1,63 @@
+from typing import Any, Callable, IO, Type, TypeVar
+from ..universe import Universe
+from ..universes.infinite_universe import InfiniteUniverse
+from .rle import occupied
+
+
+T = TypeVar('T')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+
+def read_plaintext(file: IO[str], cls: Type[UniverseType], regenerate: Callable[[], T]) -> UniverseType:
+    """
+    Reads a universe from a file in plaintext format ('.cells'): 'O' or '*' is an alive cell, '.' is a dead one
+    and lines starting with '!' are comments. The file is read line by line and only alive positions are kept
+    until dimensions of the universe are known at the end of the file.
+    """
+    positions = []
+    width, height = 0, 0
+
+    for line in file:
+        if line.startswith('!'):
+            continue
+
+        line = line.rstrip('\r\n')
+
+        positions += [(x, height) for x, char in enumerate(line) if char in 'O*']
+        width = max(width, len(line))
+        height += 1
+
+    universe = cls(width, height)
+
+    for position in positions:
+        universe[position] = regenerate()
+
+    return universe
+
+
+def write_plaintext(universe: Universe[Any], file: IO[str]):
+    """
+    Writes a universe to a file in plaintext format ('.cells').
+    Rows are written one by one from occupied positions and padded with dead cells to keep the width.
+    An infinite universe is written as its bounding box.
+    """
+    if isinstance(universe, InfiniteUniverse):
+        universe = universe.to_universe()
+
+    def write_rows(line: str, count: int):
+        file.write(line.ljust(universe.width, '.') + '\n')
+        file.write(('.' * universe.width + '\n') * (count - 1))
+
+    y, line = 0, ''
+
+    for cell_y, cell_x, state in occupied(universe):
+        if state != 1:
+            continue
+
+        if cell_y != y:
+            write_rows(line, cell_y - y)
+            y, line = cell_y, ''
+
+        line += '.' * (cell_x - len(line)) + 'O'
+
+    write_rows(line, universe.height - y)
@@ -0,0 +1,160 @@
+import re
+from typing import Any, Callable, IO, Iterable, Tuple, Type, TypeVar
+from ..rules import CONWAY, Rule, state_of
+from ..universe import Universe
+from ..universes.base_universe import BaseUniverse
+from ..universes.infinite_universe import InfiniteUniverse
+
+
+T = TypeVar('T')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+CHUNK_SIZE = 2 ** 16
+LINE_LENGTH = 70
+
+
+def read_rle(file: IO[str], cls: Type[UniverseType], regenerate: Callable[[], T]) -> Tuple[UniverseType, Rule]:
+    """
+    Reads a universe and its rule from a file in RLE format.
+    The file is parsed incrementally and only alive cells are inserted, so time and memory are proportional
+    to the size of the file and the population rather than to the size of the universe.
+    Dying cells of multi-state 'Generations' patterns are inserted as dying cells of the rule.
+    """
+    width, height, rule = read_header(file)
+    universe = cls(width, height)
+
+    x, y, count = 0, 0, ''
+    chunk = file.read(CHUNK_SIZE)
+
+    while chunk:
+        for char in chunk:
+            if char.isdigit():
+                count += char
+                continue
+
+            if char.isspace():
+                continue
+
+            run = int(count or 1)
+            count = ''
+
+            if char == '!':
+                return universe, rule
+
+            if char == '$':
+                x, y = 0, y + run
+                continue
+
+            state = state_of_tag(char)
+
+            if state == 1:
+                for _ in range(run):
+                    universe[x, y] = regenerate()
+                    x += 1
+            elif state > 1:
+                for _ in range(run):
+                    universe[x, y] = rule.dying[state]
+                    x += 1
+            else:
+                x += run
+
+        chunk = file.read(CHUNK_SIZE)
+
+    return universe, rule
+
+
+def read_header(file: IO[str]) -> Tuple[int, int, Rule]:
+    """Skips comments and returns the width, the height and the rule from the header line of RLE format."""
+    for line in iter(file.readline, ''):
+        line = line.strip()
+
+        if not line or line.startswith('#'):
+            continue
+
+        match = re.fullmatch(r'x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)\s*(?:,\s*rule\s*=\s*(\S+))?', line, re.IGNORECASE)
+
+        if match is None:
+            raise ValueError('line "{}" is not an RLE header.'.format(line))
+
+        rule = Rule.parse(match.group(3)) if match.group(3) else CONWAY
+
+        return int(match.group(1)), int(match.group(2)), rule
+
+    raise ValueError('file has no RLE header.')
+
+
+def state_of_tag(tag: str) -> int:
+    """Returns the state of a tag: 'b' and '.' are dead, 'o' is alive, and letters from 'A' are states from 1."""
+    if tag in 'b.':
+        return 0
+
+    if tag == 'o':
+        return 1
+
+    if 'A' <= tag <= 'X':
+        return ord(tag) - ord('A') + 1
+
+    raise ValueError('tag "{}" is not supported.'.format(tag))
+
+
+def write_rle(universe: Universe[Any], file: IO[str], rule: Rule=CONWAY):
+    """
+    Writes a universe and its rule to a file in RLE format.
+    Runs are emitted straight from occupied positions, so the universe is never iterated as a full grid.
+    An infinite universe is written as its bounding box.
+    """
+    if isinstance(universe, InfiniteUniverse):
+        universe = universe.to_universe()
+
+    file.write('x = {}, y = {}, rule = {}\n'.format(universe.width, universe.height, rule))
+
+    tags = ('b', 'o') if rule.states == 2 else ('.',) + tuple(chr(ord('A') + state) for state in range(rule.states - 1))
+
+    line = ''
+
+    for token in tokens_of(occupied(universe), tags):
+        if len(line) + len(token) > LINE_LENGTH:
+            file.write(line + '\n')
+            line = ''
+
+        line += token
+
+    file.write(line + '!\n')
+
+
+def occupied(universe: Universe[Any]) -> Iterable[Tuple[int, int, int]]:
+    """Returns rows, columns and states of occupied positions ordered by rows."""
+    if isinstance(universe, BaseUniverse):
+        cells = ((y, x, state_of(cell)) for (x, y), cell in universe._data.items())
+    else:
+        cells = ((y, x, state_of(universe[x, y])) for x, y in universe.alive())
+
+    return sorted(cells)
+
+
+def tokens_of(cells: Iterable[Tuple[int, int, int]], tags: Tuple[str, ...]) -> Iterable[str]:
+    """Returns tokens of runs for cells ordered by rows."""
+    def token(run: int, tag: str) -> str:
+        return '{}{}'.format(run if run > 1 else '', tag)
+
+    x, y = 0, 0
+    run, state = 0, 0
+
+    for cell_y, cell_x, cell_state in cells:
+        if run and (cell_y != y or cell_x != x or cell_state != state):
+            yield token(run, tags[state])
+            run = 0
+
+        if cell_y != y:
+            yield token(cell_y - y, '$')
+            x, y = 0, cell_y
+
+        if cell_x != x:
+            yield token(cell_x - x, tags[0])
+            x = cell_x
+
+        run, state = run + 1, cell_state
+        x += 1
+
+    if run:
+        yield token(run, tags[state])
@@ -1,39 +1,101 @@
-from copy import copy
-from typing import Any, Callable, Iterable, Generator
+from typing import Any, Callable, Iterable, Generator, Tuple
+from .changes import Changes
+from .cycle_detector import CycleDetector
+from .engine import Engine
+from .engines import ActiveEngine, BitPackedEngine, ChunkedEngine, DenseEngine, ScanEngine
+from .monitor import Monitor
+from .rules import CONWAY, Rule, state_of
 from .universe import Universe
+from .universes.base_universe import BaseUniverse
+from .universes.bit_packed_universe import BitPackedUniverse
+from .universes.chunked_universe import ChunkedUniverse
+from .universes.dense_universe import DenseUniverse
 
 
-def originate_from(universe: Universe[Any], regenerate: Callable[[], Any]) -> Generator[Universe[Any], None, None]:
+def originate_from(universe: Universe[Any], regenerate: Callable[[], Any], engine: Engine=None, rule: Rule=CONWAY,
+                   detector: CycleDetector=None, monitor: Monitor=None) -> Generator[Universe[Any], None, None]:
     """
-    Returns a generator iterator that can be used to iterate through universe states.
+    Returns a generator iterator that can be used to iterate through universe states under the rule.
     The function can handle any universe-like object of any cells. Any cell except of 'None' is considered as alive.
+    By default, the engine is chosen depending on the universe and the rule.
+    With a cycle detector, the generator stops after the first state that repeats an earlier one.
+    With a monitor, metrics of every generation are passed to its sinks; without it nothing is measured.
     """
+    if detector is not None or monitor is not None:
+        # The cycle detector and the monitor need changes of every generation.
+        for next_universe, _ in originate_changes_from(universe, regenerate, engine, rule, detector, monitor):
+            yield next_universe
+
+        return
+
+    engine = engine or engine_for(universe, rule)
+
     while True:
-        next_universe = copy(universe)
+        universe = engine.step(universe, regenerate, rule)
+
+        yield universe
+
 
-        for x, y in universe.through():
-            cell = universe[x, y]
-            neibours = universe.neighbours_of(x, y)
+def originate_changes_from(universe: Universe[Any], regenerate: Callable[[], Any], engine: Engine=None,
+                           rule: Rule=CONWAY, detector: CycleDetector=None,
+                           monitor: Monitor=None) -> Generator[Tuple[Universe[Any], Changes], None, None]:
+    """
+    Returns a generator iterator that can be used to iterate through universe states
+    along with positions of cells that were born, died or changed their state in each generation.
+    Changes are reported by engines that know transitions of a step, such as 'ActiveEngine',
+    and found by comparing universe states otherwise.
+    """
+    engine = engine or engine_for(universe, rule)
+    transition = engine.transition if monitor is None else monitor.transitioner(engine)
 
-            next_universe[x, y] = live(cell, neibours, regenerate)
+    if detector is not None:
+        detector.observe(universe)
 
-        universe = next_universe
+    while True:
+        universe, changes = transition(universe, regenerate, rule)
+        cycle = detector is not None and detector.observe(universe, changes)
 
-        yield next_universe
+        yield universe, changes
 
+        if cycle:
+            return
 
-def live(cell: Any, neigbours: Iterable[Any], regenerate: Callable[[], Any]) -> Any:
+
+def originate_deltas_from(universe: Universe[Any], regenerate: Callable[[], Any], engine: Engine=None,
+                          rule: Rule=CONWAY, detector: CycleDetector=None,
+                          monitor: Monitor=None) -> Generator[Changes, None, None]:
     """
-    Implements the logic of 'The Game of Life'.
-    Any cell except of 'None' is considered as alive.
-    Returns the existing cell if it survives, a new cell if it regenerates or 'None' if if dies.
+    Returns a generator iterator that can be used to iterate through positions of cells
+    that were born or died in each generation without the universe states,
+    so a run can be recorded with 'DeltaWriter' in memory proportional to the population.
     """
-    neigbours_alive = sum(neigbour is not None for neigbour in neigbours)
+    for _, changes in originate_changes_from(universe, regenerate, engine, rule, detector, monitor):
+        yield changes
 
-    if cell is not None and (neigbours_alive < 2 or 3 < neigbours_alive):
-        return None
 
-    if cell is None and neigbours_alive == 3:
-        return regenerate()
+def engine_for(universe: Universe[Any], rule: Rule=CONWAY) -> Engine:
+    """Returns the fastest engine that can handle the universe under the rule."""
+    if isinstance(universe, BitPackedUniverse):
+        return BitPackedEngine()
+
+    if isinstance(universe, DenseUniverse):
+        return DenseEngine()
+
+    if isinstance(universe, ChunkedUniverse) and 0 not in rule.birth:
+        return ChunkedEngine()
+
+    if isinstance(universe, BaseUniverse) and 0 not in rule.birth:
+        return ActiveEngine()
+
+    return ScanEngine()
+
+
+def live(cell: Any, neigbours: Iterable[Any], regenerate: Callable[[], Any], rule: Rule=CONWAY) -> Any:
+    """
+    Implements the logic of 'The Game of Life' under the rule.
+    Any cell except of 'None' and dying cells of 'Generations' rules is considered as alive.
+    Returns the existing cell if it survives, a new cell if it regenerates or 'None' if if dies.
+    """
+    neigbours_alive = sum(state_of(neigbour) == 1 for neigbour in neigbours)
 
-    return cell
+    return rule.apply(cell, neigbours_alive, regenerate)
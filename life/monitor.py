@@ -0,0 +1,85 @@
+import time
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+from .changes import Changes, changes_between
+from .engine import Engine
+from .rules import CONWAY, Rule
+from .universe import Universe
+
+
+Metrics = NamedTuple('Metrics', [
+    ('generation', int),
+    ('population', int),
+    ('born', int),
+    ('died', int),
+    ('step', float),
+    ('counting', Optional[float]),
+    ('evaluating', Optional[float]),
+    ('copying', Optional[float]),
+    ('bounding_box', Optional[Tuple[int, int, int, int]])
+])
+
+
+class Monitor():
+    """
+    Represents an opt-in instrumentation of generations that passes metrics of every generation to sinks.
+    A sink is any callable that accepts metrics: a callback, a CSV or a JSON lines writer or a histogram.
+    Metrics hold the population, the numbers of born and died cells, seconds spent in the whole step
+    and in its phases, and the bounding box of alive cells as (left, top, right, bottom) or 'None' if there are none.
+    Phases are timed by 'Engine.timed_transition', so they are 'None' for engines that do not separate them.
+    Changes come from transitions of engines that report them, but the bounding box costs O(population)
+    per generation, so a monitor should be passed to 'originate_from' only when metrics are needed.
+    """
+
+    def __init__(self, *sinks: Callable[[Metrics], Any]):
+        self.sinks = list(sinks)
+        self.generation = 0
+
+    def transitioner(self, engine: Engine) -> Callable[[Universe[Any], Callable[[], Any], Rule],
+                                                        Tuple[Universe[Any], Changes]]:
+        """
+        Returns a function that steps with the engine, records metrics of every generation
+        and returns the next generation along with its changes.
+        """
+        def transition(universe: Universe[Any], regenerate: Callable[[], Any],
+                       rule: Rule=CONWAY) -> Tuple[Universe[Any], Changes]:
+            start = time.perf_counter()
+            next_universe, changes, timings = engine.timed_transition(universe, regenerate, rule)
+            elapsed = time.perf_counter() - start
+
+            self.record(universe, next_universe, elapsed, *timings, changes=changes)
+
+            return next_universe, changes
+
+        return transition
+
+    def record(self, universe: Universe[Any], next_universe: Universe[Any], step: float,
+               counting: float=None, evaluating: float=None, copying: float=None, changes: Changes=None):
+        """
+        Passes metrics of the next generation of the universe to sinks.
+        Without changes reported by an engine, they are found by comparing the universe states.
+        """
+        self.generation += 1
+        changes = changes or changes_between(universe, next_universe)
+        population, box = bounding_box_of(next_universe)
+
+        metrics = Metrics(self.generation, population, len(changes.born), len(changes.died),
+                          step, counting, evaluating, copying, box)
+
+        for sink in self.sinks:
+            sink(metrics)
+
+
+def bounding_box_of(universe: Universe[Any]) -> Tuple[int, Optional[Tuple[int, int, int, int]]]:
+    """Returns the population and the bounding box of alive cells as (left, top, right, bottom)."""
+    population = 0
+    left = top = right = bottom = None
+
+    for x, y in universe.alive():
+        if population == 0:
+            left, top, right, bottom = x, y, x, y
+        else:
+            left, top, right, bottom = min(left, x), min(top, y), max(right, x), max(bottom, y)
+
+        population += 1
+
+    return population, (left, top, right, bottom) if population else None
@@ -0,0 +1,95 @@
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
+import numpy
+from .universe import Universe
+
+
+# Glyphs of blocks from empty to full when a universe is rendered zoomed out.
+SHADES = ' .:-=+*#%@'
+
+
+def render(universe: Universe[Any], viewport: Tuple[int, int, int, int]=None, scale: int=1,
+           shades: str=SHADES) -> str:
+    """
+    Returns a string representation of the viewport (left, top, width, height) of the universe,
+    the whole universe by default, with a glyph and a space per position, as 'str' of a universe does.
+    The frame is built in bulk from occupied positions: glyphs are written into a preallocated buffer of rows
+    that is decoded once, so the cost is O(population + viewport) rather than a lookup per position.
+    With a scale above 1, every 'scale x scale' block is rendered as one glyph shaded by the share of alive cells.
+    """
+    if scale <= 0:
+        raise ValueError('scale is zero or a negative number.')
+
+    left, top, width, height = viewport or (0, 0, universe.width, universe.height)
+    rows, columns = -(-height // scale), -(-width // scale)
+
+    if rows <= 0 or columns <= 0:
+        return ''
+
+    data = cells_of(universe)
+    positions = numpy.fromiter(chain.from_iterable(data), dtype=numpy.int64, count=len(data) * 2).reshape(-1, 2)
+    xs, ys = positions[:, 0] - left, positions[:, 1] - top
+    visible = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    xs, ys = xs[visible], ys[visible]
+
+    frame = numpy.full((rows, columns * 2), ord(' '), dtype=numpy.uint8)
+    frame[:, -1] = ord('\n')
+
+    if scale > 1:
+        counts = numpy.bincount((ys // scale) * columns + xs // scale, minlength=rows * columns)
+        # Counts from one to a full block are spread over shades after the empty one,
+        # so any alive cell makes a block visible, and only a full block gets the last shade.
+        levels = numpy.where(counts > 0, 1 + (counts - 1) * (len(shades) - 2) // max(scale * scale - 1, 1), 0)
+        frame[:, :-1:2] = numpy.frombuffer(shades.encode('ascii'), dtype=numpy.uint8)[levels].reshape(rows, columns)
+
+        return frame.tobytes().decode('ascii')[:-1]
+
+    # Glyphs are looked up once per distinct cell object, so shared cells cost nothing.
+    cells = list(data.values())
+
+    if len(xs) < len(cells):
+        cells = [cells[index] for index in numpy.flatnonzero(visible).tolist()]
+
+    ids = numpy.fromiter(map(id, cells), dtype=numpy.uint64, count=len(cells))
+    _, first, inverse = numpy.unique(ids, return_index=True, return_inverse=True)
+    glyphs = [glyph_of(cells[index]) for index in first.tolist()]
+    codes = ascii_codes_of(glyphs)
+
+    if codes is not None:
+        frame[ys, xs * 2] = codes[inverse]
+
+        return frame.tobytes().decode('ascii')[:-1]
+
+    # Glyphs that do not fit a byte are joined as strings.
+    lines = [[' '] * width for _ in range(height)]
+
+    for index, x, y in zip(inverse.tolist(), xs.tolist(), ys.tolist()):
+        lines[y][x] = glyphs[index]
+
+    return '\n'.join(' '.join(line) for line in lines)
+
+
+def cells_of(universe: Universe[Any]) -> Dict[Tuple[int, int], Any]:
+    """Returns cells of the universe by occupied positions."""
+    if hasattr(universe, '_data'):
+        return universe._data
+
+    return {position: universe[position] for position in universe.alive()}
+
+
+def glyph_of(cell: Any) -> str:
+    """Returns a glyph of a cell, cells of bit-packed universes are booleans."""
+    return '*' if cell is True else str(cell or ' ')
+
+
+def ascii_codes_of(glyphs: List[str]) -> Optional[numpy.ndarray]:
+    """Returns codes of glyphs or 'None' if some glyph is not a single ASCII character."""
+    text = ''.join(glyphs)
+
+    if len(text) != len(glyphs):
+        return None
+
+    try:
+        return numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8)
+    except UnicodeEncodeError:
+        return None
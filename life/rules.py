@@ -0,0 +1,147 @@
+import re
+from typing import Any, Callable, Iterable
+
+
+class Dying():
+    """
+    Represents a cell that is dying under a 'Generations' rule.
+    A dying cell occupies its position but is not counted as an alive neighbour.
+    """
+
+    def __init__(self, state: int):
+        self.state = state
+
+    def __str__(self) -> str:
+        """Returns a string representation of the cell."""
+        return '.'
+
+    def __repr__(self) -> str:
+        return 'Dying({})'.format(self.state)
+
+    def __eq__(self, other: Any) -> bool:
+        """Indicates whether the cell is in the same state as another dying cell."""
+        return isinstance(other, Dying) and self.state == other.state
+
+    def __hash__(self) -> int:
+        return hash(self.state)
+
+
+class Rule():
+    """
+    Represents a rule of 'The Game of Life' family: numbers of alive neighbours that bring a dead cell to life
+    and numbers that keep an alive cell, plus the number of states for multi-state 'Generations' rules.
+    A rule is compiled to a lookup table of the next state indexed by the state of a cell
+    and the number of its alive neighbours: 0 is dead, 1 is alive and other states are dying.
+    """
+
+    def __init__(self, birth: Iterable[int], survival: Iterable[int], states: int=2):
+        birth, survival = frozenset(birth), frozenset(survival)
+
+        if not birth <= set(range(9)) or not survival <= set(range(9)):
+            raise ValueError('numbers of neighbours are out of range from 0 to 8.')
+
+        if states < 2:
+            raise ValueError('states is less than 2.')
+
+        self.birth = birth
+        self.survival = survival
+        self.states = states
+
+        dying = 2 if states > 2 else 0
+
+        self.table = tuple(
+            tuple(1 if count in birth else 0 for count in range(9)) if state == 0 else
+            tuple(1 if count in survival else dying for count in range(9)) if state == 1 else
+            (((state + 1) % states),) * 9
+            for state in range(states))
+
+        self.dying = [None, None] + [Dying(state) for state in range(2, states)]
+
+    def apply(self, cell: Any, neighbours_alive: int, regenerate: Callable[[], Any]) -> Any:
+        """
+        Returns the existing cell if it survives, a new cell if it regenerates,
+        a dying cell if it is dying or 'None' if it dies.
+        """
+        state = state_of(cell)
+        next_state = self.table[state][neighbours_alive]
+
+        if next_state == state and state < 2:
+            return cell
+
+        if next_state == 0:
+            return None
+
+        if next_state == 1:
+            return regenerate()
+
+        return self.dying[next_state]
+
+    @classmethod
+    def parse(cls, notation: str) -> 'Rule':
+        """
+        Creates a rule from 'B3/S23' notation, 'B2/S345/C4' notation for 'Generations' rules
+        or the legacy 'S/B' and 'S/B/C' notations such as '23/3' and '345/2/4'.
+        """
+        parts = notation.strip().upper().split('/')
+
+        if not 2 <= len(parts) <= 3:
+            raise ValueError('notation "{}" is not a rule.'.format(notation))
+
+        if all(re.fullmatch(r'\d*', part) for part in parts):
+            survival, birth, *states = parts
+        else:
+            named = dict()
+
+            for part in parts:
+                match = re.fullmatch(r'([BSCG]?)(\d*)', part)
+                key = match and match.group(1).replace('G', 'C') or 'C'
+
+                if match is None or key in named:
+                    raise ValueError('notation "{}" is not a rule.'.format(notation))
+
+                named[key] = match.group(2)
+
+            if 'B' not in named or 'S' not in named:
+                raise ValueError('notation "{}" is not a rule.'.format(notation))
+
+            birth, survival = named['B'], named['S']
+            states = [named.get('C', None) or '2']
+
+        return cls(map(int, birth), map(int, survival), int(states[0]) if states else 2)
+
+    def __str__(self) -> str:
+        """Returns the rule in 'B3/S23' notation."""
+        notation = 'B{}/S{}'.format(digits(self.birth), digits(self.survival))
+
+        return notation if self.states == 2 else '{}/C{}'.format(notation, self.states)
+
+    def __repr__(self) -> str:
+        return 'Rule.parse({!r})'.format(str(self))
+
+    def __eq__(self, other: Any) -> bool:
+        """Indicates whether the rule equals to another rule."""
+        return isinstance(other, Rule) and (self.birth, self.survival, self.states) == \
+            (other.birth, other.survival, other.states)
+
+    def __hash__(self) -> int:
+        return hash((self.birth, self.survival, self.states))
+
+
+def state_of(cell: Any) -> int:
+    """Returns the state of the cell: 0 for 'None', the state of a dying cell or 1 for any other cell."""
+    if cell is None:
+        return 0
+
+    return cell.state if isinstance(cell, Dying) else 1
+
+
+def digits(numbers: Iterable[int]) -> str:
+    """Returns sorted numbers as a string of digits."""
+    return ''.join(map(str, sorted(numbers)))
+
+
+CONWAY = Rule.parse('B3/S23')
+HIGHLIFE = Rule.parse('B36/S23')
+DAY_AND_NIGHT = Rule.parse('B3678/S34678')
+SEEDS = Rule.parse('B2/S')
+BRIANS_BRAIN = Rule.parse('B2/S/C3')
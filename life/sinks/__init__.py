@@ -0,0 +1,6 @@
+__all__ = ['CsvSink', 'Histogram', 'JsonLinesSink']
+
+
+from .csv_sink import CsvSink
+from .histogram import Histogram
+from .json_lines_sink import JsonLinesSink
@@ -0,0 +1,19 @@
+import csv
+from typing import IO
+from ..monitor import Metrics
+
+
+class CsvSink():
+    """
+    Represents a sink that writes metrics to a CSV file, one row per generation after a header row.
+    The bounding box is written as 'left', 'top', 'right' and 'bottom' columns, and missing values are empty.
+    """
+    FIELDS = Metrics._fields[:-1] + ('left', 'top', 'right', 'bottom')
+
+    def __init__(self, file: IO[str]):
+        self._writer = csv.writer(file)
+        self._writer.writerow(self.FIELDS)
+
+    def __call__(self, metrics: Metrics):
+        """Writes metrics of a generation."""
+        self._writer.writerow(metrics[:-1] + (metrics.bounding_box or (None,) * 4))
@@ -0,0 +1,63 @@
+import math
+from collections import Counter
+from ..monitor import Metrics
+
+
+class Histogram():
+    """
+    Represents an in-memory histogram of a metric, such as 'step' or 'population', over generations.
+    Values are counted in buckets of the specified width, so memory does not grow with the number of generations.
+    Missing values of a metric are not counted.
+    """
+
+    def __init__(self, metric: str='step', width: float=1e-3):
+        if metric not in Metrics._fields or metric == 'bounding_box':
+            raise ValueError('metric "{}" is not a number.'.format(metric))
+
+        if width <= 0:
+            raise ValueError('width is zero or a negative number.')
+
+        self.metric = metric
+        self.width = width
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    def __call__(self, metrics: Metrics):
+        """Counts the metric of a generation."""
+        value = getattr(metrics, self.metric)
+
+        if value is None:
+            return
+
+        self.buckets[math.floor(value / self.width)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of counted values or 'None' if nothing is counted."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent: float) -> float:
+        """Returns the upper bound of the bucket that holds the specified percentile or 'None' if nothing is counted."""
+        if not 0 <= percent <= 100:
+            raise ValueError('percent is out of range from 0 to 100.')
+
+        if not self.count:
+            return None
+
+        rank = percent / 100 * self.count
+        counted = 0
+
+        for bucket in sorted(self.buckets):
+            counted += self.buckets[bucket]
+
+            if counted >= rank:
+                return min((bucket + 1) * self.width, self.maximum)
+
+        return self.maximum
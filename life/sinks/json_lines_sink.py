@@ -0,0 +1,14 @@
+import json
+from typing import IO
+from ..monitor import Metrics
+
+
+class JsonLinesSink():
+    """Represents a sink that writes metrics to a file in JSON lines format, one object per generation."""
+
+    def __init__(self, file: IO[str]):
+        self._file = file
+
+    def __call__(self, metrics: Metrics):
+        """Writes metrics of a generation."""
+        self._file.write(json.dumps(metrics._asdict()) + '\n')
@@ -0,0 +1,126 @@
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Any, Generator, Iterable, List, NamedTuple, Optional, Set, Type
+from .cell import Cell
+from .cycle_detector import CycleDetector
+from .life import originate_from
+from .universes.base_universe import BaseUniverse
+from .universes.wrapped_universe import WrappedUniverse
+
+
+GENERATIONS = 10000
+CHUNK_SIZE = 16
+
+Soup = NamedTuple('Soup', [
+    ('seed', int),
+    ('population', int),
+    ('lifespan', int),
+    ('start', Optional[int]),
+    ('period', Optional[int])
+])
+
+
+class SoupSearch():
+    """
+    Represents a search through random soups that are run on a pool of processes.
+    Every seed is run until the soup stabilizes or the generation cap is reached, and the result is appended
+    to a results file in JSON lines format as soon as it arrives, so an interrupted search is resumed
+    from the file: seeds that are in the file or were already queued are skipped.
+    Seeds are sent to workers in chunks, and only a few chunks per worker are queued at a time.
+    """
+
+    def __init__(self, path: str, width: int, height: int, generations: int=GENERATIONS,
+                 cls: Type[BaseUniverse]=WrappedUniverse, probability: float=.5, workers: int=None,
+                 chunk_size: int=CHUNK_SIZE):
+        workers = workers or os.cpu_count()
+
+        if width <= 0:
+            raise ValueError('width is zero or a negative number.')
+
+        if height <= 0:
+            raise ValueError('height is zero or a negative number.')
+
+        if generations <= 0:
+            raise ValueError('generations is zero or a negative number.')
+
+        if workers <= 0:
+            raise ValueError('workers is zero or a negative number.')
+
+        if chunk_size <= 0:
+            raise ValueError('chunk_size is zero or a negative number.')
+
+        self.path = path
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.seeds = read_seeds(path)
+        self._run = partial(run_soups, width=width, height=height, generations=generations, cls=cls,
+                            probability=probability)
+
+    def run(self, seeds: Iterable[int]) -> Generator[Soup, None, None]:
+        """Returns a generator iterator that runs soups of new seeds and yields results in order of completion."""
+        seeds = self.new(seeds)
+        chunks = iter(lambda: list(islice(seeds, self.chunk_size)), [])
+
+        with open(self.path, 'a') as file, ProcessPoolExecutor(self.workers) as executor:
+            pending = {executor.submit(self._run, chunk) for chunk in islice(chunks, self.workers * 2)}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending |= {executor.submit(self._run, chunk) for chunk in islice(chunks, len(done))}
+
+                for future in done:
+                    soups = future.result()
+
+                    file.writelines(json.dumps(soup._asdict()) + '\n' for soup in soups)
+                    file.flush()
+
+                    yield from soups
+
+    def new(self, seeds: Iterable[int]) -> Generator[int, None, None]:
+        """Returns a generator iterator over seeds that have not been run yet, marking them as run."""
+        for seed in seeds:
+            if seed not in self.seeds:
+                self.seeds.add(seed)
+                yield seed
+
+
+def run_soup(seed: int, width: int, height: int, generations: int=GENERATIONS,
+             cls: Type[BaseUniverse]=WrappedUniverse, probability: float=.5) -> Soup:
+    """Runs a random soup of the seed until it stabilizes or the generation cap is reached."""
+    universe = cls.random(width, height, Cell.shared, probability=probability, seed=seed)
+    detector = CycleDetector()
+
+    for universe in islice(originate_from(universe, Cell.shared, detector=detector), generations):
+        pass
+
+    return Soup(seed, len(universe._data), detector.generation, detector.start, detector.period)
+
+
+def run_soups(seeds: List[int], **kwargs: Any) -> List[Soup]:
+    """Runs soups of seeds one by one, so a worker gets a chunk of seeds per task."""
+    return [run_soup(seed, **kwargs) for seed in seeds]
+
+
+def read_seeds(path: str) -> Set[int]:
+    """
+    Returns seeds that are in the results file. A line that was cut off when a search was interrupted
+    is removed from the file, so the next result starts on its own line.
+    """
+    if not os.path.exists(path):
+        return set()
+
+    seeds = set()
+
+    with open(path, 'rb+') as file:
+        lines = file.read().split(b'\n')
+
+        if lines[-1]:
+            file.truncate(file.tell() - len(lines[-1]))
+
+        for line in lines[:-1]:
+            seeds.add(json.loads(line.decode('utf-8'))['seed'])
+
+    return seeds
@@ -0,0 +1,86 @@
+from typing import Iterable, List, Tuple
+
+
+TILE_SIZE = 64
+
+
+class SpatialIndex():
+    """
+    Represents an index of occupied positions grouped by square tiles of 'tile_size' x 'tile_size' cells.
+    Positions are added and removed one by one, so the index follows a universe incrementally.
+    A rectangle query visits only the tiles it overlaps: the population of a tile that lies inside
+    the rectangle is the size of the tile set, and only tiles on the border of the rectangle are scanned.
+    """
+
+    def __init__(self, positions: Iterable[Tuple[int, int]]=(), tile_size: int=TILE_SIZE):
+        if tile_size <= 0:
+            raise ValueError('tile_size is zero or a negative number.')
+
+        self.tile_size = tile_size
+        self._tiles = dict()
+        self._population = 0
+
+        for position in positions:
+            self.add(position)
+
+    def __len__(self) -> int:
+        """Returns the number of indexed positions."""
+        return self._population
+
+    def add(self, position: Tuple[int, int]):
+        """Adds the position to the index."""
+        x, y = position
+        tile = self._tiles.setdefault((x // self.tile_size, y // self.tile_size), set())
+
+        if position not in tile:
+            tile.add(position)
+            self._population += 1
+
+    def remove(self, position: Tuple[int, int]):
+        """Removes the position from the index if it is there."""
+        x, y = position
+        key = x // self.tile_size, y // self.tile_size
+        tile = self._tiles.get(key)
+
+        if tile is None or position not in tile:
+            return
+
+        tile.remove(position)
+        self._population -= 1
+
+        if not tile:
+            del self._tiles[key]
+
+    def population(self, left: int, top: int, width: int, height: int) -> int:
+        """Returns the number of positions in the rectangle."""
+        return sum(len(positions) if inside else sum(1 for _ in positions)
+                   for inside, positions in self._query(left, top, width, height))
+
+    def positions(self, left: int, top: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """Returns positions in the rectangle."""
+        return [position for _, positions in self._query(left, top, width, height) for position in positions]
+
+    def _query(self, left: int, top: int, width: int, height: int) -> Iterable[Tuple[bool, Iterable[Tuple[int, int]]]]:
+        """Returns positions of tiles that overlap the rectangle along with whether a tile lies inside it."""
+        if width <= 0 or height <= 0:
+            return
+
+        size = self.tile_size
+        right, bottom = left + width, top + height
+        columns = range(left // size, (right - 1) // size + 1)
+        rows = range(top // size, (bottom - 1) // size + 1)
+
+        # Few positions in a large rectangle are cheaper to filter than to look up tile by tile.
+        if len(columns) * len(rows) > len(self._tiles):
+            tiles = ((key, tile) for key, tile in self._tiles.items() if key[0] in columns and key[1] in rows)
+        else:
+            tiles = (((tx, ty), self._tiles.get((tx, ty))) for ty in rows for tx in columns)
+
+        for (tx, ty), tile in tiles:
+            if not tile:
+                continue
+
+            if left <= tx * size and (tx + 1) * size <= right and top <= ty * size and (ty + 1) * size <= bottom:
+                yield True, tile
+            else:
+                yield False, (p for p in tile if left <= p[0] < right and top <= p[1] < bottom)
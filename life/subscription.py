@@ -0,0 +1,123 @@
+import asyncio
+from collections import deque
+from typing import Any, NamedTuple, Optional
+from .changes import Changes
+from .universe import Universe
+
+
+POLICIES = ('coalesce', 'drop', 'block')
+
+
+Frame = NamedTuple('Frame', [('generation', int), ('universe', Universe[Any]), ('changes', Changes)])
+
+
+class Subscription():
+    """
+    Represents a bounded queue of frames of a single consumer of a driver.
+    When the queue is full, the policy decides what happens to the oldest frame:
+    'coalesce' drops it and merges its changes into the next frame, so a consumer that draws only changes stays
+    consistent, 'drop' just drops it, and 'block' holds the driver back until the consumer takes a frame.
+    With frames per second, iteration yields frames no faster than that rate, so the render rate
+    does not depend on the step rate: frames that arrive in between are coalesced or dropped.
+    """
+
+    def __init__(self, maxsize: int=1, policy: str='coalesce', frames_per_second: float=None):
+        if maxsize <= 0:
+            raise ValueError('maxsize is zero or a negative number.')
+
+        if policy not in POLICIES:
+            raise ValueError('policy "{}" is not one of {}.'.format(policy, ', '.join(POLICIES)))
+
+        if frames_per_second is not None and frames_per_second <= 0:
+            raise ValueError('frames_per_second is zero or a negative number.')
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.frames_per_second = frames_per_second
+        self.dropped = 0
+        self.closed = False
+        self._frames = deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._next_frame = None
+
+    def __len__(self) -> int:
+        """Returns the number of frames in the queue."""
+        return len(self._frames)
+
+    async def put(self, frame: Frame):
+        """Adds a frame to the queue, dropping, coalescing or waiting for space according to the policy."""
+        while self.policy == 'block' and len(self._frames) >= self.maxsize and not self.closed:
+            self._space.clear()
+            await self._space.wait()
+
+        self.put_nowait(frame)
+
+    def put_nowait(self, frame: Frame):
+        """Adds a frame to the queue, dropping or coalescing the oldest frame if the queue is full."""
+        if self.closed:
+            return
+
+        if len(self._frames) >= self.maxsize:
+            dropped = self._frames.popleft()
+            self.dropped += 1
+
+            if self.policy != 'drop':
+                if self._frames:
+                    self._frames[0] = self._frames[0]._replace(changes=coalesce(dropped.changes,
+                                                                                self._frames[0].changes))
+                else:
+                    frame = frame._replace(changes=coalesce(dropped.changes, frame.changes))
+
+        self._frames.append(frame)
+        self._ready.set()
+
+    async def get(self) -> Optional[Frame]:
+        """Returns the oldest frame, waiting for it if the queue is empty, or 'None' once the queue is closed."""
+        while not self._frames:
+            if self.closed:
+                return None
+
+            self._ready.clear()
+            await self._ready.wait()
+
+        frame = self._frames.popleft()
+        self._space.set()
+
+        return frame
+
+    def close(self):
+        """Closes the queue: frames that are already queued can still be taken, new frames are ignored."""
+        self.closed = True
+        self._ready.set()
+        self._space.set()
+
+    def __aiter__(self) -> 'Subscription':
+        """Returns an asynchronous iterator over frames paced by frames per second."""
+        return self
+
+    async def __anext__(self) -> Frame:
+        """Returns the next frame, not earlier than the next tick of the render rate."""
+        if self.frames_per_second is not None:
+            loop = asyncio.get_event_loop()
+
+            if self._next_frame is not None and self._next_frame > loop.time():
+                await asyncio.sleep(self._next_frame - loop.time())
+
+            self._next_frame = loop.time() + 1 / self.frames_per_second
+
+        frame = await self.get()
+
+        if frame is None:
+            raise StopAsyncIteration
+
+        return frame
+
+
+def coalesce(changes: Changes, next_changes: Changes) -> Changes:
+    """Returns changes of two consecutive generations as changes of a single generation."""
+    born = (changes.born - next_changes.died) | next_changes.born
+    died = (changes.died - next_changes.born) | (next_changes.died - changes.born)
+    changed = (changes.changed | next_changes.changed) - born - died
+
+    return Changes(born=born, died=died, changed=changed)
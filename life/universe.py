@@ -25,6 +25,10 @@ class Universe(Generic[T]):
         """Returns a new iterator that can iterate over the universe."""
         pass
 
+    def alive(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of alive cells only."""
+        return (position for position in self.through() if self[position] is not None)
+
     @abstractmethod
     def neighbours_of(self, x: int, y: int) -> Iterable[T]:
         """Returns a new iterator that can iterate over neighbours around the specified position."""
@@ -1,5 +1,20 @@
-__all__ = ['ClosedUniverse', 'WrappedUniverse']
+__all__ = [
+    'ClosedUniverse', 'WrappedUniverse', 'InfiniteUniverse', 'DenseUniverse', 'ClosedDenseUniverse',
+    'WrappedDenseUniverse',
+    'BitPackedUniverse', 'ClosedBitPackedUniverse', 'WrappedBitPackedUniverse',
+    'ChunkedUniverse', 'ClosedChunkedUniverse', 'WrappedChunkedUniverse'
+]
 
 
 from .closed_universe import ClosedUniverse
 from .wrapped_universe import WrappedUniverse
+from .infinite_universe import InfiniteUniverse
+from .dense_universe import DenseUniverse
+from .closed_dense_universe import ClosedDenseUniverse
+from .wrapped_dense_universe import WrappedDenseUniverse
+from .bit_packed_universe import BitPackedUniverse
+from .closed_bit_packed_universe import ClosedBitPackedUniverse
+from .wrapped_bit_packed_universe import WrappedBitPackedUniverse
+from .chunked_universe import ChunkedUniverse
+from .closed_chunked_universe import ClosedChunkedUniverse
+from .wrapped_chunked_universe import WrappedChunkedUniverse
@@ -1,11 +1,25 @@
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Iterable, List, TypeVar, Tuple
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Iterable, List, NamedTuple, Optional, TypeVar, Tuple
+import numpy
+from ..renderer import render
+from ..spatial_index import SpatialIndex
 from ..universe import Universe
 
 
 T = TypeVar('T')
 BaseUniverseType = TypeVar('BaseUniverseType', bound='BaseUniverse[T]')
 
+OFFSETS = ((-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0))
+
+NeighbourTable = NamedTuple('NeighbourTable', [
+    ('columns', Tuple[Tuple[Optional[int], int, Optional[int]], ...]),
+    ('rows', Tuple[Tuple[Optional[int], int, Optional[int]], ...]),
+    ('column_spans', Tuple[Tuple[int, ...], ...]),
+    ('row_spans', Tuple[Tuple[int, ...], ...])
+])
+
 
 class BaseUniverse(Universe[T]):
     """
@@ -14,6 +28,9 @@ class BaseUniverse(Universe[T]):
     """
     __metaclass__ = ABCMeta
 
+    # Whether edges wrap around, set by universes whose neighbours are looked up in a neighbour table.
+    wraps = None  # type: Optional[bool]
+
     def __init__(self, width: int, height: int):
         if width <= 0:
             raise ValueError('width is zero or a negative number.')
@@ -24,6 +41,8 @@ class BaseUniverse(Universe[T]):
         self._width = width
         self._height = height
         self._data = dict()
+        self._neighbours = neighbour_table_of(type(self), width, height)
+        self._index = None
 
     @property
     def width(self) -> int:
@@ -50,20 +69,88 @@ class BaseUniverse(Universe[T]):
         return ((x, y) for y in range(self.height)
                        for x in range(self.width))
 
+    def alive(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of alive cells only."""
+        return iter(self._data)
+
     def neighbours_of(self, x: int, y: int) -> Iterable[T]:
         """Returns a new iterator that can iterate over neighbours around the specified position."""
-        positions = [
-            (x - 1, y - 1),  # NE
-            (x, y - 1),      # N
-            (x + 1, y - 1),  # NW
-            (x + 1, y),      # W
-            (x + 1, y + 1),  # SW
-            (x, y + 1),      # S
-            (x - 1, y + 1),  # SE
-            (x - 1, y)       # E
-        ]
-
-        return (self[position] for position in positions if self.is_position_in_range(*position))
+        table = self._neighbours
+
+        if table is None or not (0 <= x < self._width and 0 <= y < self._height):
+            positions = ((x + dx, y + dy) for dx, dy in OFFSETS)
+
+            return (self[position] for position in positions if self.is_position_in_range(*position))
+
+        (east, x, west), (north, y, south) = table.columns[x], table.rows[y]
+        positions = (
+            (east, north),  # NE
+            (x, north),     # N
+            (west, north),  # NW
+            (west, y),      # W
+            (west, south),  # SW
+            (x, south),     # S
+            (east, south),  # SE
+            (east, y)       # E
+        )
+        data = self._data
+
+        return (data.get(position) for position in positions if None not in position)
+
+    def neighbour_counts(self, alive: Iterable[Tuple[int, int]]=None) -> Counter:
+        """
+        Returns numbers of alive neighbours by positions around alive cells in one call.
+        By default, every occupied position is considered alive.
+        """
+        table = self._neighbours
+        alive = self._data if alive is None else alive
+        counts = Counter()
+
+        if table is None:
+            adjust_position = self.adjust_position
+            is_position_in_range = self.is_position_in_range
+
+            for x, y in alive:
+                for dx, dy in OFFSETS:
+                    if is_position_in_range(x + dx, y + dy):
+                        counts[adjust_position(x + dx, y + dy)] += 1
+
+            return counts
+
+        column_spans, row_spans = table.column_spans, table.row_spans
+
+        for x, y in alive:
+            columns = column_spans[x]
+
+            for neighbour_y in row_spans[y]:
+                for neighbour_x in columns:
+                    counts[neighbour_x, neighbour_y] += 1
+
+            # Spans include the position itself.
+            if counts[x, y] == 1:
+                del counts[x, y]
+            else:
+                counts[x, y] -= 1
+
+        return counts
+
+    def spatial_index(self) -> SpatialIndex:
+        """
+        Returns the spatial index of occupied positions. The index is built on the first call
+        and then kept up to date by every write, copies of the universe do not have it until it is requested.
+        """
+        if self._index is None:
+            self._index = SpatialIndex(self._data)
+
+        return self._index
+
+    def population_in(self, left: int, top: int, width: int, height: int) -> int:
+        """Returns the number of occupied positions in the rectangle using the spatial index."""
+        return self.spatial_index().population(left, top, width, height)
+
+    def alive_in(self, left: int, top: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """Returns occupied positions in the rectangle using the spatial index."""
+        return self.spatial_index().positions(left, top, width, height)
 
     def __copy__(self) -> BaseUniverseType:
         """Returns a shallow copy of the universe."""
@@ -86,20 +173,19 @@ class BaseUniverse(Universe[T]):
 
         if value is None:
             self._data.pop(adjusted_position, None)
+
+            if self._index is not None:
+                self._index.remove(adjusted_position)
             return
 
         self._data[adjusted_position] = value
 
+        if self._index is not None:
+            self._index.add(adjusted_position)
+
     def __str__(self) -> str:
         """Returns a string representation of the universe."""
-        def to_str(i): return str(i or ' ')
-
-        rows = ((to_str(self[x, y]) for x in range(self.width))
-                                    for y in range(self.height))
-
-        result = '\n'.join((' '.join(row) for row in rows))
-
-        return result
+        return render(self)
 
     def __eq__(self, other: 'BaseUniverse[T]') -> bool:
         """Indicates whether the universe equals to another universe."""
@@ -123,11 +209,71 @@ class BaseUniverse(Universe[T]):
         return universe
 
     @classmethod
-    def random(cls, width: int, height: int, get_random: Callable[[], T]) -> BaseUniverseType:
-        """Creates a random universe of the specified dimensions."""
+    def random(cls, width: int, height: int, get_random: Callable[[], T], probability: float=None,
+               seed: int=None) -> BaseUniverseType:
+        """
+        Creates a random universe of the specified dimensions.
+        By default, 'get_random' is called for every position and returns a cell or 'None'.
+        With a probability, alive positions are drawn at once from a NumPy generator with the seed,
+        and 'get_random' is called only to create cells at them, such as 'Cell.shared'.
+        """
         universe = cls(width, height)
 
-        for x, y in universe.through():
-            universe[x, y] = get_random()
+        if probability is None:
+            for x, y in universe.through():
+                universe[x, y] = get_random()
+
+            return universe
+
+        if not 0 <= probability <= 1:
+            raise ValueError('probability is not between 0 and 1.')
+
+        ys, xs = numpy.nonzero(numpy.random.default_rng(seed).random((height, width)) < probability)
+        positions = zip(xs.tolist(), ys.tolist())
+
+        if type(universe).__setitem__ is BaseUniverse.__setitem__:
+            # Drawn positions are within the universe, so they are written without adjusting them.
+            universe._data = {position: get_random() for position in positions}
+        else:
+            for position in positions:
+                universe[position] = get_random()
 
         return universe
+
+
+def neighbour_table_of(cls: type, width: int, height: int) -> Optional[NeighbourTable]:
+    """
+    Returns the neighbour table of a universe of the class or 'None' if neighbours must be found
+    with 'adjust_position' and 'is_position_in_range', because the class redefines its edges.
+    """
+    return neighbour_table(width, height, cls.wraps) if has_own_edges(cls) else None
+
+
+@lru_cache(maxsize=None)
+def has_own_edges(cls: type) -> bool:
+    """Indicates whether edges of the class are the ones of the class that sets 'wraps'."""
+    owner = next(base for base in cls.__mro__ if 'wraps' in vars(base))
+
+    return owner.wraps is not None and cls.adjust_position is owner.adjust_position \
+        and cls.is_position_in_range is owner.is_position_in_range
+
+
+@lru_cache(maxsize=64)
+def neighbour_table(width: int, height: int, wrapped: bool) -> NeighbourTable:
+    """
+    Returns neighbour columns of every column and neighbour rows of every row of a universe
+    as (previous, itself, next) with 'None' beyond edges, along with spans of them within the universe.
+    Tables hold O(width + height) positions and are shared by all universes of the same size and topology.
+    """
+    def around(i, size):
+        if wrapped:
+            return (i - 1) % size, i, (i + 1) % size
+
+        return i - 1 if i > 0 else None, i, i + 1 if i < size - 1 else None
+
+    columns = tuple(around(x, width) for x in range(width))
+    rows = tuple(around(y, height) for y in range(height))
+
+    def spans_of(neighbours): return tuple(tuple(i for i in n if i is not None) for n in neighbours)
+
+    return NeighbourTable(columns, rows, spans_of(columns), spans_of(rows))
@@ -0,0 +1,140 @@
+from abc import ABCMeta, abstractmethod
+from typing import Callable, Iterable, Type, TypeVar, Tuple
+from ..renderer import render
+from ..universe import Universe
+
+
+T = TypeVar('T')
+BitPackedUniverseType = TypeVar('BitPackedUniverseType', bound='BitPackedUniverse')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+
+class BitPackedUniverse(Universe[bool]):
+    """
+    Represents a base class for bit-packed universes of 'The Game of Life'.
+    The bit-packed universe holds one bit per cell: every row is an integer where bit x is the cell at x.
+    Alive cells are returned as 'True' and dead cells as 'None', since no cell objects are kept.
+    Subclasses define 'wrapped' to indicate whether rows and columns wrap around.
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, width: int, height: int):
+        if width <= 0:
+            raise ValueError('width is zero or a negative number.')
+
+        if height <= 0:
+            raise ValueError('height is zero or a negative number.')
+
+        self._width = width
+        self._height = height
+        self._rows = [0] * height
+
+    @property
+    def width(self) -> int:
+        """Returns universe width."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Returns universe height."""
+        return self._height
+
+    @property
+    def population(self) -> int:
+        """Returns the number of alive cells."""
+        return sum(bin(row).count('1') for row in self._rows if row)
+
+    @abstractmethod
+    def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
+        """Returns the universe position."""
+        pass
+
+    @abstractmethod
+    def is_position_in_range(self, x: int, y: int) -> bool:
+        """Indicates whether the specified position is within the universe boundaries."""
+        pass
+
+    def through(self) -> Tuple[int, int]:
+        """Returns a new iterator that can iterate over universe positions."""
+        return ((x, y) for y in range(self.height)
+                       for x in range(self.width))
+
+    def alive(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of alive cells only."""
+        for y, row in enumerate(self._rows):
+            while row:
+                lowest = row & -row
+                row ^= lowest
+
+                yield lowest.bit_length() - 1, y
+
+    def neighbours_of(self, x: int, y: int) -> Iterable[bool]:
+        """Returns a new iterator that can iterate over neighbours around the specified position."""
+        positions = [
+            (x - 1, y - 1),  # NE
+            (x, y - 1),      # N
+            (x + 1, y - 1),  # NW
+            (x + 1, y),      # W
+            (x + 1, y + 1),  # SW
+            (x, y + 1),      # S
+            (x - 1, y + 1),  # SE
+            (x - 1, y)       # E
+        ]
+
+        return (self[position] for position in positions if self.is_position_in_range(*position))
+
+    def __copy__(self) -> BitPackedUniverseType:
+        """Returns a shallow copy of the universe."""
+        copy = type(self)(self.width, self.height)
+
+        copy._rows = self._rows.copy()
+
+        return copy
+
+    def __getitem__(self, position: Tuple[int, int]) -> bool:
+        """Returns 'True' for an alive cell or 'None' for a dead one using self[x, y]."""
+        x, y = self.adjust_position(*position)
+
+        return True if self._rows[y] >> x & 1 else None
+
+    def __setitem__(self, position: Tuple[int, int], value: T):
+        """Sets the cell alive for any value except of 'None' using self[x, y]."""
+        x, y = self.adjust_position(*position)
+
+        if value is None:
+            self._rows[y] &= ~(1 << x)
+            return
+
+        self._rows[y] |= 1 << x
+
+    def __str__(self) -> str:
+        """Returns a string representation of the universe."""
+        return render(self)
+
+    def __eq__(self, other: 'BitPackedUniverse') -> bool:
+        """Indicates whether the universe equals to another universe."""
+        eq = self._rows == other._rows
+
+        return eq
+
+    @classmethod
+    def from_universe(cls, universe: Universe[T]) -> BitPackedUniverseType:
+        """
+        Creates a bit-packed universe from any universe-like object.
+        Any cell except of 'None' is considered as alive.
+        """
+        bit_packed = cls(universe.width, universe.height)
+
+        for x, y in universe.alive():
+            bit_packed._rows[y] |= 1 << x
+
+        return bit_packed
+
+    def to_universe(self, cls: Type[UniverseType], regenerate: Callable[[], T]) -> UniverseType:
+        """Creates a universe of the specified type with a new cell for every alive bit."""
+        universe = cls(self.width, self.height)
+
+        for position in self.alive():
+            universe[position] = regenerate()
+
+        return universe
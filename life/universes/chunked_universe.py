@@ -0,0 +1,118 @@
+from abc import ABCMeta
+from typing import List, Optional, TypeVar, Tuple
+import numpy
+from ..rules import state_of
+from ..universes.base_universe import BaseUniverse
+
+
+T = TypeVar('T')
+ChunkedUniverseType = TypeVar('ChunkedUniverseType', bound='ChunkedUniverse[T]')
+
+
+class ChunkedUniverse(BaseUniverse[T]):
+    """
+    Represents a base class for chunked universes of 'The Game of Life'.
+    The chunked universe splits the plane into chunks of 'chunk_size' x 'chunk_size' cells,
+    and keeps states of cells of every non-empty chunk in its own NumPy array.
+    Chunks that are awake must be computed on the next generation: a chunk wakes up when a cell in it changes
+    or when a change reaches its halo, the border of a neighbouring chunk. Other chunks are asleep.
+    Chunk arrays are shared between copies of the universe and copied on the first write.
+    The sparse grid of the base universe is kept as a side table that maps positions to cells.
+    """
+    __metaclass__ = ABCMeta
+
+    chunk_size = 64
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+
+        self._chunks = dict()
+        self._owned = set()
+        self._awake = set()
+
+    @property
+    def columns(self) -> int:
+        """Returns the number of columns of chunks."""
+        return -(-self.width // self.chunk_size)
+
+    @property
+    def rows(self) -> int:
+        """Returns the number of rows of chunks."""
+        return -(-self.height // self.chunk_size)
+
+    def chunk_shape(self, cx: int, cy: int) -> Tuple[int, int]:
+        """Returns the height and the width of the chunk, which are smaller for chunks at the right and the bottom."""
+        size = self.chunk_size
+
+        return min(size, self.height - cy * size), min(size, self.width - cx * size)
+
+    def neighbour_chunk(self, cx: int, cy: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+        """Returns the chunk next to the chunk in the direction or 'None' if it is beyond edges of the universe."""
+        if self.is_position_in_range(-1, -1):
+            return (cx + dx) % self.columns, (cy + dy) % self.rows
+
+        if 0 <= cx + dx < self.columns and 0 <= cy + dy < self.rows:
+            return cx + dx, cy + dy
+
+        return None
+
+    def neighbour_chunks(self, cx: int, cy: int) -> List[Tuple[int, int]]:
+        """Returns chunks around the chunk."""
+        chunks = (self.neighbour_chunk(cx, cy, dx, dy) for dy in (-1, 0, 1)
+                                                        for dx in (-1, 0, 1) if dx or dy)
+
+        return [chunk for chunk in chunks if chunk is not None]
+
+    def padded_chunk(self, cx: int, cy: int) -> numpy.ndarray:
+        """Returns states of the chunk surrounded by a one-cell halo of states of neighbouring chunks."""
+        size = self.chunk_size
+        height, width = self.chunk_shape(cx, cy)
+        left, top = cx * size, cy * size
+
+        padded = numpy.zeros((height + 2, width + 2), dtype=numpy.uint8)
+
+        # Every piece of the halo lies within a single chunk, since the halo is one cell wide.
+        columns = ((left - 1, 1, 0), (left, width, 1), (left + width, 1, width + 1))
+        rows = ((top - 1, 1, 0), (top, height, 1), (top + height, 1, height + 1))
+
+        for y, piece_height, padded_y in rows:
+            for x, piece_width, padded_x in columns:
+                if not self.is_position_in_range(x, y):
+                    continue
+
+                x, y = self.adjust_position(x, y)
+                chunk = self._chunks.get((x // size, y // size), None)
+
+                if chunk is not None:
+                    padded[padded_y:padded_y + piece_height, padded_x:padded_x + piece_width] = \
+                        chunk[y % size:y % size + piece_height, x % size:x % size + piece_width]
+
+        return padded
+
+    def __copy__(self) -> ChunkedUniverseType:
+        """Returns a shallow copy of the universe. Both universes copy shared chunks on the next write to them."""
+        copy = super().__copy__()
+
+        copy._chunks = self._chunks.copy()
+        copy._awake = self._awake.copy()
+        self._owned = set()
+
+        return copy
+
+    def __setitem__(self, position: Tuple[int, int], value: T):
+        """Sets the value for the specified position using self[x, y] and wakes the chunk and its neighbours."""
+        super().__setitem__(position, value)
+
+        x, y = self.adjust_position(*position)
+        size = self.chunk_size
+        key = x // size, y // size
+
+        if key not in self._owned:
+            chunk = self._chunks.get(key, None)
+            self._chunks[key] = chunk.copy() if chunk is not None else numpy.zeros(self.chunk_shape(*key), numpy.uint8)
+            self._owned.add(key)
+
+        self._chunks[key][y % size, x % size] = state_of(value)
+
+        self._awake.add(key)
+        self._awake.update(self.neighbour_chunks(*key))
@@ -0,0 +1,13 @@
+from typing import TypeVar
+from ..universes.chunked_universe import ChunkedUniverse
+from ..universes.closed_universe import ClosedUniverse
+
+
+T = TypeVar('T')
+
+
+class ClosedChunkedUniverse(ChunkedUniverse[T], ClosedUniverse[T]):
+    """
+    Represents the closed chunked universe of 'The Game of Life'.
+    The universe has edges beyond which no cells can exist.
+    """
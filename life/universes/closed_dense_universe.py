@@ -0,0 +1,14 @@
+from typing import TypeVar
+from ..universes.closed_universe import ClosedUniverse
+from ..universes.dense_universe import DenseUniverse
+
+
+T = TypeVar('T')
+
+
+class ClosedDenseUniverse(DenseUniverse[T], ClosedUniverse[T]):
+    """
+    Represents the closed dense universe of 'The Game of Life'.
+    The universe has edges beyond which no cells can exist.
+    """
+    padding = 'constant'
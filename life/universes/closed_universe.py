@@ -10,6 +10,7 @@ class ClosedUniverse(BaseUniverse[T]):
     Represents the closed universe of 'The Game of Life'.
     The universe has edges beyond which no cells can exist.
     """
+    wraps = False
 
     def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
         """Returns the universe position."""
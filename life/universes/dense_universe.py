@@ -0,0 +1,40 @@
+from abc import ABCMeta
+from typing import TypeVar, Tuple
+import numpy
+from ..rules import state_of
+from ..universes.base_universe import BaseUniverse
+
+
+T = TypeVar('T')
+DenseUniverseType = TypeVar('DenseUniverseType', bound='DenseUniverse[T]')
+
+
+class DenseUniverse(BaseUniverse[T]):
+    """
+    Represents a base class for dense universes of 'The Game of Life'.
+    The dense universe keeps states of cells in a NumPy array to compute a generation with vectorized operations.
+    A state is 0 for a dead cell, 1 for an alive cell and the state of a dying cell under 'Generations' rules.
+    The sparse grid of the base universe is kept as a side table that maps positions to cells.
+    Subclasses define 'padding' as a 'numpy.pad' mode that reproduces their edges.
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+
+        self._states = numpy.zeros((height, width), dtype=numpy.uint8)
+
+    def __copy__(self) -> DenseUniverseType:
+        """Returns a shallow copy of the universe."""
+        copy = super().__copy__()
+
+        copy._states = self._states.copy()
+
+        return copy
+
+    def __setitem__(self, position: Tuple[int, int], value: T):
+        """Sets the value for the specified position using self[x, y]."""
+        super().__setitem__(position, value)
+
+        x, y = self.adjust_position(*position)
+        self._states[y, x] = state_of(value)
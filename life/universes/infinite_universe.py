@@ -0,0 +1,207 @@
+from typing import Callable, Iterable, List, Optional, Type, TypeVar, Tuple
+from ..renderer import render
+from ..universe import Universe
+from ..universes.base_universe import BaseUniverse
+from ..universes.closed_universe import ClosedUniverse
+
+
+T = TypeVar('T')
+InfiniteUniverseType = TypeVar('InfiniteUniverseType', bound='InfiniteUniverse[T]')
+UniverseType = TypeVar('UniverseType', bound='Universe[T]')
+
+
+class InfiniteUniverse(BaseUniverse[T]):
+    """
+    Represents the infinite universe of 'The Game of Life'.
+    The universe has no edges: cells can exist at any integer position, including negative ones.
+    The bounding box of occupied positions is tracked incrementally: it grows with every set cell
+    and is recomputed only on demand after a cell on its edge is removed.
+    The width, the height, iteration and rendering are limited to the bounding box or a viewport,
+    so the cost is proportional to the population rather than to the space a pattern has travelled.
+    Dimensions can be passed like to bounded universes, so code that creates a universe of the same class
+    with 'cls(width, height)' works, but they are ignored: the universe starts empty and unbounded.
+    """
+
+    def __init__(self, width: int=None, height: int=None):
+        self._data = dict()
+        self._neighbours = None
+        self._index = None
+        self._bounds = None
+        self._is_bounds_valid = True
+
+    @property
+    def width(self) -> int:
+        """Returns the width of the bounding box."""
+        bounds = self.bounds
+
+        return bounds[2] - bounds[0] + 1 if bounds else 0
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the bounding box."""
+        bounds = self.bounds
+
+        return bounds[3] - bounds[1] + 1 if bounds else 0
+
+    @property
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """Returns the bounding box of occupied positions as (left, top, right, bottom) or 'None' if it is empty."""
+        if not self._is_bounds_valid:
+            self._bounds = bounds_of(self._data)
+            self._is_bounds_valid = True
+
+        return self._bounds
+
+    def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
+        """Returns the universe position."""
+        return x, y
+
+    def is_position_in_range(self, x: int, y: int) -> bool:
+        """Always returns true since the universe has no edges."""
+        return True
+
+    def through(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of the bounding box."""
+        bounds = self.bounds
+
+        if bounds is None:
+            return iter(())
+
+        left, top, right, bottom = bounds
+
+        return ((x, y) for y in range(top, bottom + 1)
+                       for x in range(left, right + 1))
+
+    def __copy__(self) -> InfiniteUniverseType:
+        """Returns a shallow copy of the universe."""
+        copy = type(self)()
+
+        copy._data = self._data.copy()
+        copy._bounds = self._bounds
+        copy._is_bounds_valid = self._is_bounds_valid
+
+        return copy
+
+    def __setitem__(self, position: Tuple[int, int], value: T):
+        """Sets the value for the specified position using self[x, y]."""
+        x, y = position
+
+        if self._index is not None:
+            if value is None:
+                self._index.remove(position)
+            else:
+                self._index.add(position)
+
+        if value is None:
+            if self._data.pop(position, None) is not None and self._is_bounds_valid:
+                left, top, right, bottom = self._bounds
+
+                # Only removing a cell on the edge can shrink the bounding box.
+                self._is_bounds_valid = x not in (left, right) and y not in (top, bottom)
+            return
+
+        self._data[position] = value
+
+        if not self._is_bounds_valid:
+            return
+
+        if self._bounds is None:
+            self._bounds = x, y, x, y
+        else:
+            left, top, right, bottom = self._bounds
+            self._bounds = min(left, x), min(top, y), max(right, x), max(bottom, y)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the bounding box."""
+        bounds = self.bounds
+
+        if bounds is None:
+            return ''
+
+        left, top, right, bottom = bounds
+
+        return self.render(left, top, right - left + 1, bottom - top + 1)
+
+    def render(self, left: int, top: int, width: int, height: int, scale: int=1) -> str:
+        """Returns a string representation of the viewport of the specified size at (left, top)."""
+        return render(self, (left, top, width, height), scale)
+
+    def to_universe(self, cls: Type[UniverseType]=ClosedUniverse,
+                    viewport: Tuple[int, int, int, int]=None) -> UniverseType:
+        """
+        Creates a bounded universe of the specified type from cells in the viewport (left, top, width, height)
+        or in the bounding box by default, so that it can be rendered or serialized.
+        The universe of an empty bounding box is a single cell at (0, 0).
+        """
+        if viewport is None:
+            bounds = self.bounds or (0, 0, 0, 0)
+            viewport = bounds[0], bounds[1], bounds[2] - bounds[0] + 1, bounds[3] - bounds[1] + 1
+
+        left, top, width, height = viewport
+        universe = cls(width, height)
+
+        for (x, y), cell in self._data.items():
+            if left <= x < left + width and top <= y < top + height:
+                universe[x - left, y - top] = cell
+
+        return universe
+
+    @classmethod
+    def from_universe(cls, universe: Universe[T], left: int=0, top: int=0) -> InfiniteUniverseType:
+        """Creates an infinite universe with cells of a universe-like object placed at (left, top)."""
+        infinite = cls()
+
+        for x, y in universe.alive():
+            infinite[left + x, top + y] = universe[x, y]
+
+        return infinite
+
+    @classmethod
+    def from_data(cls, data: List[List[T]], is_cell: Callable[[T], bool]=lambda cell: cell) -> InfiniteUniverseType:
+        """
+        Creates a universe from a 2-deminsiomal list with the top left corner at (0, 0).
+        By default, create cells only for values which boolean is True.
+        """
+        universe = cls()
+
+        for y, row in enumerate(data):
+            for x, value in enumerate(row):
+                if is_cell(value):
+                    universe[x, y] = value
+
+        return universe
+
+    @classmethod
+    def random(cls, width: int, height: int, get_random: Callable[[], T], probability: float=None,
+               seed: int=None) -> InfiniteUniverseType:
+        """
+        Creates a universe with random cells in the area of the specified dimensions at (0, 0).
+        With a probability, alive positions are drawn at once as in 'BaseUniverse.random'.
+        """
+        if width <= 0:
+            raise ValueError('width is zero or a negative number.')
+
+        if height <= 0:
+            raise ValueError('height is zero or a negative number.')
+
+        if probability is not None:
+            return cls.from_universe(ClosedUniverse.random(width, height, get_random, probability, seed))
+
+        universe = cls()
+
+        for y in range(height):
+            for x in range(width):
+                universe[x, y] = get_random()
+
+        return universe
+
+
+def bounds_of(data: Iterable[Tuple[int, int]]) -> Optional[Tuple[int, int, int, int]]:
+    """Returns the bounding box of positions as (left, top, right, bottom) or 'None' if there are none."""
+    if not data:
+        return None
+
+    xs = [x for x, _ in data]
+    ys = [y for _, y in data]
+
+    return min(xs), min(ys), max(xs), max(ys)
@@ -0,0 +1,21 @@
+from typing import Tuple
+from ..universes.bit_packed_universe import BitPackedUniverse
+
+
+class WrappedBitPackedUniverse(BitPackedUniverse):
+    """
+    Represents the wrapped bit-packed universe of 'The Game of Life'.
+    The edges of the universe wrap around, so that the top is connected to the bottom,
+    and the right is connected to the left.
+    """
+    wrapped = True
+
+    def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
+        """Returns an adjusted position for the wrapped universe."""
+        adjusted_position = x % self.width, y % self.height
+
+        return adjusted_position
+
+    def is_position_in_range(self, x: int, y: int) -> bool:
+        """Always returns true since edges of the universe wrap around."""
+        return True
@@ -0,0 +1,14 @@
+from typing import TypeVar
+from ..universes.chunked_universe import ChunkedUniverse
+from ..universes.wrapped_universe import WrappedUniverse
+
+
+T = TypeVar('T')
+
+
+class WrappedChunkedUniverse(ChunkedUniverse[T], WrappedUniverse[T]):
+    """
+    Represents the wrapped chunked universe of 'The Game of Life'.
+    The edges of the universe wrap around, so that the top is connected to the bottom,
+    and the right is connected to the left.
+    """
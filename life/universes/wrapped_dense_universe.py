@@ -0,0 +1,15 @@
+from typing import TypeVar
+from ..universes.dense_universe import DenseUniverse
+from ..universes.wrapped_universe import WrappedUniverse
+
+
+T = TypeVar('T')
+
+
+class WrappedDenseUniverse(DenseUniverse[T], WrappedUniverse[T]):
+    """
+    Represents the wrapped dense universe of 'The Game of Life'.
+    The edges of the universe wrap around, so that the top is connected to the bottom,
+    and the right is connected to the left.
+    """
+    padding = 'wrap'
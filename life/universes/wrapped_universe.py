@@ -11,6 +11,7 @@ class WrappedUniverse(BaseUniverse[T]):
     The edges of the universe wrap around, so that the top is connected to the bottom,
     and the right is connected to the left.
     """
+    wraps = True
 
     def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
         """Returns an adjusted position for the closed universe."""
@@ -0,0 +1,7 @@
+__all__ = ['View', 'TranslatedView', 'WindowView', 'WrappedView']
+
+
+from .view import View
+from .translated_view import TranslatedView
+from .window_view import WindowView
+from .wrapped_view import WrappedView
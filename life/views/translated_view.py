@@ -0,0 +1,65 @@
+from typing import Optional, TypeVar, Tuple
+from ..universe import Universe
+from .view import View
+
+
+T = TypeVar('T')
+
+
+class TranslatedView(View[T]):
+    """
+    Represents a universe moved by (dx, dy): the cell at (x, y) of the universe is at (x + dx, y + dy) of the view.
+    The view has the size of the universe. Positions are mapped back with 'adjust_position' of the universe
+    when it has one, so a wrapped universe is rotated around its edges, while cells of a closed universe
+    that are moved beyond its edges are not seen. Edges of the view of a wrapped universe wrap around as well,
+    so neighbours of edge cells are found on the opposite edges when the view is stepped.
+    """
+
+    def __init__(self, universe: Universe[T], dx: int, dy: int):
+        super().__init__(universe)
+
+        self.dx = dx
+        self.dy = dy
+        self.wraps = adjusted(universe, -1, -1) not in (None, (-1, -1))
+
+    @property
+    def width(self) -> int:
+        """Returns the width of the universe."""
+        return self.universe.width
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the universe."""
+        return self.universe.height
+
+    def is_position_in_range(self, x: int, y: int) -> bool:
+        """Indicates whether the specified position is within the view boundaries, which any is when they wrap."""
+        return self.wraps or super().is_position_in_range(x, y)
+
+    def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
+        """Returns the position wrapped around edges of the view when they wrap."""
+        return (x % self.width, y % self.height) if self.wraps else (x, y)
+
+    def source_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the universe or 'None' if it is beyond edges of the universe."""
+        if not self.is_position_in_range(x, y):
+            return None
+
+        return adjusted(self.universe, x - self.dx, y - self.dy)
+
+    def view_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the view or 'None' if it is beyond edges of the view."""
+        position = adjusted(self.universe, x + self.dx, y + self.dy)
+
+        return position if position is not None and super().is_position_in_range(*position) else None
+
+
+def adjusted(universe: Universe[T], x: int, y: int) -> Optional[Tuple[int, int]]:
+    """Returns the position adjusted by the universe or 'None' if it is beyond edges of the universe."""
+    if hasattr(universe, 'is_position_in_range') and not universe.is_position_in_range(x, y):
+        return None
+
+    if hasattr(universe, 'adjust_position'):
+        return universe.adjust_position(x, y)
+
+    return (x, y) if 0 <= x < universe.width and 0 <= y < universe.height else None
@@ -0,0 +1,99 @@
+from abc import ABCMeta, abstractmethod
+from copy import copy
+from typing import Iterable, List, Optional, TypeVar, Tuple
+from ..renderer import render
+from ..universe import Universe
+from ..universes.base_universe import OFFSETS
+
+
+T = TypeVar('T')
+ViewType = TypeVar('ViewType', bound='View[T]')
+
+
+class View(Universe[T]):
+    """
+    Represents a base class for lazy views of a universe.
+    A view maps its positions to positions of the universe: nothing is copied,
+    reads and writes go through to the universe, and changes of the universe are seen by the view.
+    A copy of a view is the same view of a copy of the universe, so a view can be stepped by any engine
+    that works with universe-like objects.
+    """
+    __metaclass__ = ABCMeta
+
+    def __init__(self, universe: Universe[T]):
+        self.universe = universe
+
+    @abstractmethod
+    def source_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the universe that the position of the view maps to or 'None' if there is none."""
+        pass
+
+    @abstractmethod
+    def view_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the view that a position of the universe maps to or 'None' if there is none."""
+        pass
+
+    def is_position_in_range(self, x: int, y: int) -> bool:
+        """Indicates whether the specified position is within the view boundaries."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def through(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of the view."""
+        return ((x, y) for y in range(self.height)
+                       for x in range(self.width))
+
+    def alive(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of alive cells of the view."""
+        positions = (self.view_of(*position) for position in self.universe.alive())
+
+        return (position for position in positions if position is not None)
+
+    def population_in(self, left: int, top: int, width: int, height: int) -> int:
+        """Returns the number of occupied positions in the rectangle of the view."""
+        return len(self.alive_in(left, top, width, height))
+
+    def alive_in(self, left: int, top: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """Returns occupied positions in the rectangle of the view."""
+        return [(x, y) for x, y in self.alive() if left <= x < left + width and top <= y < top + height]
+
+    def neighbours_of(self, x: int, y: int) -> Iterable[T]:
+        """Returns a new iterator that can iterate over neighbours around the specified position."""
+        positions = ((x + dx, y + dy) for dx, dy in OFFSETS)
+
+        return (self[position] for position in positions if self.is_position_in_range(*position))
+
+    def __copy__(self) -> ViewType:
+        """Returns the same view of a shallow copy of the universe."""
+        view = type(self).__new__(type(self))
+        view.__dict__.update(self.__dict__)
+        view.universe = copy(self.universe)
+
+        return view
+
+    def __getitem__(self, position: Tuple[int, int]) -> T:
+        """Returns a value for the specified position using self[x, y]."""
+        source = self.source_of(*position)
+
+        return None if source is None else self.universe[source]
+
+    def __setitem__(self, position: Tuple[int, int], value: T):
+        """Sets the value for the specified position of the universe using self[x, y]."""
+        source = self.source_of(*position)
+
+        if source is None:
+            raise IndexError()
+
+        self.universe[source] = value
+
+    def __str__(self) -> str:
+        """Returns a string representation of the view."""
+        return render(self)
+
+    def __eq__(self, other: Universe[T]) -> bool:
+        """Indicates whether the view has the same cells as another universe-like object."""
+        if (self.width, self.height) != (other.width, other.height):
+            return False
+
+        cells = {position: self[position] for position in self.alive()}
+
+        return cells == {position: other[position] for position in other.alive()}
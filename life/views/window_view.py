@@ -0,0 +1,90 @@
+from typing import Iterable, List, Optional, TypeVar, Tuple
+from ..universe import Universe
+from ..universes.infinite_universe import InfiniteUniverse
+from .view import View
+
+
+T = TypeVar('T')
+
+
+class WindowView(View[T]):
+    """
+    Represents a rectangular window of a universe at (left, top) with its own origin at the top left corner.
+    The window has edges like a closed universe and lies within the universe unless the universe is infinite.
+    Alive cells and region queries of the window use region queries of the universe when it has them,
+    such as the spatial index of 'BaseUniverse', so a small window of a huge universe costs
+    as much as the cells in the window.
+    """
+
+    def __init__(self, universe: Universe[T], left: int, top: int, width: int, height: int):
+        if width <= 0:
+            raise ValueError('width is zero or a negative number.')
+
+        if height <= 0:
+            raise ValueError('height is zero or a negative number.')
+
+        is_inside = 0 <= left and 0 <= top and left + width <= universe.width and top + height <= universe.height
+
+        if not isinstance(universe, InfiniteUniverse) and not is_inside:
+            raise ValueError('window is beyond edges of the universe.')
+
+        super().__init__(universe)
+
+        self.left = left
+        self.top = top
+        self._width = width
+        self._height = height
+
+    @property
+    def width(self) -> int:
+        """Returns the width of the window."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the window."""
+        return self._height
+
+    def source_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the universe or 'None' if the position is beyond the window."""
+        if not self.is_position_in_range(x, y):
+            return None
+
+        return self.left + x, self.top + y
+
+    def view_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the window or 'None' if the position of the universe is beyond the window."""
+        x, y = x - self.left, y - self.top
+
+        return (x, y) if self.is_position_in_range(x, y) else None
+
+    def alive(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of alive cells of the window."""
+        return iter(self.alive_in(0, 0, self.width, self.height))
+
+    def alive_in(self, left: int, top: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """Returns occupied positions in the rectangle of the window."""
+        left, top, width, height = self._clip(left, top, width, height)
+
+        if not hasattr(self.universe, 'alive_in'):
+            # Alive cells of the window are found by the rectangle, so they are filtered from the universe instead.
+            return [(x, y) for x, y in super().alive() if left <= x < left + width and top <= y < top + height]
+
+        return [(x - self.left, y - self.top)
+                for x, y in self.universe.alive_in(self.left + left, self.top + top, width, height)]
+
+    def population_in(self, left: int, top: int, width: int, height: int) -> int:
+        """Returns the number of occupied positions in the rectangle of the window."""
+        left, top, width, height = self._clip(left, top, width, height)
+
+        if not hasattr(self.universe, 'population_in'):
+            return len(self.alive_in(left, top, width, height))
+
+        return self.universe.population_in(self.left + left, self.top + top, width, height)
+
+    def _clip(self, left: int, top: int, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Returns the rectangle clipped by edges of the window."""
+        right, bottom = min(left + width, self.width), min(top + height, self.height)
+        left, top = max(left, 0), max(top, 0)
+
+        return left, top, max(right - left, 0), max(bottom - top, 0)
@@ -0,0 +1,56 @@
+from typing import Iterable, List, Optional, TypeVar, Tuple
+from .view import View
+
+
+T = TypeVar('T')
+
+
+class WrappedView(View[T]):
+    """
+    Represents a projection of a universe onto a torus: any position maps to the universe modulo its size,
+    so neighbours of edge cells are found on the opposite edges whatever the topology of the universe is.
+    """
+
+    @property
+    def width(self) -> int:
+        """Returns the width of the universe."""
+        return self.universe.width
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the universe."""
+        return self.universe.height
+
+    def is_position_in_range(self, x: int, y: int) -> bool:
+        """Always returns true since edges of the view wrap around."""
+        return True
+
+    def adjust_position(self, x: int, y: int) -> Tuple[int, int]:
+        """Returns the position wrapped around edges of the view."""
+        return x % self.width, y % self.height
+
+    def source_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the universe wrapped around its edges."""
+        return self.adjust_position(x, y)
+
+    def view_of(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Returns the position of the view, which is the position of the universe."""
+        return x, y
+
+    def alive(self) -> Iterable[Tuple[int, int]]:
+        """Returns a new iterator that can iterate over positions of alive cells of the universe."""
+        return self.universe.alive()
+
+    def alive_in(self, left: int, top: int, width: int, height: int) -> List[Tuple[int, int]]:
+        """Returns occupied positions in the rectangle of the universe."""
+        if not hasattr(self.universe, 'alive_in'):
+            return super().alive_in(left, top, width, height)
+
+        return self.universe.alive_in(left, top, width, height)
+
+    def population_in(self, left: int, top: int, width: int, height: int) -> int:
+        """Returns the number of occupied positions in the rectangle of the universe."""
+        if not hasattr(self.universe, 'population_in'):
+            return super().population_in(left, top, width, height)
+
+        return self.universe.population_in(left, top, width, height)
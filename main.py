@@ -1,24 +1,247 @@
+import argparse
+import asyncio
+import cProfile
 import curses
+import pstats
+import resource
+import sys
 import time
-from life import Cell, originate_from, WrappedUniverse
+from contextlib import ExitStack
+from itertools import islice
+from life import (
+    ActiveEngine, BitPackedEngine, BitPackedUniverse, Broadcaster, Cell, ChunkedEngine, ClosedBitPackedUniverse,
+    ClosedChunkedUniverse, ClosedDenseUniverse, ClosedUniverse, CsvSink, DenseEngine, DoubleBufferedEngine, Driver,
+    HashLifeEngine, InfiniteUniverse, Monitor, ParallelEngine, Recorder, ScanEngine, WrappedBitPackedUniverse,
+    WrappedChunkedUniverse, WrappedDenseUniverse, WrappedUniverse, originate_from, render
+)
 
 
-def main(screen):
-    """Simulates 'The Game of Life' in a terminal using curses."""
+STEPS_PER_SECOND = 4
+FRAMES_PER_SECOND = 30
+INPUT_DELAY = .05
+
+WIDTH = 256
+HEIGHT = 256
+GENERATIONS = 1000
+REPORT_EVERY = 100
+PROFILE_LINES = 20
+
+UNIVERSES = {
+    'closed': ClosedUniverse,
+    'wrapped': WrappedUniverse,
+    'infinite': InfiniteUniverse,
+    'closed-dense': ClosedDenseUniverse,
+    'wrapped-dense': WrappedDenseUniverse,
+    'closed-chunked': ClosedChunkedUniverse,
+    'wrapped-chunked': WrappedChunkedUniverse,
+    'closed-bit-packed': ClosedBitPackedUniverse,
+    'wrapped-bit-packed': WrappedBitPackedUniverse
+}
+
+ENGINES = {
+    'active': ActiveEngine,
+    'bit-packed': BitPackedEngine,
+    'chunked': ChunkedEngine,
+    'dense': DenseEngine,
+    'double-buffered': DoubleBufferedEngine,
+    'hashlife': HashLifeEngine,
+    'parallel': ParallelEngine,
+    'scan': ScanEngine
+}
+
+# Universes that engines can step: bit-packed, dense and chunked engines need their own universes,
+# engines of occupied positions cannot step bit-packed universes and shared arrays have a fixed size.
+BOUNDED_UNIVERSES = ('closed', 'wrapped', 'closed-dense', 'wrapped-dense', 'closed-chunked', 'wrapped-chunked')
+
+ENGINE_UNIVERSES = {
+    'active': BOUNDED_UNIVERSES + ('infinite',),
+    'bit-packed': ('closed-bit-packed', 'wrapped-bit-packed'),
+    'chunked': ('closed-chunked', 'wrapped-chunked'),
+    'dense': ('closed-dense', 'wrapped-dense'),
+    'double-buffered': BOUNDED_UNIVERSES + ('infinite',),
+    'hashlife': tuple(UNIVERSES),
+    'parallel': BOUNDED_UNIVERSES,
+    'scan': tuple(UNIVERSES)
+}
+
+
+def main(screen, arguments):
+    """Simulates 'The Game of Life' in a terminal using curses, press 'q' to quit."""
     curses.curs_set(0)
     curses.start_color()
     curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
+    screen.nodelay(True)
 
     height, width = screen.getmaxyx()[0], screen.getmaxyx()[1] // 2
 
-    universe = WrappedUniverse.random(width, height, Cell.likely)
-    life = originate_from(universe, regenerate=Cell)
+    # Queues of subscriptions are bound to the loop on older versions of Python, so it is set before them.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    # Zoomed out, every glyph shows a block of 'scale x scale' cells.
+    scale = arguments.scale
+    universe = WrappedUniverse.random(width * scale, height * scale, Cell.shared, probability=.5, seed=arguments.seed)
+    driver = Driver(universe, regenerate=Cell.shared, steps_per_second=arguments.steps_per_second)
+
+    subscription = driver.subscribe(frames_per_second=arguments.frames_per_second)
+    consumers = [show(screen, subscription, scale), listen(screen, driver)]
+
+    with ExitStack() as stack:
+        stack.callback(loop.close)
+
+        if arguments.record:
+            # The recorder must not lose generations, so it holds the driver back when it falls behind.
+            file = stack.enter_context(open(arguments.record, 'w'))
+            consumers.append(Recorder(file)(driver.subscribe(maxsize=16, policy='block')))
+
+        if arguments.serve is not None:
+            broadcaster = Broadcaster(driver, frames_per_second=arguments.frames_per_second)
+            loop.run_until_complete(broadcaster.serve(port=arguments.serve))
+            stack.callback(broadcaster.close)
+
+        loop.run_until_complete(asyncio.gather(driver.run(), *consumers))
+
+
+async def show(screen, subscription, scale):
+    """
+    Redraws only cells that were born or died, or the whole shaded frame when zoomed out,
+    no more often than the render rate.
+    """
+    async for frame in subscription:
+        if scale == 1:
+            draw(screen, frame.universe, frame.changes)
+        else:
+            screen.addstr(0, 0, render(frame.universe, scale=scale), curses.color_pair(1))
 
-    for universe in life:
-        screen.addstr(0, 0, str(universe), curses.color_pair(1))
         screen.refresh()
-        time.sleep(.25)
+
+
+async def listen(screen, driver):
+    """Stops the driver once 'q' is pressed."""
+    while screen.getch() != ord('q'):
+        await asyncio.sleep(INPUT_DELAY)
+
+    driver.stop()
+
+
+def draw(screen, universe, changes):
+    """Redraws only cells that were born, died or changed their state."""
+    for x, y in changes.died:
+        screen.addstr(y, x * 2, ' ')
+
+    for x, y in changes.born | changes.changed:
+        screen.addstr(y, x * 2, str(universe[x, y]), curses.color_pair(1))
+
+
+def simulate(arguments):
+    """
+    Simulates without a terminal as fast as possible and reports the population and generations per second
+    every few generations, then the overall rate and the peak memory. With a profile path,
+    statistics of the stepping loop are written there and the slowest functions are printed.
+    """
+    universe = random_universe(UNIVERSES[arguments.universe], arguments.width or WIDTH, arguments.height or HEIGHT,
+                               arguments.probability, arguments.seed)
+    profile = cProfile.Profile() if arguments.profile else None
+
+    with ExitStack() as stack:
+        engine = ENGINES[arguments.engine]() if arguments.engine else None
+        monitor = None
+
+        if isinstance(engine, ParallelEngine):
+            stack.enter_context(engine)
+
+        if arguments.metrics:
+            # Metrics of every generation cost O(population) per generation on top of stepping.
+            monitor = Monitor(CsvSink(stack.enter_context(open(arguments.metrics, 'w', newline=''))))
+
+        life = originate_from(universe, Cell.shared, engine, monitor=monitor)
+        generation, elapsed = 0, 0
+
+        print('{:>12} {:>12} {:>12}'.format('generation', 'population', 'gens/sec'))
+
+        while generation < arguments.generations:
+            count = min(arguments.report_every, arguments.generations - generation)
+            start = time.perf_counter()
+
+            # Only stepping is profiled and timed, reports are not.
+            if profile:
+                profile.enable()
+
+            for universe in islice(life, count):
+                pass
+
+            if profile:
+                profile.disable()
+
+            step = time.perf_counter() - start
+            generation, elapsed = generation + count, elapsed + step
+
+            print('{:>12} {:>12} {:>12.1f}'.format(generation, sum(1 for _ in universe.alive()), count / step))
+
+    print('{} generations in {:.3f} s, {:.1f} gens/sec, peak memory {:.1f} MiB'.format(
+        generation, elapsed, generation / elapsed if elapsed else 0, peak_memory() / 2 ** 20))
+
+    if profile:
+        profile.dump_stats(arguments.profile)
+        pstats.Stats(arguments.profile).sort_stats('cumulative').print_stats(PROFILE_LINES)
+
+
+def random_universe(cls, width, height, probability, seed):
+    """Returns a random universe of the class, a bit-packed one is packed from a random universe with the same edges."""
+    if issubclass(cls, BitPackedUniverse):
+        base = WrappedUniverse if issubclass(cls, WrappedBitPackedUniverse) else ClosedUniverse
+
+        return cls.from_universe(base.random(width, height, Cell.shared, probability=probability, seed=seed))
+
+    return cls.random(width, height, Cell.shared, probability=probability, seed=seed)
+
+
+def peak_memory():
+    """Returns the peak resident memory of the process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes and macOS reports bytes.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def parse(argv):
+    """Returns command line arguments."""
+    parser = argparse.ArgumentParser(description='Simulates \'The Game of Life\' in a terminal.')
+    parser.add_argument('--steps-per-second', type=float, default=STEPS_PER_SECOND, help='step rate')
+    parser.add_argument('--frames-per-second', type=float, default=FRAMES_PER_SECOND, help='render rate')
+    parser.add_argument('--scale', type=int, default=1, help='cells per glyph along each side when zoomed out')
+    parser.add_argument('--record', help='path of a JSON lines file to record changes to')
+    parser.add_argument('--serve', type=int, help='local port to serve changes to viewers on')
+    parser.add_argument('--seed', type=int, help='seed of the random universe')
+
+    headless = parser.add_argument_group('headless', 'simulate without a terminal as fast as possible')
+    headless.add_argument('--headless', action='store_true', help='simulate without a terminal')
+    headless.add_argument('--universe', choices=sorted(UNIVERSES), default='wrapped', help='universe to simulate')
+    headless.add_argument('--width', type=int, help='universe width, {} by default'.format(WIDTH))
+    headless.add_argument('--height', type=int, help='universe height, {} by default'.format(HEIGHT))
+    headless.add_argument('--probability', type=float, default=.5, help='probability of a cell to be alive')
+    headless.add_argument('--engine', choices=sorted(ENGINES), help='engine, chosen by the universe by default')
+    headless.add_argument('--generations', type=int, default=GENERATIONS, help='number of generations')
+    headless.add_argument('--report-every', type=int, default=REPORT_EVERY, help='generations between reports')
+    headless.add_argument('--metrics', help='path of a CSV file to write metrics of every generation to')
+    headless.add_argument('--profile', help='path of a file to write profile statistics of stepping to')
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.report_every <= 0:
+        parser.error('--report-every is zero or a negative number')
+
+    if arguments.engine and arguments.universe not in ENGINE_UNIVERSES[arguments.engine]:
+        parser.error('engine {} does not support universe {}, choose one of: {}'.format(
+            arguments.engine, arguments.universe, ', '.join(sorted(ENGINE_UNIVERSES[arguments.engine]))))
+
+    return arguments
 
 
 if __name__ == '__main__':
-    print(curses.wrapper(main))
+    arguments = parse(sys.argv[1:])
+
+    if arguments.headless:
+        simulate(arguments)
+    else:
+        curses.wrapper(main, arguments)
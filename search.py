@@ -0,0 +1,72 @@
+import argparse
+import sys
+import time
+from life import (
+    ClosedChunkedUniverse, ClosedDenseUniverse, ClosedUniverse, SoupSearch, WrappedChunkedUniverse,
+    WrappedDenseUniverse, WrappedUniverse
+)
+from life.soup_search import CHUNK_SIZE, GENERATIONS
+
+
+UNIVERSES = {
+    'closed': ClosedUniverse,
+    'wrapped': WrappedUniverse,
+    'closed-dense': ClosedDenseUniverse,
+    'wrapped-dense': WrappedDenseUniverse,
+    'closed-chunked': ClosedChunkedUniverse,
+    'wrapped-chunked': WrappedChunkedUniverse
+}
+
+REPORT_INTERVAL = 1
+
+
+def main(arguments):
+    """
+    Runs random soups of a range of seeds on a pool of processes and appends results to a file.
+    Running the same command again resumes the search, seeds that are in the file are skipped.
+    """
+    search = SoupSearch(arguments.results, arguments.width, arguments.height, arguments.generations,
+                        UNIVERSES[arguments.universe], arguments.probability, arguments.workers,
+                        arguments.chunk_size)
+    skipped = len(search.seeds)
+    count, start, reported = 0, time.monotonic(), 0
+
+    try:
+        for _ in search.run(range(arguments.first_seed, arguments.first_seed + arguments.count)):
+            count += 1
+            elapsed = time.monotonic() - start
+
+            if elapsed - reported >= REPORT_INTERVAL:
+                report(count, elapsed)
+                reported = elapsed
+    except KeyboardInterrupt:
+        pass
+
+    report(count, time.monotonic() - start)
+    print('\n{} soups run, {} seeds were already in {}'.format(count, skipped, arguments.results), file=sys.stderr)
+
+
+def report(count, elapsed):
+    """Reports throughput of the search."""
+    print('\r{} soups, {:.1f} soups/sec'.format(count, count / elapsed if elapsed else 0), end='', file=sys.stderr)
+
+
+def parse(argv):
+    """Returns command line arguments."""
+    parser = argparse.ArgumentParser(description='Searches random soups of \'The Game of Life\'.')
+    parser.add_argument('results', help='path of a JSON lines file to append results to and resume from')
+    parser.add_argument('--first-seed', type=int, default=0, help='first seed of the range to search')
+    parser.add_argument('--count', type=int, default=1000, help='number of seeds in the range to search')
+    parser.add_argument('--width', type=int, default=16, help='width of a soup')
+    parser.add_argument('--height', type=int, default=16, help='height of a soup')
+    parser.add_argument('--probability', type=float, default=.5, help='probability of a cell to be alive')
+    parser.add_argument('--generations', type=int, default=GENERATIONS, help='generation cap of a soup')
+    parser.add_argument('--universe', choices=sorted(UNIVERSES), default='wrapped-dense', help='universe of a soup')
+    parser.add_argument('--workers', type=int, help='number of processes, the number of CPUs by default')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='seeds sent to a process at a time')
+
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    main(parse(sys.argv[1:]))
@@ -0,0 +1,89 @@
+import random
+from unittest import TestCase
+from life import BRIANS_BRAIN, CONWAY, ActiveEngine, ClosedUniverse, ScanEngine, WrappedUniverse, changes_between
+
+
+class ActiveEngineTestCase(TestCase):
+    def test_step_blinker(self):
+        universe = ClosedUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        expected_universe = ClosedUniverse.from_data([
+            [0, 0, 0],
+            [1, 1, 1],
+            [0, 0, 0]
+        ])
+
+        next_universe = ActiveEngine().step(universe, lambda: 1)
+
+        self.assertEqual(next_universe, expected_universe)
+        self.assertIsInstance(next_universe, ClosedUniverse)
+
+    def test_step_glider_wraps_around(self):
+        universe = WrappedUniverse.from_data([
+            [0, 0, 0, 1],
+            [1, 0, 0, 1],
+            [0, 0, 0, 0],
+            [0, 0, 0, 1]
+        ])
+
+        expected_universe = ScanEngine().step(universe, lambda: 1)
+        next_universe = ActiveEngine().step(universe, lambda: 1)
+
+        self.assertEqual(next_universe, expected_universe)
+
+    def test_step_matches_scan_engine(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            for width, height in ((1, 1), (2, 3), (5, 5), (16, 9)):
+                universe = cls.random(width, height, lambda: random.choice([1, None]))
+
+                expected_universe = universe
+                actual_universe = universe
+
+                for _ in range(8):
+                    expected_universe = ScanEngine().step(expected_universe, lambda: 1)
+                    actual_universe = ActiveEngine().step(actual_universe, lambda: 1)
+
+                    self.assertEqual(actual_universe, expected_universe)
+
+    def test_step_keeps_surviving_cells(self):
+        universe = ClosedUniverse.from_data([
+            [0, 0, 0, 0],
+            [0, 1, 1, 0],
+            [0, 1, 1, 0],
+            [0, 0, 0, 0]
+        ])
+
+        cell = object()
+        universe[1, 1] = cell
+
+        next_universe = ActiveEngine().step(universe, lambda: 1)
+
+        self.assertIs(next_universe[1, 1], cell)
+
+    def test_transition_matches_changes_between(self):
+        random.seed(42)
+        changed = set()
+
+        for rule in (CONWAY, BRIANS_BRAIN):
+            universe = WrappedUniverse.random(16, 9, lambda: random.choice([1, None]))
+
+            for _ in range(8):
+                next_universe, changes = ActiveEngine().transition(universe, lambda: 1, rule)
+
+                self.assertEqual(next_universe, ActiveEngine().step(universe, lambda: 1, rule))
+                self.assertEqual(changes, changes_between(universe, next_universe))
+
+                changed |= changes.changed
+                universe = next_universe
+
+        self.assertTrue(changed)
+
+
+if __name__ == '__main__':
+    unittest.main()
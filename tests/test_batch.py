@@ -0,0 +1,102 @@
+import random
+from unittest import TestCase
+from life import (
+    BRIANS_BRAIN, ActiveEngine, Batch, ClosedBitPackedUniverse, ClosedUniverse, HIGHLIFE, WrappedUniverse
+)
+
+
+class BatchTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            Batch(0, 1, 1)
+
+        with self.assertRaises(ValueError):
+            Batch(1, 0, 1)
+
+        with self.assertRaises(ValueError):
+            Batch(1, 1, 0)
+
+        batch = Batch(3, 4, 5)
+
+        self.assertEqual((batch.size, batch.width, batch.height), (3, 4, 5))
+        self.assertEqual(batch.population.tolist(), [0, 0, 0])
+
+    def test_step_matches_active_engine(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            for rule in (HIGHLIFE, BRIANS_BRAIN):
+                universes = [cls.random(9, 7, lambda: random.choice([1, None])) for _ in range(5)]
+                batch = Batch.from_universes(universes, rule)
+
+                for _ in range(10):
+                    universes = [ActiveEngine().step(universe, lambda: 1, rule) for universe in universes]
+                    batch.step()
+
+                    for index, universe in enumerate(universes):
+                        if not batch.finished[index]:
+                            self.assertEqual(batch.to_universe(index, lambda: 1), universe)
+
+    def test_termination(self):
+        extinct = ClosedUniverse.from_data([[1, 0, 0], [0, 0, 0], [0, 0, 0]])
+        stable = ClosedUniverse.from_data([[1, 1, 0], [1, 1, 0], [0, 0, 0]])
+        oscillating = ClosedUniverse.from_data([[0, 1, 0], [0, 1, 0], [0, 1, 0]])
+        running = ClosedUniverse.from_data([[0, 1, 0], [0, 1, 1], [1, 0, 0]])
+
+        batch = Batch.from_universes([extinct, stable, oscillating, running])
+
+        batch.step()
+        self.assertEqual(batch.finished.tolist(), [True, True, False, False])
+
+        batch.step()
+        self.assertEqual(batch.finished.tolist(), [True, True, True, False])
+        self.assertEqual(batch.generations.tolist(), [1, 1, 2, 2])
+        self.assertEqual(batch.population.tolist()[:3], [0, 4, 3])
+
+    def test_finished_boards_are_not_stepped(self):
+        batch = Batch.from_universes([ClosedUniverse.from_data([[0, 1, 0], [0, 1, 0], [0, 1, 0]])])
+
+        batch.step()
+        batch.step()
+        batch.step()
+
+        self.assertEqual(batch.generations.tolist(), [2])
+        self.assertEqual(batch.to_universe(0, lambda: 1), ClosedUniverse.from_data([[0, 1, 0], [0, 1, 0], [0, 1, 0]]))
+
+    def test_reseed(self):
+        random.seed(42)
+
+        glider = WrappedUniverse.from_data([
+            [0, 1, 0, 0],
+            [0, 0, 1, 0],
+            [1, 1, 1, 0],
+            [0, 0, 0, 0]
+        ])
+
+        batch = Batch.from_universes([WrappedUniverse(4, 4), glider])
+        states = batch._states
+
+        batch.step()
+        indices = batch.reseed(lambda: 1)
+
+        self.assertEqual(indices.tolist(), [0])
+        self.assertIs(batch._states, states)
+        self.assertEqual(batch.population.tolist()[0], 16)
+        self.assertEqual(batch.generations.tolist(), [0, 1])
+        self.assertFalse(batch.finished.any())
+
+        batch.reseed(lambda: None, [1])
+        self.assertEqual(batch.population.tolist()[1], 0)
+
+    def test_load(self):
+        batch = Batch(1, 3, 1, ClosedUniverse)
+
+        batch.load(0, ClosedBitPackedUniverse.from_universe(ClosedUniverse.from_data([[1, 0, 1]])))
+        self.assertEqual(batch.population.tolist(), [2])
+
+        with self.assertRaises(ValueError):
+            batch.load(0, ClosedUniverse(2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
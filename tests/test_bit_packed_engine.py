@@ -0,0 +1,43 @@
+import random
+from unittest import TestCase
+from life import (
+    ActiveEngine, BitPackedEngine, ClosedBitPackedUniverse, ClosedUniverse, WrappedBitPackedUniverse,
+    WrappedUniverse, originate_from
+)
+
+
+class BitPackedEngineTestCase(TestCase):
+    def test_step_blinker(self):
+        universe = ClosedBitPackedUniverse(3, 3)
+        universe._rows = [0b010, 0b010, 0b010]
+
+        next_universe = BitPackedEngine().step(universe, lambda: 1)
+
+        self.assertEqual(next_universe._rows, [0, 0b111, 0])
+
+    def test_step_matches_active_engine(self):
+        random.seed(42)
+
+        pairs = ((ClosedBitPackedUniverse, ClosedUniverse), (WrappedBitPackedUniverse, WrappedUniverse))
+
+        for bit_packed_cls, cls in pairs:
+            for width, height in ((1, 1), (1, 3), (2, 3), (5, 5), (64, 4), (70, 9)):
+                expected_universe = cls.random(width, height, lambda: random.choice([1, None]))
+                actual_universe = bit_packed_cls.from_universe(expected_universe)
+
+                for _ in range(8):
+                    expected_universe = ActiveEngine().step(expected_universe, lambda: 1)
+                    actual_universe = BitPackedEngine().step(actual_universe, lambda: 1)
+
+                    self.assertEqual(actual_universe.to_universe(cls, lambda: 1), expected_universe)
+
+    def test_originate_from_uses_bit_packed_engine(self):
+        universe = WrappedBitPackedUniverse(3, 3)
+
+        next_universe = next(originate_from(universe, lambda: 1))
+
+        self.assertIsInstance(next_universe, WrappedBitPackedUniverse)
+
+
+if __name__ == '__main__':
+    unittest.main()
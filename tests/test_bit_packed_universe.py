@@ -0,0 +1,96 @@
+from copy import copy
+from unittest import TestCase
+from life import ClosedBitPackedUniverse, ClosedUniverse, WrappedBitPackedUniverse, WrappedUniverse
+
+
+class BitPackedUniverseTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            ClosedBitPackedUniverse(0, 1)
+
+        with self.assertRaises(ValueError):
+            WrappedBitPackedUniverse(1, 0)
+
+    def test_get_item(self):
+        universe = ClosedBitPackedUniverse(3, 2)
+        universe._rows = [0b101, 0b010]
+
+        self.assertTrue(universe[0, 0])
+        self.assertIsNone(universe[1, 0])
+        self.assertTrue(universe[2, 0])
+        self.assertTrue(universe[1, 1])
+
+        with self.assertRaises(IndexError):
+            universe[3, 0]
+
+    def test_set_item(self):
+        universe = WrappedBitPackedUniverse(2, 2)
+
+        universe[0, 0] = 'cell'
+        self.assertTrue(universe[0, 0])
+
+        universe[0, 0] = None
+        self.assertIsNone(universe[0, 0])
+
+        universe[-1, 2] = 1
+        self.assertTrue(universe[1, 0])
+        self.assertEqual(universe._rows, [0b10, 0])
+
+    def test_neighbours_of(self):
+        universe = WrappedBitPackedUniverse(3, 3)
+        universe[0, 0] = 1
+        universe[2, 2] = 1
+
+        self.assertEqual(list(universe.neighbours_of(1, 1)), [True, None, None, None, True, None, None, None])
+
+    def test_alive(self):
+        universe = ClosedBitPackedUniverse(70, 2)
+        universe[0, 0] = 1
+        universe[69, 1] = 1
+
+        self.assertEqual(list(universe.alive()), [(0, 0), (69, 1)])
+        self.assertEqual(universe.population, 2)
+
+    def test_copy(self):
+        universe = ClosedBitPackedUniverse(2, 2)
+        universe[0, 0] = 1
+
+        universe_copy = copy(universe)
+        universe_copy[1, 1] = 1
+
+        self.assertIsNone(universe[1, 1])
+        self.assertTrue(universe_copy[0, 0])
+
+    def test_str(self):
+        universe = ClosedBitPackedUniverse(2, 2)
+        universe[1, 0] = 1
+        universe[0, 1] = 1
+
+        self.assertMultiLineEqual(str(universe), '  *\n*  ')
+
+    def test_from_universe(self):
+        universe = WrappedUniverse.from_data([
+            [0, 1, 0],
+            [1, 0, 1]
+        ])
+
+        bit_packed = WrappedBitPackedUniverse.from_universe(universe)
+
+        self.assertEqual(bit_packed.width, 3)
+        self.assertEqual(bit_packed.height, 2)
+        self.assertEqual(bit_packed._rows, [0b010, 0b101])
+
+    def test_to_universe(self):
+        bit_packed = ClosedBitPackedUniverse(3, 2)
+        bit_packed._rows = [0b010, 0b101]
+
+        universe = bit_packed.to_universe(ClosedUniverse, lambda: 1)
+
+        self.assertEqual(universe, ClosedUniverse.from_data([
+            [0, 1, 0],
+            [1, 0, 1]
+        ]))
+
+
+if __name__ == '__main__':
+    unittest.main()
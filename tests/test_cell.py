@@ -17,6 +17,18 @@ class CellTestCase(TestCase):
         self.assertTrue(0 < cells_count < 10)
         self.assertTrue(0 < none_count < 10)
 
+    def test_slots(self):
+        self.assertFalse(hasattr(Cell(), '__dict__'))
+
+    def test_shared(self):
+        class Subclass(Cell):
+            __slots__ = ()
+
+        self.assertIs(Cell.shared(), Cell.shared())
+        self.assertIsNot(Cell.shared(), Cell())
+        self.assertIsInstance(Subclass.shared(), Subclass)
+        self.assertIsNot(Subclass.shared(), Cell.shared())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,71 @@
+from copy import copy
+from unittest import TestCase
+import numpy
+from life import ActiveEngine, CellPool, ClosedUniverse, PooledCell, WrappedUniverse, originate_from
+
+
+class CellPoolTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            CellPool()
+
+    def test_fields(self):
+        pool = CellPool(age=numpy.uint32, colour=numpy.uint8)
+        first = pool(colour=3)
+        second = pool(age=7)
+
+        self.assertIsInstance(first, PooledCell)
+        self.assertTrue(first)
+        self.assertNotEqual(first, second)
+        self.assertEqual((pool.age[first], pool.colour[first]), (0, 3))
+        self.assertEqual((pool.age[second], pool.colour[second]), (7, 0))
+        self.assertEqual(str(first), '*')
+        self.assertEqual(len(pool), 2)
+        self.assertFalse(hasattr(first, '__dict__'))
+
+        pool.age[first] += 1
+        self.assertEqual(pool.age[first], 1)
+
+        with self.assertRaises(AttributeError):
+            pool.lineage
+
+    def test_grow(self):
+        pool = CellPool(lineage=numpy.int64)
+        cells = [pool(lineage=i) for i in range(5000)]
+
+        self.assertEqual(pool.lineage[numpy.array(cells)].tolist(), list(range(5000)))
+
+    def test_regenerate(self):
+        pool = CellPool(age=numpy.uint16)
+        universe = WrappedUniverse.random(16, 16, pool, probability=.4, seed=1)
+        life = originate_from(universe, pool, ActiveEngine())
+
+        for _ in range(5):
+            universe = next(life)
+            pool.age[pool.cells(universe)] += 1
+
+        self.assertTrue(all(isinstance(universe[position], PooledCell) for position in universe.alive()))
+        self.assertTrue((pool.age[pool.cells(universe)] >= 1).all())
+
+    def test_collect(self):
+        pool = CellPool(age=numpy.uint8)
+        universe = ClosedUniverse(3, 3)
+        universe[0, 0] = pool(age=1)
+        universe[1, 1] = pool(age=2)
+        kept = copy(universe)
+        universe[2, 2] = pool(age=3)
+        universe[0, 0] = None
+
+        self.assertEqual(pool.collect(universe, kept), 0)
+        self.assertEqual(pool.collect(universe), 1)
+        self.assertEqual(len(pool), 2)
+
+        reused = pool()
+
+        self.assertEqual(reused, kept[0, 0])
+        self.assertEqual(pool.age[reused], 0)
+        self.assertEqual(pool.collect(universe), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+from itertools import islice
+from unittest import TestCase
+from life import BRIANS_BRAIN, Census, ClosedUniverse, InfiniteUniverse, WrappedUniverse, clusters_of, originate_from
+from life.census import OBJECTS, canonical, code_of, shape_of
+from life.rules import Dying
+
+
+def draw(universe, rows, left=0, top=0):
+    for y, row in enumerate(rows):
+        for x, char in enumerate(row):
+            if char == '*':
+                universe[left + x, top + y] = 1
+
+    return universe
+
+
+class CensusTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            Census(memo_size=0)
+
+    def test_clusters_of(self):
+        universe = draw(ClosedUniverse(8, 4), ['**....*.', '**....*.', '......*.', '*.......'])
+        clusters = sorted(sorted(positions) for positions in clusters_of(universe))
+
+        self.assertEqual(clusters, [[(0, 0), (0, 1), (1, 0), (1, 1)], [(0, 3)], [(6, 0), (6, 1), (6, 2)]])
+
+    def test_clusters_of_wrapped(self):
+        universe = draw(WrappedUniverse(6, 6), ['*....*', '*....*'])
+
+        self.assertEqual([sorted(positions) for positions in clusters_of(universe)],
+                         [[(5, 0), (5, 1), (6, 0), (6, 1)]])
+
+    def test_clusters_of_skips_dying(self):
+        universe = draw(ClosedUniverse(3, 1), ['**.'])
+        universe[2, 0] = Dying(2)
+
+        self.assertEqual(clusters_of(universe), [[(0, 0), (1, 0)]])
+
+    def test_canonical(self):
+        shapes = {canonical(shape_of(positions)) for positions in (
+            [(0, 0), (1, 0), (2, 0), (2, 1)],
+            [(0, 0), (0, 1), (0, 2), (1, 0)],
+            [(5, 5), (5, 6), (4, 6), (3, 6)],
+            [(1, 0), (1, 1), (1, 2), (0, 2)]
+        )}
+
+        self.assertEqual(len(shapes), 1)
+        self.assertNotEqual(canonical(shape_of([(0, 0), (1, 0), (2, 0)])), shapes.pop())
+        self.assertEqual(code_of(shape_of([(0, 0), (1, 1)])), '*./.*')
+
+    def test_every_phase_of_known_objects(self):
+        census = Census()
+
+        for name, period, rows in OBJECTS:
+            universe = draw(InfiniteUniverse(), rows)
+
+            for phase in islice(originate_from(universe, lambda: 1), period):
+                self.assertEqual(census(phase), {name: 1})
+
+    def test_debris(self):
+        universe = WrappedUniverse(20, 12)
+
+        draw(universe, ['**', '**'], 19, 11)
+        draw(universe, ['.**.', '*..*', '.**.'], 4, 1)
+        draw(universe, ['**..', '*..*', '..**'], 12, 2)
+        draw(universe, ['***'], 3, 8)
+        draw(universe, ['.*.', '..*', '***'], 10, 7)
+        draw(universe, ['.*.', '***'], 16, 8)
+
+        census = Census()
+
+        self.assertEqual(census(universe), {
+            'block': 1, 'beehive': 1, 'aircraft carrier': 1, 'blinker': 1, 'glider': 1, '*./**/*.': 1
+        })
+        objects = [(name, sorted(positions)) for name, positions in census.objects(universe)]
+
+        self.assertIn(('aircraft carrier', [(12, 2), (12, 3), (13, 2), (14, 4), (15, 3), (15, 4)]), objects)
+
+    def test_memo(self):
+        census = Census(memo_size=2)
+        universe = draw(ClosedUniverse(12, 3), ['**.**.**.***', '**.**.**....'])
+
+        self.assertEqual(census(universe), {'block': 3, 'blinker': 1})
+        self.assertEqual(len(census._memo), 2)
+
+        census(draw(ClosedUniverse(4, 4), ['.*..', '*.*.', '.*..']))
+
+        self.assertLessEqual(len(census._memo), 2)
+        self.assertEqual(census.classify([(1, 1), (1, 2), (2, 1), (2, 2)]), 'block')
+
+    def test_soup(self):
+        universe = ClosedUniverse.random(32, 32, lambda: 1, probability=.5, seed=1)
+        universe = list(islice(originate_from(universe, lambda: 1, rule=BRIANS_BRAIN), 5))[-1]
+
+        census = Census()
+
+        self.assertEqual(sum(len(positions) for _, positions in census.objects(universe)),
+                         sum(1 for cell in universe._data.values() if not isinstance(cell, Dying)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import random
+import tempfile
+from unittest import TestCase
+from life import (
+    Checkpoint, ClosedBitPackedUniverse, ClosedUniverse, Dying, InfiniteUniverse, WrappedDenseUniverse,
+    WrappedUniverse, load_checkpoint, save_checkpoint
+)
+
+
+class CheckpointTestCase(TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            # Dense soups are saved as bitmaps and sparse ones as arrays of keys.
+            for alive in (.5, .01):
+                universe = cls.random(37, 23, lambda: 1 if random.random() < alive else None)
+
+                save_checkpoint(universe, self.path, generation=42)
+                actual_universe, generation = load_checkpoint(self.path, lambda: 1)
+
+                self.assertIsInstance(actual_universe, cls)
+                self.assertEqual(actual_universe, universe)
+                self.assertEqual(generation, 42)
+
+    def test_round_trip_other_universes(self):
+        random.seed(42)
+
+        universe = WrappedDenseUniverse.random(9, 7, lambda: random.choice([1, None]))
+        save_checkpoint(universe, self.path)
+        self.assertEqual(load_checkpoint(self.path, lambda: 1, WrappedDenseUniverse)[0], universe)
+
+        universe = ClosedBitPackedUniverse.from_universe(ClosedUniverse.random(70, 3, lambda: random.choice([1, None])))
+        save_checkpoint(universe, self.path)
+        self.assertEqual(load_checkpoint(self.path, lambda: 1, ClosedBitPackedUniverse)[0], universe)
+
+    def test_load_infinite_universe(self):
+        universe = ClosedUniverse.from_data([
+            [0, 0, 1],
+            [1, 0, 0]
+        ])
+
+        save_checkpoint(universe, self.path)
+
+        self.assertEqual(load_checkpoint(self.path, lambda: 1, InfiniteUniverse)[0],
+                         InfiniteUniverse.from_universe(universe))
+
+    def test_round_trip_empty_universe(self):
+        save_checkpoint(ClosedUniverse(5, 5), self.path)
+
+        self.assertEqual(load_checkpoint(self.path, lambda: 1)[0], ClosedUniverse(5, 5))
+
+    def test_dying_cells_are_not_saved(self):
+        universe = ClosedUniverse.from_data([[1, 0], [0, 1]])
+        universe[1, 0] = Dying(2)
+
+        save_checkpoint(universe, self.path)
+
+        self.assertEqual(load_checkpoint(self.path, lambda: 1)[0], ClosedUniverse.from_data([[1, 0], [0, 1]]))
+
+    def test_region(self):
+        random.seed(42)
+
+        for alive in (.5, .01):
+            universe = WrappedUniverse.random(50, 20, lambda: 1 if random.random() < alive else None)
+            save_checkpoint(universe, self.path, generation=7)
+
+            with Checkpoint(self.path) as checkpoint:
+                self.assertEqual((checkpoint.width, checkpoint.height), (50, 20))
+                self.assertTrue(checkpoint.wrapped)
+                self.assertEqual(checkpoint.generation, 7)
+                self.assertEqual(checkpoint.population, len(list(universe.alive())))
+
+                region = checkpoint.region(13, 4, 21, 9)
+
+                self.assertEqual(region.shape, (9, 21))
+                self.assertEqual(
+                    region.tolist(),
+                    [[universe[x, y] is not None for x in range(13, 34)] for y in range(4, 13)])
+
+                with self.assertRaises(IndexError):
+                    checkpoint.region(40, 0, 11, 1)
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'Not a checkpoint')
+
+        with self.assertRaises(ValueError):
+            Checkpoint(self.path)
+
+    def test_save_invalid_generation(self):
+        with self.assertRaises(ValueError):
+            save_checkpoint(ClosedUniverse(1, 1), self.path, generation=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+from unittest import TestCase
+from life import (
+    BRIANS_BRAIN, HIGHLIFE, SEEDS, ActiveEngine, ChunkedEngine, ClosedChunkedUniverse, ClosedUniverse, Rule,
+    WrappedChunkedUniverse, WrappedUniverse, originate_from
+)
+
+
+class ClosedChunkedUniverse4(ClosedChunkedUniverse):
+    chunk_size = 4
+
+
+class WrappedChunkedUniverse4(WrappedChunkedUniverse):
+    chunk_size = 4
+
+
+class ChunkedEngineTestCase(TestCase):
+    def test_step_matches_active_engine(self):
+        random.seed(42)
+
+        cases = ((ClosedChunkedUniverse4, ClosedUniverse), (WrappedChunkedUniverse4, WrappedUniverse))
+
+        for chunked_cls, cls in cases:
+            for width, height in ((1, 1), (3, 2), (4, 4), (9, 7), (16, 16)):
+                for rule in (HIGHLIFE, SEEDS, BRIANS_BRAIN):
+                    data = [[random.choice([1, None]) for _ in range(width)] for _ in range(height)]
+
+                    expected_universe = cls.from_data(data)
+                    actual_universe = chunked_cls.from_data(data)
+
+                    for _ in range(12):
+                        expected_universe = ActiveEngine().step(expected_universe, lambda: 1, rule)
+                        actual_universe = ChunkedEngine().step(actual_universe, lambda: 1, rule)
+
+                        self.assertEqual(actual_universe, expected_universe)
+
+    def test_stable_chunks_sleep(self):
+        universe = ClosedChunkedUniverse4(12, 12)
+
+        # A block in the top left chunk and a blinker in the bottom right chunk.
+        for x, y in ((1, 1), (2, 1), (1, 2), (2, 2), (9, 10), (10, 10), (11, 10)):
+            universe[x, y] = 1
+
+        life = originate_from(universe, lambda: 1)
+
+        next(life)
+        universe = next(life)
+
+        self.assertEqual(universe._awake, {(2, 2)})
+
+    def test_glider_wakes_chunks(self):
+        glider = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+        expected_universe = WrappedUniverse(16, 16)
+        actual_universe = WrappedChunkedUniverse4(16, 16)
+
+        for y, row in enumerate(glider):
+            for x, cell in enumerate(row):
+                expected_universe[x, y] = cell or None
+                actual_universe[x, y] = cell or None
+
+        for _ in range(4 * 16):
+            expected_universe = ActiveEngine().step(expected_universe, lambda: 1)
+            actual_universe = ChunkedEngine().step(actual_universe, lambda: 1)
+
+            self.assertEqual(actual_universe, expected_universe)
+            self.assertLessEqual(len(actual_universe._awake), 9)
+
+    def test_step_keeps_previous_generation(self):
+        universe = WrappedChunkedUniverse4.from_data([[0, 1, 0], [0, 1, 0], [0, 1, 0]])
+
+        ChunkedEngine().step(universe, lambda: 1)
+
+        self.assertEqual(universe._chunks[0, 0].tolist(), [[0, 1, 0], [0, 1, 0], [0, 1, 0]])
+
+    def test_step_b0_rule(self):
+        with self.assertRaises(ValueError):
+            ChunkedEngine().step(ClosedChunkedUniverse4(2, 2), lambda: 1, Rule.parse('B0/S'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+from copy import copy
+from unittest import TestCase
+from life import ActiveEngine, ChunkedEngine, ClosedChunkedUniverse, ClosedUniverse, WrappedChunkedUniverse
+
+
+class ChunkedUniverse4(ClosedChunkedUniverse):
+    chunk_size = 4
+
+
+class WrappedChunkedUniverse4(WrappedChunkedUniverse):
+    chunk_size = 4
+
+
+class ChunkedUniverseTestCase(TestCase):
+    def test_chunks(self):
+        universe = ChunkedUniverse4(10, 5)
+
+        self.assertEqual((universe.columns, universe.rows), (3, 2))
+        self.assertEqual(universe.chunk_shape(0, 0), (4, 4))
+        self.assertEqual(universe.chunk_shape(2, 1), (1, 2))
+
+    def test_set_item(self):
+        universe = ChunkedUniverse4(10, 10)
+
+        universe[5, 6] = 1
+        self.assertEqual(universe[5, 6], 1)
+        self.assertEqual(universe._chunks[1, 1][2, 1], 1)
+        self.assertEqual(universe._awake, {(x, y) for x in range(3) for y in range(3)})
+
+        universe[5, 6] = None
+        self.assertIsNone(universe[5, 6])
+        self.assertEqual(universe._chunks[1, 1][2, 1], 0)
+
+        with self.assertRaises(IndexError):
+            universe[10, 0] = 1
+
+    def test_neighbour_chunk(self):
+        closed = ChunkedUniverse4(10, 10)
+        wrapped = WrappedChunkedUniverse4(10, 10)
+
+        self.assertIsNone(closed.neighbour_chunk(0, 0, -1, 0))
+        self.assertEqual(wrapped.neighbour_chunk(0, 0, -1, -1), (2, 2))
+        self.assertEqual(len(closed.neighbour_chunks(0, 0)), 3)
+        self.assertEqual(len(wrapped.neighbour_chunks(0, 0)), 8)
+
+    def test_padded_chunk(self):
+        data = [[(x + y) % 3 == 0 for x in range(6)] for y in range(5)]
+
+        closed = ChunkedUniverse4.from_data(data)
+        wrapped = WrappedChunkedUniverse4.from_data(data)
+
+        self.assertEqual(closed.padded_chunk(1, 0).tolist(), [
+            [0, 0, 0, 0],
+            [1, 0, 0, 0],
+            [0, 0, 1, 0],
+            [0, 1, 0, 0],
+            [1, 0, 0, 0],
+            [0, 0, 1, 0]
+        ])
+
+        self.assertEqual(wrapped.padded_chunk(1, 0).tolist(), [
+            [0, 0, 1, 0],
+            [1, 0, 0, 1],
+            [0, 0, 1, 0],
+            [0, 1, 0, 0],
+            [1, 0, 0, 1],
+            [0, 0, 1, 0]
+        ])
+
+    def test_copy(self):
+        universe = ChunkedUniverse4.from_data([
+            [1, 2],
+            [3, None]
+        ])
+
+        universe_copy = copy(universe)
+        universe_copy[1, 1] = 4
+
+        self.assertIsNone(universe[1, 1])
+        self.assertEqual(universe._chunks[0, 0].tolist(), [[1, 1], [1, 0]])
+        self.assertEqual(universe_copy._chunks[0, 0].tolist(), [[1, 1], [1, 1]])
+
+    def test_write_after_copy(self):
+        universe = WrappedChunkedUniverse(8, 8)
+        universe[1, 1] = 1
+
+        universe_copy = copy(universe)
+        universe[2, 2] = 1
+
+        self.assertIsNone(universe_copy[2, 2])
+        self.assertEqual(universe_copy._chunks[0, 0][2, 2], 0)
+        self.assertEqual(universe._chunks[0, 0][2, 2], 1)
+        self.assertEqual(ChunkedEngine().step(universe_copy, lambda: 1), ActiveEngine().step(universe_copy, lambda: 1))
+
+    def test_eq(self):
+        data = [[1, None], [None, 1]]
+
+        self.assertEqual(ClosedChunkedUniverse.from_data(data), ClosedUniverse.from_data(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -50,6 +50,27 @@ class ClosedUniverseTestCase(TestCase):
         neighbours = universe.neighbours_of(1, 1)
         self.assertEqual(list(neighbours), [1, 2, 3, 6, 9, 8, 7, 4])
 
+        neighbours = universe.neighbours_of(-1, 0)
+        self.assertEqual(list(neighbours), [1, 4])
+
+    def test_neighbour_counts(self):
+        universe = ClosedUniverse.from_data([
+            [1, 1, 0],
+            [0, 0, 0],
+            [0, 0, 1]
+        ])
+
+        counts = universe.neighbour_counts()
+        self.assertEqual(counts, {(0, 0): 1, (1, 0): 1, (2, 0): 1, (0, 1): 2, (1, 1): 3, (2, 1): 2, (1, 2): 1})
+
+        counts = universe.neighbour_counts([(2, 2)])
+        self.assertEqual(counts, {(1, 1): 1, (2, 1): 1, (1, 2): 1})
+
+    def test_neighbour_table_is_shared(self):
+        self.assertIs(ClosedUniverse(3, 2)._neighbours, ClosedUniverse(3, 2)._neighbours)
+        self.assertIs(copy(ClosedUniverse(3, 2))._neighbours, ClosedUniverse(3, 2)._neighbours)
+        self.assertIsNot(ClosedUniverse(3, 2)._neighbours, ClosedUniverse(2, 3)._neighbours)
+
     def test_adjust_position(self):
         universe = ClosedUniverse(2, 2)
 
@@ -207,6 +228,20 @@ class ClosedUniverseTestCase(TestCase):
         self.assertEqual(universe[0, 1], 1)
         self.assertEqual(universe[1, 1], 1)
 
+    def test_random_with_probability(self):
+        universe = ClosedUniverse.random(64, 32, lambda: 1, probability=.25, seed=7)
+
+        self.assertEqual((universe.width, universe.height), (64, 32))
+        self.assertTrue(all(universe[position] == 1 for position in universe.alive()))
+        self.assertTrue(.2 < len(list(universe.alive())) / (64 * 32) < .3)
+        self.assertEqual(universe, ClosedUniverse.random(64, 32, lambda: 1, probability=.25, seed=7))
+
+        self.assertEqual(list(ClosedUniverse.random(4, 4, lambda: 1, probability=0).alive()), [])
+        self.assertEqual(len(list(ClosedUniverse.random(4, 4, lambda: 1, probability=1).alive())), 16)
+
+        with self.assertRaises(ValueError):
+            ClosedUniverse.random(4, 4, lambda: 1, probability=1.5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import io
+import json
+from unittest import TestCase
+from life import Broadcaster, ClosedUniverse, Driver, Recorder
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def blinker():
+    return ClosedUniverse.from_data([
+        [0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 0],
+        [0, 0, 1, 0, 0],
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0]
+    ])
+
+
+class RecorderTestCase(TestCase):
+    def test_record(self):
+        file = io.StringIO()
+
+        async def test():
+            driver = Driver(blinker(), lambda: 1)
+            await asyncio.gather(driver.run(2), Recorder(file)(driver.subscribe(maxsize=1, policy='block')))
+
+        run(test())
+        lines = [json.loads(line) for line in file.getvalue().splitlines()]
+
+        self.assertEqual(lines, [
+            dict(generation=0, born=[[2, 1], [2, 2], [2, 3]], died=[]),
+            dict(generation=1, born=[[1, 2], [3, 2]], died=[[2, 1], [2, 3]]),
+            dict(generation=2, born=[[2, 1], [2, 3]], died=[[1, 2], [3, 2]])
+        ])
+
+
+class BroadcasterTestCase(TestCase):
+    def test_serve(self):
+        async def test():
+            driver = Driver(blinker(), lambda: 1, steps_per_second=100)
+            broadcaster = Broadcaster(driver, maxsize=8)
+            server = await broadcaster.serve()
+            port = server.sockets[0].getsockname()[1]
+
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+            while not driver.subscriptions:
+                await asyncio.sleep(0)
+
+            lines = await asyncio.gather(read_lines(reader), driver.run(3))
+
+            writer.close()
+            broadcaster.close()
+
+            return lines[0]
+
+        async def read_lines(reader):
+            lines = []
+
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    return lines
+
+                lines.append(json.loads(line.decode()))
+
+        lines = run(test())
+
+        self.assertEqual(lines[0], dict(generation=0, born=[[2, 1], [2, 2], [2, 3]], died=[]))
+        self.assertEqual(lines[-1]['generation'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
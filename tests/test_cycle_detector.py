@@ -0,0 +1,136 @@
+import random
+from unittest import TestCase
+from life import (
+    BRIANS_BRAIN, ClosedBitPackedUniverse, ClosedUniverse, CycleDetector, WrappedUniverse, originate_changes_from,
+    originate_from
+)
+
+
+class CollidingHashes(dict):
+    """Represents seen hashes where every hash looks as if it was seen in generation 0."""
+
+    def get(self, key, default=None):
+        return super().get(key, 0)
+
+
+class CycleDetectorTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            CycleDetector(0)
+
+    def test_observe_block(self):
+        universe = ClosedUniverse.from_data([
+            [0, 0, 0, 0],
+            [0, 1, 1, 0],
+            [0, 1, 1, 0],
+            [0, 0, 0, 0]
+        ])
+
+        detector = CycleDetector()
+        generations = list(originate_from(universe, lambda: 1, detector=detector))
+
+        self.assertEqual(len(generations), 1)
+        self.assertEqual(detector.period, 1)
+        self.assertEqual(detector.start, 0)
+
+    def test_observe_blinker_after_transient(self):
+        universe = ClosedUniverse.from_data([
+            [0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 1, 1, 1, 0],
+            [0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0]
+        ])
+
+        detector = CycleDetector()
+        generations = list(originate_from(universe, lambda: 1, detector=detector))
+
+        self.assertEqual(detector.period, 2)
+        self.assertEqual(detector.start, len(generations) - 2)
+        self.assertEqual(generations[-1], generations[-3])
+
+    def test_observe_glider(self):
+        glider = [
+            [0, 1, 0, 0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0, 0, 0],
+            [1, 1, 1, 0, 0, 0, 0, 0]
+        ] + [[0] * 8] * 5
+
+        detector = CycleDetector()
+        generations = list(originate_from(WrappedUniverse.from_data(glider), lambda: 1, detector=detector))
+
+        self.assertEqual(len(generations), 32)
+        self.assertEqual(detector.period, 32)
+        self.assertEqual(detector.start, 0)
+
+    def test_observe_generations_rule(self):
+        universe = WrappedUniverse.from_data([
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 1, 1, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0]
+        ])
+
+        detector = CycleDetector()
+        generations = list(originate_changes_from(universe, lambda: 1, rule=BRIANS_BRAIN, detector=detector))
+
+        self.assertEqual(generations[-1][0], generations[-1 - detector.period][0])
+
+    def test_observe_bit_packed_universe(self):
+        universe = ClosedBitPackedUniverse(3, 3)
+        universe._rows = [0b010, 0b010, 0b010]
+
+        detector = CycleDetector()
+        list(originate_from(universe, lambda: 1, detector=detector))
+
+        self.assertEqual(detector.period, 2)
+
+    def test_history_limits_period(self):
+        universe = ClosedUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        detector = CycleDetector(history=1)
+        generation = originate_from(universe, lambda: 1, detector=detector)
+
+        for _ in range(10):
+            next(generation)
+
+        self.assertIsNone(detector.period)
+
+    def test_observe_changes_matches_states(self):
+        random.seed(42)
+        universe = WrappedUniverse.random(16, 9, lambda: random.choice([1, None]))
+
+        detector = CycleDetector()
+        expected_detector = CycleDetector()
+        expected_detector.observe(universe)
+
+        for next_universe, _ in originate_changes_from(universe, lambda: 1, rule=BRIANS_BRAIN, detector=detector):
+            expected_detector.observe(next_universe)
+
+            self.assertEqual(detector.hash, expected_detector.hash)
+
+        self.assertEqual(detector.period, expected_detector.period)
+
+    def test_observe_ignores_collisions(self):
+        glider = [
+            [0, 1, 0, 0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0, 0, 0],
+            [1, 1, 1, 0, 0, 0, 0, 0]
+        ] + [[0] * 8] * 5
+
+        detector = CycleDetector()
+        detector._seen = CollidingHashes()
+        generations = list(originate_from(WrappedUniverse.from_data(glider), lambda: 1, detector=detector))
+
+        self.assertEqual(len(generations), 32)
+        self.assertEqual(detector.period, 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
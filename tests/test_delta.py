@@ -0,0 +1,159 @@
+import os
+import random
+import tempfile
+from itertools import islice
+from unittest import TestCase
+import numpy
+from life import (
+    BRIANS_BRAIN, ClosedUniverse, DeltaReader, DeltaWriter, Dying, InfiniteUniverse, WrappedUniverse,
+    originate_changes_from, originate_deltas_from, originate_from
+)
+from life.formats.delta import decode_varints, encode_varints
+
+
+class DeltaTestCase(TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def record(self, universe, generations, **kwargs):
+        with DeltaWriter(self.path, universe, **kwargs) as writer:
+            for changes in islice(originate_deltas_from(universe, lambda: 1), generations):
+                writer.write(changes)
+
+    def test_replay(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            for compress in (True, False):
+                universe = cls.random(23, 17, lambda: 1 if random.random() < .3 else None)
+                expected = [universe] + list(islice(originate_from(universe, lambda: 1), 20))
+
+                self.record(universe, 20, keyframe_interval=6, compress=compress)
+
+                with DeltaReader(self.path) as reader:
+                    self.assertEqual((reader.width, reader.height), (23, 17))
+                    self.assertEqual((reader.start, reader.stop), (0, 21))
+                    self.assertEqual(reader.wrapped, cls is WrappedUniverse)
+
+                    actual = list(reader.replay(lambda: 1))
+
+                self.assertTrue(all(isinstance(u, cls) for u in actual))
+                self.assertEqual(actual, expected)
+
+    def test_seek(self):
+        random.seed(42)
+        universe = ClosedUniverse.random(16, 16, lambda: 1 if random.random() < .4 else None)
+        expected = [universe] + list(islice(originate_from(universe, lambda: 1), 30))
+
+        self.record(universe, 30, keyframe_interval=8)
+
+        with DeltaReader(self.path) as reader:
+            for generation in (0, 1, 7, 8, 9, 16, 30):
+                self.assertEqual(reader.seek(generation, lambda: 1), expected[generation])
+
+            self.assertEqual(list(reader.replay(lambda: 1, start=25)), expected[25:])
+
+            with self.assertRaises(IndexError):
+                reader.seek(31, lambda: 1)
+
+    def test_changes(self):
+        random.seed(42)
+        universe = WrappedUniverse.random(12, 12, lambda: 1 if random.random() < .4 else None)
+        expected = [changes for _, changes in islice(originate_changes_from(universe, lambda: 1), 12)]
+
+        self.record(universe, 12, keyframe_interval=5)
+
+        with DeltaReader(self.path) as reader:
+            self.assertEqual([changes for _, changes in reader.changes()], expected)
+            self.assertEqual([generation for generation, _ in reader.changes(start=4)], list(range(5, 13)))
+
+    def test_survivors_keep_identity(self):
+        universe = ClosedUniverse.from_data([
+            [0, 0, 0, 0],
+            [0, 1, 1, 0],
+            [0, 1, 1, 0],
+            [0, 0, 0, 0]
+        ])
+
+        self.record(universe, 3, keyframe_interval=2)
+
+        with DeltaReader(self.path) as reader:
+            universes = list(reader.replay(object))
+
+        self.assertIs(universes[0][1, 1], universes[3][1, 1])
+
+    def test_unclosed_log(self):
+        random.seed(42)
+        universe = ClosedUniverse.random(10, 10, lambda: 1 if random.random() < .4 else None)
+        expected = [universe] + list(islice(originate_from(universe, lambda: 1), 10))
+
+        writer = DeltaWriter(self.path, universe, keyframe_interval=4)
+
+        for changes in islice(originate_deltas_from(universe, lambda: 1), 10):
+            writer.write(changes)
+
+        # Only complete blocks are flushed before the writer is closed.
+        writer._file.flush()
+
+        with DeltaReader(self.path) as reader:
+            self.assertEqual(reader.stop, 8)
+            self.assertEqual(list(reader.replay(lambda: 1)), expected[:8])
+
+        writer.close()
+
+    def test_size(self):
+        universe = ClosedUniverse(1024, 1024)
+
+        for x, y in ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2)):
+            universe[x + 500, y + 500] = 1
+
+        self.record(universe, 256, keyframe_interval=64)
+
+        # A glider changes 8 cells per generation, far less than a byte per cell of the universe.
+        self.assertLess(os.path.getsize(self.path), 256 * 32)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            DeltaWriter(self.path, ClosedUniverse(3, 3), keyframe_interval=0)
+
+        with self.assertRaises(ValueError):
+            DeltaWriter(self.path, InfiniteUniverse())
+
+        with open(self.path, 'wb') as file:
+            file.write(b'not a delta log')
+
+        with self.assertRaises(ValueError):
+            DeltaReader(self.path)
+
+    def test_generations_rule(self):
+        universe = WrappedUniverse(6, 6)
+        universe[2, 2] = universe[3, 2] = 1
+
+        with self.assertRaises(ValueError):
+            DeltaWriter(self.path, universe, rule=BRIANS_BRAIN)
+
+        changes = next(originate_deltas_from(universe, lambda: 1, rule=BRIANS_BRAIN))
+
+        with DeltaWriter(self.path, universe) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(changes)
+
+        universe[2, 2] = Dying(2)
+
+        with self.assertRaises(ValueError):
+            DeltaWriter(self.path, universe)
+
+    def test_varints(self):
+        values = numpy.array([0, 1, 127, 128, 300, 2 ** 32, 2 ** 63 - 1, 2 ** 64 - 1], dtype=numpy.uint64)
+        data = encode_varints(values)
+
+        self.assertEqual(encode_varints(numpy.array([300], dtype=numpy.uint64)), b'\xac\x02')
+        self.assertEqual(decode_varints(data).tolist(), values.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
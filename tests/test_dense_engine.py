@@ -0,0 +1,70 @@
+import random
+from unittest import TestCase
+from life import (
+    ActiveEngine, ClosedDenseUniverse, ClosedUniverse, DenseEngine, WrappedDenseUniverse, WrappedUniverse,
+    originate_from
+)
+
+
+class DenseEngineTestCase(TestCase):
+    def test_step_blinker(self):
+        universe = ClosedDenseUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        expected_universe = ClosedUniverse.from_data([
+            [0, 0, 0],
+            [1, 1, 1],
+            [0, 0, 0]
+        ])
+
+        next_universe = DenseEngine().step(universe, lambda: 1)
+
+        self.assertEqual(next_universe, expected_universe)
+        self.assertEqual(next_universe._states.tolist(), [[0, 0, 0], [1, 1, 1], [0, 0, 0]])
+
+    def test_step_matches_active_engine(self):
+        random.seed(42)
+
+        for dense_cls, cls in ((ClosedDenseUniverse, ClosedUniverse), (WrappedDenseUniverse, WrappedUniverse)):
+            for width, height in ((1, 1), (2, 3), (5, 5), (16, 9)):
+                data = [[random.choice([1, None]) for _ in range(width)] for _ in range(height)]
+
+                expected_universe = cls.from_data(data)
+                actual_universe = dense_cls.from_data(data)
+
+                for _ in range(8):
+                    expected_universe = ActiveEngine().step(expected_universe, lambda: 1)
+                    actual_universe = DenseEngine().step(actual_universe, lambda: 1)
+
+                    self.assertEqual(actual_universe, expected_universe)
+
+    def test_step_keeps_surviving_cells(self):
+        universe = WrappedDenseUniverse(4, 4)
+        cell = object()
+
+        universe[1, 1] = cell
+        universe[1, 2] = 1
+        universe[2, 1] = 1
+        universe[2, 2] = 1
+
+        next_universe = DenseEngine().step(universe, lambda: 1)
+
+        self.assertIs(next_universe[1, 1], cell)
+
+    def test_originate_from_uses_dense_engine(self):
+        universe = WrappedDenseUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        next_universe = next(originate_from(universe, lambda: 1))
+
+        self.assertIsInstance(next_universe, WrappedDenseUniverse)
+
+
+if __name__ == '__main__':
+    unittest.main()
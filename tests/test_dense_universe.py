@@ -0,0 +1,65 @@
+from copy import copy
+from unittest import TestCase
+from life import ClosedDenseUniverse, ClosedUniverse, WrappedDenseUniverse
+
+
+class DenseUniverseTestCase(TestCase):
+    def test_set_item(self):
+        universe = WrappedDenseUniverse(2, 2)
+
+        universe[0, 0] = 1
+        self.assertEqual(universe[0, 0], 1)
+        self.assertEqual(universe._states[0, 0], 1)
+
+        universe[0, 0] = None
+        self.assertEqual(universe[0, 0], None)
+        self.assertEqual(universe._states[0, 0], 0)
+
+        universe[-1, 2] = 2
+        self.assertEqual(universe[1, 0], 2)
+        self.assertEqual(universe._states[0, 1], 1)
+
+    def test_set_item_out_of_range(self):
+        universe = ClosedDenseUniverse(2, 2)
+
+        with self.assertRaises(IndexError):
+            universe[2, 0] = 1
+
+    def test_copy(self):
+        universe = ClosedDenseUniverse.from_data([
+            [1, 2],
+            [3, None]
+        ])
+
+        universe_copy = copy(universe)
+        universe_copy[1, 1] = 4
+
+        self.assertIsNone(universe[1, 1])
+        self.assertEqual(universe._states.tolist(), [[1, 1], [1, 0]])
+        self.assertEqual(universe_copy._states.tolist(), [[1, 1], [1, 1]])
+
+    def test_eq(self):
+        data = [
+            [1, 3],
+            [2, None]
+        ]
+
+        self.assertEqual(ClosedDenseUniverse.from_data(data), ClosedUniverse.from_data(data))
+
+    def test_str(self):
+        universe = WrappedDenseUniverse.from_data([
+            [None, 3],
+            [2, None]
+        ])
+
+        self.assertMultiLineEqual(str(universe), '  3\n2  ')
+
+    def test_random_with_probability(self):
+        universe = WrappedDenseUniverse.random(16, 8, lambda: 1, probability=.5, seed=3)
+
+        self.assertEqual(universe._states.sum(), len(list(universe.alive())))
+        self.assertEqual(universe._data, ClosedUniverse.random(16, 8, lambda: 1, probability=.5, seed=3)._data)
+
+
+if __name__ == '__main__':
+    unittest.main()
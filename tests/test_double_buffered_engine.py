@@ -0,0 +1,83 @@
+import random
+from unittest import TestCase
+from life import BRIANS_BRAIN, ActiveEngine, ClosedUniverse, DoubleBufferedEngine, WrappedDenseUniverse, WrappedUniverse
+
+
+class DoubleBufferedEngineTestCase(TestCase):
+    def test_step_matches_active_engine(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            engine = DoubleBufferedEngine()
+            expected_universe = cls.random(16, 9, lambda: random.choice([1, None]))
+            actual_universe = expected_universe
+
+            for _ in range(10):
+                expected_universe = ActiveEngine().step(expected_universe, lambda: 1)
+                actual_universe = engine.step(actual_universe, lambda: 1)
+
+                self.assertIsInstance(actual_universe, cls)
+                self.assertEqual(actual_universe, expected_universe)
+
+    def test_step_returns_views(self):
+        universe = WrappedUniverse.random(8, 8, lambda: random.choice([1, None]))
+
+        engine = DoubleBufferedEngine()
+
+        first = engine.step(universe, lambda: 1)
+        second = engine.step(first, lambda: 1)
+        third = engine.step(second, lambda: 1)
+
+        self.assertIsNot(first, universe)
+        self.assertIsNot(second, first)
+        self.assertIs(third, first)
+
+    def test_step_restarts_from_another_universe(self):
+        blinker = ClosedUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        block = ClosedUniverse.from_data([
+            [1, 1, 0],
+            [1, 1, 0],
+            [0, 0, 0]
+        ])
+
+        engine = DoubleBufferedEngine()
+        engine.step(blinker, lambda: 1)
+
+        self.assertEqual(engine.step(block, lambda: 1), block)
+
+    def test_step_dense_universe(self):
+        universe = WrappedDenseUniverse.from_data([
+            [0, 1, 0, 0],
+            [0, 1, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, 0, 0]
+        ])
+
+        engine = DoubleBufferedEngine()
+        next_universe = engine.step(engine.step(universe, lambda: 1), lambda: 1)
+
+        self.assertEqual(next_universe, universe)
+        self.assertEqual(next_universe._states.tolist(), universe._states.tolist())
+
+    def test_transition_matches_active_engine(self):
+        random.seed(42)
+        engine = DoubleBufferedEngine()
+        expected_universe = WrappedUniverse.random(16, 9, lambda: random.choice([1, None]))
+        actual_universe = expected_universe
+
+        for _ in range(10):
+            expected_universe, expected_changes = ActiveEngine().transition(expected_universe, lambda: 1,
+                                                                             BRIANS_BRAIN)
+            actual_universe, actual_changes = engine.transition(actual_universe, lambda: 1, BRIANS_BRAIN)
+
+            self.assertEqual(actual_universe, expected_universe)
+            self.assertEqual(actual_changes, expected_changes)
+
+
+if __name__ == '__main__':
+    unittest.main()
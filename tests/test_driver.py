@@ -0,0 +1,105 @@
+import asyncio
+from unittest import TestCase
+from life import ActiveEngine, Changes, ClosedUniverse, CycleDetector, Driver, originate_from
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def blinker():
+    return ClosedUniverse.from_data([
+        [0, 0, 0, 0, 0],
+        [0, 0, 1, 0, 0],
+        [0, 0, 1, 0, 0],
+        [0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 0]
+    ])
+
+
+class DriverTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            Driver(blinker(), lambda: 1, steps_per_second=0)
+
+    def test_run(self):
+        async def test():
+            driver = Driver(blinker(), lambda: 1, ActiveEngine())
+            subscription = driver.subscribe(maxsize=8, policy='block')
+
+            await driver.run(3)
+
+            return driver, [frame async for frame in subscription]
+
+        driver, frames = run(test())
+        expected = [blinker()] + list(universe for universe, _ in zip(originate_from(blinker(), lambda: 1), range(3)))
+
+        self.assertEqual(driver.generation, 3)
+        self.assertEqual([frame.generation for frame in frames], [0, 1, 2, 3])
+        self.assertEqual([frame.universe for frame in frames], expected)
+        self.assertEqual(frames[0].changes, Changes(born={(2, 1), (2, 2), (2, 3)}, died=set()))
+        self.assertEqual(frames[1].changes, Changes(born={(1, 2), (3, 2)}, died={(2, 1), (2, 3)}))
+
+    def test_slow_consumer(self):
+        async def test():
+            driver = Driver(blinker(), lambda: 1)
+            fast = driver.subscribe(maxsize=16)
+            slow = driver.subscribe(maxsize=1)
+
+            await driver.run(5)
+
+            return [frame async for frame in fast], [frame async for frame in slow], slow.dropped
+
+        fast, slow, dropped = run(test())
+
+        self.assertEqual(len(fast), 6)
+        self.assertEqual([frame.generation for frame in slow], [5])
+        self.assertEqual(dropped, 5)
+        # Changes since the start are coalesced: the blinker is horizontal after an odd number of generations.
+        self.assertEqual(slow[0].changes, Changes(born={(1, 2), (2, 2), (3, 2)}, died=set()))
+
+    def test_steps_per_second(self):
+        async def test():
+            loop = asyncio.get_event_loop()
+            driver = Driver(blinker(), lambda: 1, steps_per_second=50)
+            start = loop.time()
+
+            await driver.run(3)
+
+            return loop.time() - start
+
+        self.assertGreaterEqual(run(test()), .055)
+
+    def test_stop(self):
+        async def test():
+            driver = Driver(blinker(), lambda: 1)
+            subscription = driver.subscribe(maxsize=1000)
+
+            async def stop():
+                async for frame in subscription:
+                    if frame.generation == 2:
+                        driver.stop()
+
+            await asyncio.gather(driver.run(), stop())
+
+            return driver.generation
+
+        self.assertLessEqual(run(test()), 3)
+
+    def test_cycle(self):
+        async def test():
+            driver = Driver(blinker(), lambda: 1, detector=CycleDetector())
+            await driver.run()
+
+            return driver.generation
+
+        self.assertEqual(run(test()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import random
+from unittest import TestCase
+from life import ActiveEngine, ClosedUniverse, HashLifeEngine, InfiniteUniverse, WrappedUniverse, advance
+
+
+class MeasuredHashLifeEngine(HashLifeEngine):
+    """Represents an engine that records the largest size of its node table."""
+
+    def __init__(self, max_nodes: int):
+        super().__init__(max_nodes)
+        self.largest = 0
+
+    def _node(self, nw, ne, sw, se):
+        node = super()._node(nw, ne, sw, se)
+        self.largest = max(self.largest, len(self._nodes))
+
+        return node
+
+
+class HashLifeEngineTestCase(TestCase):
+    def assertAdvancesLikeActiveEngine(self, engine, universe, generations):
+        expected_universe = universe
+
+        for _ in range(generations):
+            expected_universe = ActiveEngine().step(expected_universe, lambda: 1)
+
+        actual_universe = engine.advance(universe, generations, lambda: 1)
+
+        self.assertIsInstance(actual_universe, type(universe))
+        self.assertEqual(actual_universe, expected_universe)
+
+    def test_advance_matches_active_engine(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            for width, height in ((1, 1), (2, 3), (8, 8), (4, 16), (10, 7)):
+                universe = cls.random(width, height, lambda: random.choice([1, None]))
+
+                for generations in (0, 1, 2, 5, 13, 40):
+                    self.assertAdvancesLikeActiveEngine(HashLifeEngine(), universe, generations)
+
+    def test_advance_with_small_cache(self):
+        random.seed(7)
+
+        for cls in (ClosedUniverse, WrappedUniverse):
+            universe = cls.random(12, 12, lambda: random.choice([1, None]))
+
+            self.assertAdvancesLikeActiveEngine(HashLifeEngine(max_nodes=16), universe, 25)
+
+    def test_advance_limits_nodes_within_a_jump(self):
+        random.seed(7)
+        universe = ClosedUniverse.random(12, 12, lambda: random.choice([1, None]))
+        engine = MeasuredHashLifeEngine(max_nodes=256)
+
+        self.assertAdvancesLikeActiveEngine(engine, universe, 64)
+        self.assertLessEqual(engine.largest, 256)
+
+    def test_advance_glider_billions_of_generations(self):
+        glider = [
+            [0, 1, 0, 0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0, 0, 0],
+            [1, 1, 1, 0, 0, 0, 0, 0]
+        ] + [[0] * 8] * 5
+
+        universe = WrappedUniverse.from_data(glider)
+
+        # The glider travels across the 8x8 universe and returns back every 32 generations.
+        self.assertEqual(advance(universe, 10 ** 9, lambda: 1), universe)
+
+    def test_advance_closed_universe_far_ahead(self):
+        universe = ClosedUniverse.from_data([
+            [0, 1, 0, 0],
+            [0, 1, 0, 0],
+            [0, 1, 0, 0],
+            [0, 0, 0, 0]
+        ])
+
+        self.assertEqual(advance(universe, 10 ** 9, lambda: 1), universe)
+        self.assertNotEqual(advance(universe, 10 ** 9 + 1, lambda: 1), universe)
+
+    def test_advance_infinite_universe(self):
+        random.seed(3)
+
+        universe = InfiniteUniverse.from_universe(ClosedUniverse.random(9, 6, lambda: random.choice([1, None])), -20, 7)
+        engine = HashLifeEngine()
+
+        for generations in (0, 1, 2, 5, 13, 40, 100):
+            self.assertAdvancesLikeActiveEngine(engine, universe, generations)
+
+        self.assertEqual(advance(InfiniteUniverse(), 5, lambda: 1), InfiniteUniverse())
+
+    def test_advance_glider_on_infinite_plane(self):
+        glider = InfiniteUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ])
+
+        self.assertEqual(advance(glider, 4 * 10 ** 9, lambda: 1).bounds, (10 ** 9, 10 ** 9, 10 ** 9 + 2, 10 ** 9 + 2))
+
+    def test_step(self):
+        universe = WrappedUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        self.assertEqual(HashLifeEngine().step(universe, lambda: 1), ActiveEngine().step(universe, lambda: 1))
+
+    def test_advance_negative(self):
+        with self.assertRaises(ValueError):
+            advance(ClosedUniverse(1, 1), -1, lambda: 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import io
+from copy import copy
+from unittest import TestCase
+from life import ActiveEngine, ClosedUniverse, InfiniteUniverse, ScanEngine, originate_from, write_rle
+
+
+class InfiniteUniverseTestCase(TestCase):
+    def test_init(self):
+        universe = InfiniteUniverse()
+
+        self.assertIsNone(universe.bounds)
+        self.assertEqual((universe.width, universe.height), (0, 0))
+        self.assertEqual(list(universe.through()), [])
+        self.assertEqual(str(universe), '')
+
+        # Dimensions are accepted like by bounded universes and ignored.
+        self.assertIsNone(InfiniteUniverse(10, 10).bounds)
+
+    def test_arbitrary_positions(self):
+        universe = InfiniteUniverse()
+
+        universe[-10 ** 9, 5] = 1
+        universe[3, -7] = 2
+
+        self.assertEqual(universe[-10 ** 9, 5], 1)
+        self.assertEqual(universe[3, -7], 2)
+        self.assertIsNone(universe[0, 0])
+        self.assertEqual(universe.bounds, (-10 ** 9, -7, 3, 5))
+        self.assertEqual((universe.width, universe.height), (10 ** 9 + 4, 13))
+
+    def test_bounds_shrink(self):
+        universe = InfiniteUniverse.from_data([
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 1]
+        ])
+
+        universe[1, 1] = None
+        self.assertEqual(universe.bounds, (0, 0, 2, 2))
+
+        universe[2, 2] = None
+        self.assertEqual(universe.bounds, (0, 0, 0, 0))
+
+        universe[0, 0] = None
+        self.assertIsNone(universe.bounds)
+
+    def test_through(self):
+        universe = InfiniteUniverse()
+        universe[-1, 4] = 1
+        universe[0, 5] = 1
+
+        self.assertEqual(list(universe.through()), [(-1, 4), (0, 4), (-1, 5), (0, 5)])
+
+    def test_neighbours_of(self):
+        universe = InfiniteUniverse.from_data([
+            [1, 2],
+            [3, 4]
+        ])
+
+        self.assertEqual(list(universe.neighbours_of(0, 0)), [None, None, None, 2, 4, 3, None, None])
+        self.assertEqual(list(universe.neighbours_of(-1, -1)).count(None), 7)
+
+    def test_copy(self):
+        universe = InfiniteUniverse.from_data([[1, 1]])
+        universe_copy = copy(universe)
+
+        universe_copy[5, 5] = 1
+
+        self.assertEqual(universe.bounds, (0, 0, 1, 0))
+        self.assertEqual(universe_copy.bounds, (0, 0, 5, 5))
+
+    def test_str(self):
+        universe = InfiniteUniverse()
+        universe[-2, -2] = '*'
+        universe[0, -1] = '*'
+
+        self.assertEqual(str(universe), '*    \n    *')
+        self.assertEqual(universe.render(-1, -1, 2, 1), '  *')
+
+    def test_to_universe(self):
+        universe = InfiniteUniverse()
+        universe[-2, -2] = 1
+        universe[0, -1] = 2
+
+        self.assertEqual(universe.to_universe(), ClosedUniverse.from_data([[1, 0, 0], [0, 0, 2]]))
+        self.assertEqual(universe.to_universe(ClosedUniverse, (-1, -1, 2, 1)), ClosedUniverse.from_data([[0, 2]]))
+        self.assertEqual(InfiniteUniverse().to_universe(), ClosedUniverse(1, 1))
+
+    def test_from_universe(self):
+        universe = InfiniteUniverse.from_universe(ClosedUniverse.from_data([[1, 0], [0, 2]]), -5, 3)
+
+        self.assertEqual(universe[-5, 3], 1)
+        self.assertEqual(universe[-4, 4], 2)
+        self.assertEqual(universe.bounds, (-5, 3, -4, 4))
+
+    def test_glider_travels(self):
+        universe = InfiniteUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ])
+
+        life = originate_from(universe, lambda: 1)
+
+        for _ in range(4 * 100):
+            universe = next(life)
+
+        self.assertEqual(universe.bounds, (100, 100, 102, 102))
+        self.assertEqual(universe, InfiniteUniverse.from_universe(ClosedUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ]), 100, 100))
+
+    def test_glider_travels_with_scan_engine(self):
+        universe = InfiniteUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ])
+
+        life = originate_from(universe, lambda: 1, ScanEngine())
+
+        for _ in range(4 * 5):
+            universe = next(life)
+
+        self.assertEqual(universe.bounds, (5, 5, 7, 7))
+        self.assertEqual(len(universe._data), 5)
+
+    def test_engine_for(self):
+        life = originate_from(InfiniteUniverse.from_data([[1, 1, 1]]), lambda: 1, ActiveEngine())
+
+        self.assertEqual(next(life).bounds, (1, -1, 1, 1))
+
+    def test_write_rle(self):
+        universe = InfiniteUniverse()
+        universe[-3, -3] = 1
+        universe[-2, -2] = 1
+
+        file = io.StringIO()
+        write_rle(universe, file)
+
+        self.assertEqual(file.getvalue(), 'x = 2, y = 2, rule = B3/S23\no$bo!\n')
+
+    def test_random(self):
+        with self.assertRaises(ValueError):
+            InfiniteUniverse.random(0, 1, lambda: 1)
+
+        self.assertEqual(InfiniteUniverse.random(3, 2, lambda: 1).bounds, (0, 0, 2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
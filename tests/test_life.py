@@ -1,6 +1,9 @@
 from typing import List
 from unittest import TestCase
-from life import ClosedUniverse, live, originate_from
+from life import (
+    BRIANS_BRAIN, ClosedUniverse, Dying, InfiniteUniverse, WrappedBitPackedUniverse, changes_between, live,
+    originate_changes_from, originate_from
+)
 
 
 def neibours(count: int) -> List[bool]:
@@ -99,6 +102,60 @@ class LifeTestCase(TestCase):
 
         self.assertEqual(actual_universe, expected_universe)
 
+    def test_originate_changes_from_blinker(self):
+        original_universe = ClosedUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        generation = originate_changes_from(original_universe, lambda: 1)
+
+        actual_universe, changes = next(generation)
+        self.assertEqual(changes.born, {(0, 1), (2, 1)})
+        self.assertEqual(changes.died, {(1, 0), (1, 2)})
+
+        next_universe, changes = next(generation)
+        self.assertEqual(next_universe, original_universe)
+        self.assertEqual(changes.born, {(1, 0), (1, 2)})
+        self.assertEqual(changes.died, {(0, 1), (2, 1)})
+
+    def test_changes_between(self):
+        universe = WrappedBitPackedUniverse(2, 2)
+        universe[0, 0] = 1
+
+        next_universe = WrappedBitPackedUniverse(2, 2)
+        next_universe[1, 1] = 1
+
+        changes = changes_between(universe, next_universe)
+
+        self.assertEqual(changes.born, {(1, 1)})
+        self.assertEqual(changes.died, {(0, 0)})
+
+    def test_changes_between_dying_cells(self):
+        universe = InfiniteUniverse()
+        universe[0, 0] = 1
+        universe[1, 0] = Dying(2)
+
+        next_universe = InfiniteUniverse()
+        next_universe[0, 0] = Dying(2)
+
+        changes = changes_between(universe, next_universe)
+
+        self.assertEqual(changes.born, set())
+        self.assertEqual(changes.died, {(1, 0)})
+        self.assertEqual(changes.changed, {(0, 0)})
+
+    def test_originate_changes_from_dying_cells(self):
+        universe = InfiniteUniverse()
+        universe[0, 0] = 1
+        universe[1, 0] = 1
+
+        _, changes = next(originate_changes_from(universe, lambda: 1, rule=BRIANS_BRAIN))
+
+        self.assertEqual(changes.born, {(0, 1), (1, 1), (0, -1), (1, -1)})
+        self.assertEqual(changes.changed, {(0, 0), (1, 0)})
+
 
 if __name__ == '__main__':
     unittest.main()
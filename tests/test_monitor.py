@@ -0,0 +1,81 @@
+import random
+from unittest import TestCase
+from life import (
+    ActiveEngine, BitPackedEngine, ClosedDenseUniverse, ClosedUniverse, DenseEngine, DoubleBufferedEngine,
+    HashLifeEngine, Monitor, ScanEngine, WrappedBitPackedUniverse, WrappedUniverse, originate_from
+)
+
+
+class MonitorTestCase(TestCase):
+    def test_metrics(self):
+        universe = ClosedUniverse.from_data([
+            [0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 0, 0, 0]
+        ])
+
+        metrics = []
+        life = originate_from(universe, lambda: 1, ActiveEngine(), monitor=Monitor(metrics.append))
+
+        next(life)
+        next(life)
+
+        self.assertEqual([m.generation for m in metrics], [1, 2])
+        self.assertEqual([m.population for m in metrics], [3, 3])
+        self.assertEqual([(m.born, m.died) for m in metrics], [(2, 2), (2, 2)])
+        self.assertEqual([m.bounding_box for m in metrics], [(1, 2, 3, 2), (2, 1, 2, 3)])
+
+        for m in metrics:
+            self.assertGreaterEqual(m.step, m.counting + m.evaluating + m.copying)
+
+    def test_metrics_of_empty_universe(self):
+        metrics = []
+
+        next(originate_from(ClosedUniverse(3, 3), lambda: 1, monitor=Monitor(metrics.append)))
+
+        self.assertEqual(metrics[0].population, 0)
+        self.assertIsNone(metrics[0].bounding_box)
+
+    def test_metrics_without_phases(self):
+        metrics = []
+
+        next(originate_from(WrappedUniverse(4, 4), lambda: 1, HashLifeEngine(), monitor=Monitor(metrics.append)))
+
+        self.assertIsNone(metrics[0].counting)
+        self.assertGreaterEqual(metrics[0].step, 0)
+
+    def test_sinks(self):
+        first, second = [], []
+
+        next(originate_from(ClosedUniverse(3, 3), lambda: 1, monitor=Monitor(first.append, second.append)))
+
+        self.assertEqual(first, second)
+
+    def test_timed_step_matches_step(self):
+        random.seed(42)
+
+        universe = WrappedUniverse.random(16, 16, lambda: random.choice([1, None]))
+
+        cases = (
+            (ScanEngine(), ScanEngine(), universe),
+            (ActiveEngine(), ActiveEngine(), universe),
+            (DoubleBufferedEngine(), DoubleBufferedEngine(), universe),
+            (DenseEngine(), DenseEngine(), ClosedDenseUniverse.random(16, 16, lambda: random.choice([1, None]))),
+            (BitPackedEngine(), BitPackedEngine(), WrappedBitPackedUniverse.from_universe(universe))
+        )
+
+        for engine, timed_engine, expected_universe in cases:
+            actual_universe = expected_universe
+
+            for _ in range(3):
+                expected_universe = engine.step(expected_universe, lambda: 1)
+                actual_universe, timings = timed_engine.timed_step(actual_universe, lambda: 1)
+
+                self.assertEqual(actual_universe, expected_universe)
+                self.assertTrue(all(timing >= 0 for timing in timings))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+from unittest import TestCase
+from life import (
+    ActiveEngine, ChunkedEngine, ClosedUniverse, InfiniteUniverse, ParallelEngine, WrappedChunkedUniverse,
+    WrappedDenseUniverse, WrappedUniverse
+)
+
+
+class ParallelEngineTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            ParallelEngine(-1)
+
+    def test_step_infinite_universe(self):
+        with ParallelEngine(1) as engine:
+            with self.assertRaises(ValueError):
+                engine.step(InfiniteUniverse.from_data([[1, 1, 1]]), lambda: 1)
+
+    def test_step_matches_active_engine(self):
+        random.seed(42)
+
+        with ParallelEngine(3) as engine:
+            for cls in (ClosedUniverse, WrappedUniverse):
+                for width, height in ((1, 1), (2, 3), (16, 9), (9, 16)):
+                    expected_universe = cls.random(width, height, lambda: random.choice([1, None]))
+                    actual_universe = expected_universe
+
+                    for _ in range(5):
+                        expected_universe = ActiveEngine().step(expected_universe, lambda: 1)
+                        actual_universe = engine.step(actual_universe, lambda: 1)
+
+                        self.assertIsInstance(actual_universe, cls)
+                        self.assertEqual(actual_universe, expected_universe)
+
+    def test_step_chunked_universe(self):
+        random.seed(42)
+        universe = WrappedChunkedUniverse.random(16, 9, lambda: random.choice([1, None]))
+
+        with ParallelEngine(2) as engine:
+            next_universe = engine.step(universe, lambda: 1)
+
+        expected_universe = ActiveEngine().step(universe, lambda: 1)
+
+        self.assertEqual(next_universe, expected_universe)
+        self.assertEqual(ChunkedEngine().step(next_universe, lambda: 1),
+                         ActiveEngine().step(expected_universe, lambda: 1))
+
+    def test_step_dense_universe(self):
+        universe = WrappedDenseUniverse.from_data([
+            [0, 1, 0],
+            [0, 1, 0],
+            [0, 1, 0]
+        ])
+
+        with ParallelEngine(2) as engine:
+            next_universe = engine.step(universe, lambda: 1)
+
+        self.assertEqual(next_universe._states.tolist(), [[1, 1, 1], [1, 1, 1], [1, 1, 1]])
+        self.assertEqual(next_universe, ActiveEngine().step(universe, lambda: 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
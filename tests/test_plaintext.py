@@ -0,0 +1,54 @@
+import io
+import random
+from unittest import TestCase
+from life import ClosedUniverse, InfiniteUniverse, WrappedUniverse, read_plaintext, write_plaintext
+
+
+class PlaintextTestCase(TestCase):
+    def test_read_plaintext(self):
+        file = io.StringIO('!Name: Glider\n!\n.O\n..O\nOOO\n')
+
+        universe = read_plaintext(file, ClosedUniverse, lambda: 1)
+
+        self.assertEqual(universe, ClosedUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ]))
+
+    def test_read_plaintext_infinite_universe(self):
+        universe = read_plaintext(io.StringIO('.O\n..O\nOOO\n'), InfiniteUniverse, lambda: 1)
+
+        self.assertEqual(universe, InfiniteUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ]))
+
+    def test_write_plaintext(self):
+        universe = ClosedUniverse.from_data([
+            [0, 1, 0, 0],
+            [0, 0, 0, 0],
+            [1, 0, 1, 0],
+            [0, 0, 0, 0]
+        ])
+
+        file = io.StringIO()
+        write_plaintext(universe, file)
+
+        self.assertEqual(file.getvalue(), '.O..\n....\nO.O.\n....\n')
+
+    def test_round_trip(self):
+        random.seed(42)
+
+        universe = WrappedUniverse.random(17, 11, lambda: random.choice([1, None, None]))
+
+        file = io.StringIO()
+        write_plaintext(universe, file)
+        file.seek(0)
+
+        self.assertEqual(read_plaintext(file, WrappedUniverse, lambda: 1), universe)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+from unittest import TestCase
+from life import (
+    Cell, ClosedBitPackedUniverse, ClosedDenseUniverse, ClosedUniverse, InfiniteUniverse, WrappedUniverse, render
+)
+
+
+class RendererTestCase(TestCase):
+    def test_render(self):
+        universe = ClosedUniverse.from_data([
+            [1, 0, 3],
+            [0, 5, 0]
+        ])
+
+        self.assertMultiLineEqual(render(universe), '1   3\n  5  ')
+        self.assertMultiLineEqual(render(ClosedUniverse(2, 2)), '   \n   ')
+
+    def test_same_as_lookups(self):
+        universe = WrappedUniverse.random(13, 7, Cell.shared, probability=.4, seed=1)
+        rows = ((str(universe[x, y] or ' ') for x in range(13)) for y in range(7))
+
+        self.assertMultiLineEqual(render(universe), '\n'.join(' '.join(row) for row in rows))
+
+    def test_wide_glyphs(self):
+        universe = ClosedUniverse.from_data([
+            [10, 0],
+            [0, 'é']
+        ])
+
+        self.assertMultiLineEqual(render(universe), '10  \n  é')
+
+    def test_viewport(self):
+        universe = ClosedUniverse.from_data([
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ])
+
+        self.assertMultiLineEqual(render(universe, (1, 1, 2, 2)), '5 6\n8 9')
+        self.assertMultiLineEqual(render(universe, (2, 0, 3, 1)), '3    ')
+        self.assertEqual(render(universe, (0, 0, 0, 3)), '')
+
+    def test_scale(self):
+        universe = ClosedUniverse.from_data([
+            [1, 1, 0, 0, 1],
+            [1, 1, 0, 0, 0],
+            [0, 0, 0, 1, 0],
+            [0, 0, 1, 1, 0]
+        ])
+
+        self.assertMultiLineEqual(render(universe, scale=2, shades=' .o@'), '@   .\n  o  ')
+
+        with self.assertRaises(ValueError):
+            render(universe, scale=0)
+
+    def test_scale_default_shades(self):
+        full = ClosedUniverse.from_data([[1] * 4] * 2)
+        blocks = ClosedUniverse.from_data([
+            [1, 0, 1, 1, 1, 1],
+            [0, 0, 0, 0, 1, 0]
+        ])
+
+        self.assertMultiLineEqual(render(full, scale=2), '@ @')
+        self.assertMultiLineEqual(render(blocks, scale=2), '. - *')
+        self.assertMultiLineEqual(render(ClosedUniverse.from_data([[1] * 3] * 3), scale=3), '@')
+
+    def test_universes(self):
+        data = [
+            [0, 1, 0],
+            [0, 1, 0]
+        ]
+        expected = '  *  \n  *  '
+
+        self.assertMultiLineEqual(str(ClosedUniverse.from_data(data)), '  1  \n  1  ')
+        self.assertMultiLineEqual(str(ClosedDenseUniverse.from_data([[0, '*', 0], [0, '*', 0]])), expected)
+        self.assertMultiLineEqual(str(ClosedBitPackedUniverse.from_universe(ClosedUniverse.from_data(data))), expected)
+
+    def test_infinite_universe(self):
+        universe = InfiniteUniverse()
+        universe[-5, -3] = 1
+        universe[-4, -2] = 2
+
+        self.assertMultiLineEqual(str(universe), '1  \n  2')
+        self.assertMultiLineEqual(universe.render(-6, -3, 2, 1), '  1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import io
+import random
+from unittest import TestCase
+from life import (
+    BRIANS_BRAIN, CONWAY, HIGHLIFE, ClosedBitPackedUniverse, ClosedUniverse, Dying, InfiniteUniverse, WrappedUniverse,
+    read_rle, write_rle
+)
+from life.formats import rle
+
+
+class RleTestCase(TestCase):
+    def test_read_rle(self):
+        file = io.StringIO('#N Glider\n#C A comment\nx = 4, y = 3, rule = B36/S23\nbo$2bo$3o!')
+
+        universe, rule = read_rle(file, ClosedUniverse, lambda: 1)
+
+        self.assertEqual(rule, HIGHLIFE)
+        self.assertEqual(universe, ClosedUniverse.from_data([
+            [0, 1, 0, 0],
+            [0, 0, 1, 0],
+            [1, 1, 1, 0]
+        ]))
+
+    def test_read_rle_without_rule(self):
+        universe, rule = read_rle(io.StringIO('x = 2, y = 3\n2o2$o!'), WrappedUniverse, lambda: 1)
+
+        self.assertEqual(rule, CONWAY)
+        self.assertEqual(universe, WrappedUniverse.from_data([
+            [1, 1],
+            [0, 0],
+            [1, 0]
+        ]))
+
+    def test_read_rle_infinite_universe(self):
+        universe, _ = read_rle(io.StringIO('x = 4, y = 3\nbo$2bo$3o!'), InfiniteUniverse, lambda: 1)
+
+        self.assertEqual(universe.bounds, (0, 0, 2, 2))
+        self.assertEqual(universe, InfiniteUniverse.from_data([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 1, 1]
+        ]))
+
+    def test_read_rle_in_chunks(self):
+        chunk_size = rle.CHUNK_SIZE
+        rle.CHUNK_SIZE = 1
+
+        try:
+            universe, _ = read_rle(io.StringIO('x = 12, y = 2\n10bo$\n12o!'), ClosedUniverse, lambda: 1)
+        finally:
+            rle.CHUNK_SIZE = chunk_size
+
+        self.assertEqual(sorted(universe.alive()), sorted([(10, 0)] + [(x, 1) for x in range(12)]))
+
+    def test_read_rle_generations(self):
+        universe, rule = read_rle(io.StringIO('x = 3, y = 1, rule = B2/S/C3\nA.B!'), ClosedUniverse, lambda: 1)
+
+        self.assertEqual(rule, BRIANS_BRAIN)
+        self.assertEqual(universe[0, 0], 1)
+        self.assertIsNone(universe[1, 0])
+        self.assertEqual(universe[2, 0], Dying(2))
+
+    def test_read_rle_invalid(self):
+        with self.assertRaises(ValueError):
+            read_rle(io.StringIO('#C No header'), ClosedUniverse, lambda: 1)
+
+        with self.assertRaises(ValueError):
+            read_rle(io.StringIO('x = 2, y = 2\n2z!'), ClosedUniverse, lambda: 1)
+
+    def test_write_rle(self):
+        universe = ClosedUniverse.from_data([
+            [0, 1, 0, 0],
+            [0, 0, 1, 0],
+            [1, 1, 1, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 1]
+        ])
+
+        file = io.StringIO()
+        write_rle(universe, file)
+
+        self.assertEqual(file.getvalue(), 'x = 4, y = 5, rule = B3/S23\nbo$2bo$3o2$3bo!\n')
+
+    def test_write_rle_wraps_lines(self):
+        universe = ClosedUniverse(100, 1)
+
+        for x in range(0, 100, 2):
+            universe[x, 0] = 1
+
+        file = io.StringIO()
+        write_rle(universe, file)
+
+        self.assertTrue(all(len(line) <= 70 for line in file.getvalue().splitlines()))
+
+    def test_round_trip(self):
+        random.seed(42)
+
+        for universe in (
+            WrappedUniverse.random(37, 23, lambda: random.choice([1, None])),
+            ClosedBitPackedUniverse.from_universe(ClosedUniverse.random(70, 3, lambda: random.choice([1, None]))),
+            ClosedUniverse.random(9, 9, lambda: random.choice([1, None, Dying(2)]))
+        ):
+            rule = BRIANS_BRAIN if any(isinstance(universe[position], Dying) for position in universe.alive()) \
+                else CONWAY
+
+            file = io.StringIO()
+            write_rle(universe, file, rule)
+            file.seek(0)
+
+            actual_universe, actual_rule = read_rle(file, type(universe), lambda: 1)
+
+            self.assertEqual(actual_universe, universe)
+            self.assertEqual(actual_rule, rule)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import random
+from unittest import TestCase
+from life import (
+    BRIANS_BRAIN, CONWAY, DAY_AND_NIGHT, HIGHLIFE, SEEDS, ActiveEngine, BitPackedEngine, ClosedBitPackedUniverse,
+    ClosedDenseUniverse, ClosedUniverse, DenseEngine, DoubleBufferedEngine, Dying, HashLifeEngine, ParallelEngine,
+    Rule, ScanEngine, WrappedBitPackedUniverse, WrappedDenseUniverse, WrappedUniverse, live, originate_from
+)
+
+
+class RuleTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            Rule([9], [2])
+
+        with self.assertRaises(ValueError):
+            Rule([3], [2, 3], 1)
+
+    def test_parse(self):
+        self.assertEqual(Rule.parse('B36/S23'), Rule([3, 6], [2, 3]))
+        self.assertEqual(Rule.parse('s23/b36'), Rule([3, 6], [2, 3]))
+        self.assertEqual(Rule.parse('23/36'), Rule([3, 6], [2, 3]))
+        self.assertEqual(Rule.parse('B2/S'), Rule([2], []))
+        self.assertEqual(Rule.parse('B2/S345/C4'), Rule([2], [3, 4, 5], 4))
+        self.assertEqual(Rule.parse('B2/S345/4'), Rule([2], [3, 4, 5], 4))
+        self.assertEqual(Rule.parse('345/2/4'), Rule([2], [3, 4, 5], 4))
+
+        for notation in ('', 'B3', 'B3/B3', 'B3/X23', 'B3/S23/C1', 'B39/S23', '1/2/3/4'):
+            with self.assertRaises(ValueError):
+                Rule.parse(notation)
+
+    def test_str(self):
+        self.assertEqual(str(HIGHLIFE), 'B36/S23')
+        self.assertEqual(str(BRIANS_BRAIN), 'B2/S/C3')
+
+    def test_table(self):
+        self.assertEqual(CONWAY.table, (
+            (0, 0, 0, 1, 0, 0, 0, 0, 0),
+            (0, 0, 1, 1, 0, 0, 0, 0, 0)
+        ))
+
+        self.assertEqual(BRIANS_BRAIN.table, (
+            (0, 0, 1, 0, 0, 0, 0, 0, 0),
+            (2, 2, 2, 2, 2, 2, 2, 2, 2),
+            (0, 0, 0, 0, 0, 0, 0, 0, 0)
+        ))
+
+    def test_apply(self):
+        cell = object()
+
+        self.assertIs(CONWAY.apply(cell, 2, lambda: 1), cell)
+        self.assertIsNone(CONWAY.apply(cell, 4, lambda: 1))
+        self.assertEqual(HIGHLIFE.apply(None, 6, lambda: 1), 1)
+        self.assertEqual(BRIANS_BRAIN.apply(cell, 2, lambda: 1), Dying(2))
+        self.assertIsNone(BRIANS_BRAIN.apply(Dying(2), 2, lambda: 1))
+
+    def test_live(self):
+        self.assertEqual(live(None, [1, 1, 1, 1, 1, 1, None, None], lambda: 1, HIGHLIFE), 1)
+        self.assertIsNone(live(None, [1, Dying(2), Dying(2), None], lambda: 1, SEEDS))
+
+    def test_engines_honour_rules(self):
+        random.seed(42)
+
+        rules = (HIGHLIFE, DAY_AND_NIGHT, SEEDS, BRIANS_BRAIN, Rule.parse('B0/S8'))
+        universes = (
+            (ClosedUniverse, ClosedDenseUniverse, ClosedBitPackedUniverse),
+            (WrappedUniverse, WrappedDenseUniverse, WrappedBitPackedUniverse)
+        )
+
+        with ParallelEngine(2) as parallel_engine:
+            for rule in rules:
+                for sparse_cls, dense_cls, bit_packed_cls in universes:
+                    data = [[random.choice([1, None]) for _ in range(8)] for _ in range(6)]
+
+                    expected = [sparse_cls.from_data(data)]
+
+                    for _ in range(4):
+                        expected.append(ScanEngine().step(expected[-1], lambda: 1, rule))
+
+                    engines = [
+                        (DenseEngine(), dense_cls.from_data(data)),
+                        (parallel_engine, sparse_cls.from_data(data))
+                    ]
+
+                    if 0 not in rule.birth:
+                        engines += [(ActiveEngine(), sparse_cls.from_data(data)), (DoubleBufferedEngine(), expected[0])]
+
+                    if rule.states == 2:
+                        engines += [(HashLifeEngine(), expected[0])]
+
+                    for engine, universe in engines:
+                        for expected_universe in expected[1:]:
+                            universe = engine.step(universe, lambda: 1, rule)
+                            self.assertEqual(universe, expected_universe, '{} {}'.format(engine, rule))
+
+                    if rule.states == 2:
+                        universe = bit_packed_cls.from_universe(expected[0])
+
+                        for expected_universe in expected[1:]:
+                            universe = BitPackedEngine().step(universe, None, rule)
+                            self.assertEqual(universe.to_universe(sparse_cls, lambda: 1), expected_universe)
+
+    def test_two_state_engines_reject_generations_rules(self):
+        with self.assertRaises(ValueError):
+            BitPackedEngine().step(ClosedBitPackedUniverse(2, 2), None, BRIANS_BRAIN)
+
+        with self.assertRaises(ValueError):
+            HashLifeEngine().step(ClosedUniverse(2, 2), lambda: 1, BRIANS_BRAIN)
+
+    def test_active_engine_rejects_b0_rules(self):
+        with self.assertRaises(ValueError):
+            ActiveEngine().step(ClosedUniverse(2, 2), lambda: 1, Rule.parse('B0/S8'))
+
+    def test_originate_from_rule(self):
+        universe = WrappedUniverse.from_data([
+            [0, 0, 0, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 1, 0, 0],
+            [0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0]
+        ])
+
+        next_universe = next(originate_from(universe, lambda: 1, rule=BRIANS_BRAIN))
+
+        self.assertEqual(next_universe[2, 1], Dying(2))
+        self.assertEqual(next_universe[1, 1], 1)
+        self.assertEqual(next_universe[3, 2], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
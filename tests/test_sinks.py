@@ -0,0 +1,73 @@
+import io
+import json
+from unittest import TestCase
+from life import CsvSink, Histogram, JsonLinesSink, Metrics
+
+
+METRICS = [
+    Metrics(1, 3, 2, 2, .0015, .0005, .0005, .0001, (1, 2, 3, 2)),
+    Metrics(2, 0, 0, 3, .0025, None, None, None, None)
+]
+
+
+class SinksTestCase(TestCase):
+    def test_csv_sink(self):
+        file = io.StringIO()
+        sink = CsvSink(file)
+
+        for metrics in METRICS:
+            sink(metrics)
+
+        self.assertEqual(file.getvalue().splitlines(), [
+            'generation,population,born,died,step,counting,evaluating,copying,left,top,right,bottom',
+            '1,3,2,2,0.0015,0.0005,0.0005,0.0001,1,2,3,2',
+            '2,0,0,3,0.0025,,,,,,,'
+        ])
+
+    def test_json_lines_sink(self):
+        file = io.StringIO()
+        sink = JsonLinesSink(file)
+
+        for metrics in METRICS:
+            sink(metrics)
+
+        lines = [json.loads(line) for line in file.getvalue().splitlines()]
+
+        self.assertEqual(lines[0]['bounding_box'], [1, 2, 3, 2])
+        self.assertEqual(lines[1], dict(METRICS[1]._asdict()))
+
+    def test_histogram(self):
+        histogram = Histogram('step', 1e-3)
+
+        for metrics in METRICS:
+            histogram(metrics)
+
+        self.assertEqual(dict(histogram.buckets), {1: 1, 2: 1})
+        self.assertEqual(histogram.count, 2)
+        self.assertAlmostEqual(histogram.mean, .002)
+        self.assertAlmostEqual(histogram.percentile(50), .002)
+        self.assertAlmostEqual(histogram.percentile(100), .0025)
+
+    def test_histogram_skips_missing_values(self):
+        histogram = Histogram('counting', 1e-3)
+
+        for metrics in METRICS:
+            histogram(metrics)
+
+        self.assertEqual(histogram.count, 1)
+
+    def test_histogram_invalid(self):
+        with self.assertRaises(ValueError):
+            Histogram('bounding_box')
+
+        with self.assertRaises(ValueError):
+            Histogram('step', 0)
+
+        with self.assertRaises(ValueError):
+            Histogram().percentile(101)
+
+        self.assertIsNone(Histogram().percentile(50))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from life import ClosedUniverse, Soup, SoupSearch, WrappedDenseUniverse, WrappedUniverse
+from life.soup_search import read_seeds, run_soup
+
+
+class SoupSearchTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, 'results.jsonl')
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        os.rmdir(os.path.dirname(self.path))
+
+    def read(self):
+        with open(self.path) as file:
+            return [Soup(**json.loads(line)) for line in file]
+
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            SoupSearch(self.path, 0, 8)
+
+        with self.assertRaises(ValueError):
+            SoupSearch(self.path, 8, 8, generations=0)
+
+        with self.assertRaises(ValueError):
+            SoupSearch(self.path, 8, 8, workers=-1)
+
+        with self.assertRaises(ValueError):
+            SoupSearch(self.path, 8, 8, chunk_size=0)
+
+    def test_run_soup(self):
+        soup = run_soup(3, 12, 12)
+
+        self.assertEqual(soup, run_soup(3, 12, 12, cls=WrappedDenseUniverse))
+        self.assertEqual(soup.lifespan, soup.start + soup.period)
+
+        capped = run_soup(3, 12, 12, generations=soup.start - 1)
+
+        self.assertEqual((capped.lifespan, capped.start, capped.period), (soup.start - 1, None, None))
+
+    def test_run(self):
+        search = SoupSearch(self.path, 10, 10, generations=200, cls=ClosedUniverse, workers=2, chunk_size=3)
+        soups = list(search.run([1, 2, 3, 2, 4, 5, 6, 7, 1]))
+
+        self.assertEqual(sorted(soup.seed for soup in soups), [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(sorted(self.read()), sorted(soups))
+        self.assertEqual(soups[0], run_soup(soups[0].seed, 10, 10, generations=200, cls=ClosedUniverse))
+
+    def test_resume(self):
+        list(SoupSearch(self.path, 8, 8, workers=1).run(range(4)))
+
+        with open(self.path, 'a') as file:
+            file.write('{"seed": 4, "popul')
+
+        self.assertEqual(read_seeds(self.path), {0, 1, 2, 3})
+
+        search = SoupSearch(self.path, 8, 8, workers=1)
+        soups = list(search.run(range(6)))
+
+        self.assertEqual(sorted(soup.seed for soup in soups), [4, 5])
+        self.assertEqual(sorted(soup.seed for soup in self.read()), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(sorted(self.read())[4], run_soup(4, 8, 8, cls=WrappedUniverse))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+from copy import copy
+from unittest import TestCase
+from life import ClosedChunkedUniverse, ClosedUniverse, InfiniteUniverse, SpatialIndex, WrappedUniverse
+
+
+class SpatialIndexTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            SpatialIndex(tile_size=0)
+
+    def test_queries(self):
+        random.seed(42)
+        positions = {(random.randrange(-50, 150), random.randrange(-50, 150)) for _ in range(2000)}
+        index = SpatialIndex(positions, tile_size=16)
+
+        self.assertEqual(len(index), len(positions))
+
+        for left, top, width, height in ((0, 0, 100, 100), (-50, -50, 200, 200), (13, 7, 1, 40), (5, 5, 0, 5),
+                                         (17, 3, 32, 64), (1000, 1000, 10, 10)):
+            expected = {(x, y) for x, y in positions if left <= x < left + width and top <= y < top + height}
+
+            self.assertEqual(index.population(left, top, width, height), len(expected))
+            self.assertEqual(sorted(index.positions(left, top, width, height)), sorted(expected))
+
+    def test_add_remove(self):
+        index = SpatialIndex(tile_size=4)
+
+        index.add((1, 1))
+        index.add((1, 1))
+        index.add((9, 9))
+        index.remove((1, 1))
+        index.remove((5, 5))
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.positions(0, 0, 16, 16), [(9, 9)])
+        self.assertEqual(index.population(0, 0, 8, 8), 0)
+
+    def test_universe(self):
+        random.seed(42)
+
+        for cls in (ClosedUniverse, WrappedUniverse, ClosedChunkedUniverse):
+            universe = cls.random(90, 70, lambda: 1 if random.random() < .2 else None)
+            index = universe.spatial_index()
+
+            # Writes keep the index up to date.
+            for _ in range(500):
+                universe[random.randrange(90), random.randrange(70)] = 1 if random.random() < .5 else None
+
+            self.assertIs(universe.spatial_index(), index)
+
+            expected = sorted((x, y) for x, y in universe.alive() if 10 <= x < 60 and 20 <= y < 45)
+
+            self.assertEqual(sorted(universe.alive_in(10, 20, 50, 25)), expected)
+            self.assertEqual(universe.population_in(10, 20, 50, 25), len(expected))
+            self.assertEqual(universe.population_in(0, 0, 90, 70), len(list(universe.alive())))
+
+    def test_copy_drops_index(self):
+        universe = ClosedUniverse(10, 10)
+        universe.spatial_index()
+        copied = copy(universe)
+        copied[1, 1] = 1
+
+        self.assertIsNone(copied._index)
+        self.assertEqual(universe.population_in(0, 0, 10, 10), 0)
+        self.assertEqual(copied.population_in(0, 0, 10, 10), 1)
+
+    def test_infinite_universe(self):
+        universe = InfiniteUniverse()
+        universe[-100, -100] = 1
+        universe.spatial_index()
+        universe[100, 100] = 1
+        universe[-100, -100] = None
+        universe[-5, 3] = 1
+
+        self.assertEqual(sorted(universe.alive_in(-10, -10, 200, 200)), [(-5, 3), (100, 100)])
+        self.assertEqual(universe.population_in(-200, -200, 100, 100), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import asyncio
+from unittest import TestCase
+from life import Changes, ClosedUniverse, Frame, Subscription
+from life.subscription import coalesce
+
+
+def frame(generation, born=(), died=()):
+    return Frame(generation, ClosedUniverse(3, 3), Changes(born=set(born), died=set(died)))
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class SubscriptionTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            Subscription(0)
+
+        with self.assertRaises(ValueError):
+            Subscription(1, 'skip')
+
+        with self.assertRaises(ValueError):
+            Subscription(1, 'drop', 0)
+
+    def test_drop(self):
+        async def test():
+            subscription = Subscription(2, 'drop')
+
+            for generation in range(1, 5):
+                await subscription.put(frame(generation, born=[(generation, 0)]))
+
+            subscription.close()
+
+            return [frame async for frame in subscription], subscription.dropped
+
+        frames, dropped = run(test())
+
+        self.assertEqual([f.generation for f in frames], [3, 4])
+        self.assertEqual([f.changes.born for f in frames], [{(3, 0)}, {(4, 0)}])
+        self.assertEqual(dropped, 2)
+
+    def test_coalesce(self):
+        async def test():
+            subscription = Subscription(1, 'coalesce')
+
+            await subscription.put(frame(1, born=[(0, 0), (1, 0)]))
+            await subscription.put(frame(2, born=[(2, 0)], died=[(0, 0)]))
+            await subscription.put(frame(3, died=[(2, 2)]))
+            subscription.close()
+
+            return [frame async for frame in subscription]
+
+        frames = run(test())
+
+        self.assertEqual([f.generation for f in frames], [3])
+        self.assertEqual(frames[0].changes, Changes(born={(1, 0), (2, 0)}, died={(2, 2)}))
+
+    def test_block(self):
+        async def test():
+            subscription = Subscription(1, 'block')
+            put = asyncio.ensure_future(subscription.put(frame(2)))
+
+            await subscription.put(frame(1))
+            await asyncio.sleep(0)
+            is_blocked = not put.done()
+
+            first = await subscription.get()
+            await put
+
+            return is_blocked, first.generation, (await subscription.get()).generation, subscription.dropped
+
+        self.assertEqual(run(test()), (True, 1, 2, 0))
+
+    def test_get_after_close(self):
+        async def test():
+            subscription = Subscription()
+            await subscription.put(frame(1))
+            subscription.close()
+            await subscription.put(frame(2))
+
+            return await subscription.get(), await subscription.get()
+
+        first, second = run(test())
+
+        self.assertEqual(first.generation, 1)
+        self.assertIsNone(second)
+
+    def test_frames_per_second(self):
+        async def test():
+            loop = asyncio.get_event_loop()
+            subscription = Subscription(1, frames_per_second=20)
+
+            await subscription.put(frame(1))
+            start = loop.time()
+            await subscription.__anext__()
+            await subscription.put(frame(2))
+            await subscription.__anext__()
+
+            return loop.time() - start
+
+        self.assertGreaterEqual(run(test()), .045)
+
+    def test_coalesce_changes(self):
+        changes = coalesce(Changes(born={(0, 0), (1, 1)}, died={(2, 2), (3, 3)}),
+                           Changes(born={(2, 2)}, died={(1, 1), (4, 4)}))
+
+        self.assertEqual(changes, Changes(born={(0, 0), (2, 2)}, died={(3, 3), (4, 4)}))
+
+    def test_coalesce_changed(self):
+        changes = coalesce(Changes(born={(0, 0)}, died=set(), changed={(1, 1), (2, 2)}),
+                           Changes(born=set(), died={(1, 1)}, changed={(0, 0), (3, 3)}))
+
+        self.assertEqual(changes, Changes(born={(0, 0)}, died={(1, 1)}, changed={(2, 2), (3, 3)}))
+
+
+if __name__ == '__main__':
+    unittest.main()
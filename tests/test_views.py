@@ -0,0 +1,162 @@
+from copy import copy
+from itertools import islice
+from unittest import TestCase
+from life import (
+    ClosedBitPackedUniverse, ClosedUniverse, InfiniteUniverse, ScanEngine, TranslatedView, WindowView,
+    WrappedUniverse, WrappedView, originate_from
+)
+
+
+def numbers():
+    return ClosedUniverse.from_data([
+        [1, 2, 3, 0],
+        [4, 5, 6, 0],
+        [7, 8, 9, 0]
+    ])
+
+
+class WindowViewTestCase(TestCase):
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            WindowView(numbers(), 0, 0, 0, 1)
+
+        with self.assertRaises(ValueError):
+            WindowView(numbers(), 2, 0, 3, 1)
+
+        self.assertEqual(WindowView(InfiniteUniverse(), -10, -10, 5, 5).width, 5)
+
+    def test_window(self):
+        universe = numbers()
+        view = WindowView(universe, 1, 1, 2, 2)
+
+        self.assertEqual((view.width, view.height), (2, 2))
+        self.assertEqual(list(view.through()), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(view[0, 0], 5)
+        self.assertIsNone(view[2, 0])
+        self.assertEqual(sorted(view.alive()), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(list(view.neighbours_of(0, 0)), [6, 9, 8])
+        self.assertEqual(str(view), '5 6\n8 9')
+        self.assertEqual(view, ClosedUniverse.from_data([[5, 6], [8, 9]]))
+
+    def test_writes_go_through(self):
+        universe = numbers()
+        view = WindowView(universe, 1, 1, 2, 2)
+
+        view[1, 1] = None
+        universe[1, 1] = 0
+
+        self.assertIsNone(universe[2, 2])
+        self.assertEqual(view[0, 0], 0)
+
+        with self.assertRaises(IndexError):
+            view[2, 2] = 1
+
+    def test_region_queries(self):
+        universe = WrappedUniverse.random(200, 200, lambda: 1, probability=.3, seed=1)
+        view = WindowView(universe, 50, 60, 100, 80)
+        expected = sorted((x - 50, y - 60) for x, y in universe.alive() if 50 <= x < 150 and 60 <= y < 140)
+
+        self.assertEqual(sorted(view.alive()), expected)
+        self.assertEqual(view.population_in(0, 0, 100, 80), len(expected))
+        self.assertEqual(view.population_in(-10, -10, 300, 300), len(expected))
+        window = [(x, y) for x, y in expected if 10 <= x < 15 and 10 <= y < 15]
+
+        self.assertEqual(sorted(view.alive_in(10, 10, 5, 5)), window)
+
+    def test_partly_overlapping_region_queries(self):
+        for universe in (ClosedUniverse(8, 8), ClosedBitPackedUniverse(8, 8)):
+            for x, y in ((1, 1), (3, 3), (6, 6)):
+                universe[x, y] = 1
+
+            view = WindowView(universe, 0, 0, 8, 8)
+
+            self.assertEqual(view.alive_in(-2, -2, 5, 5), [(1, 1)])
+            self.assertEqual(view.population_in(-2, -2, 5, 5), 1)
+            self.assertEqual(sorted(view.alive_in(5, 5, 10, 10)), [(6, 6)])
+
+    def test_copy(self):
+        universe = numbers()
+        view = WindowView(universe, 1, 1, 2, 2)
+        copied = copy(view)
+
+        copied[0, 0] = None
+
+        self.assertIsInstance(copied, WindowView)
+        self.assertEqual(view[0, 0], 5)
+        self.assertIsNot(copied.universe, universe)
+
+    def test_step(self):
+        universe = ClosedUniverse(8, 8)
+
+        for x, y in ((3, 2), (3, 3), (3, 4)):
+            universe[x, y] = 1
+
+        view = WindowView(universe, 2, 2, 3, 3)
+        next_view = next(originate_from(view, lambda: 1, ScanEngine()))
+
+        self.assertEqual(sorted(next_view.alive()), [(0, 1), (1, 1), (2, 1)])
+
+
+class TranslatedViewTestCase(TestCase):
+    def test_closed(self):
+        view = TranslatedView(numbers(), 1, -1)
+
+        self.assertEqual(str(view), '  4 5 6\n  7 8 9\n       ')
+        self.assertEqual(sorted(view.alive()), [(1, 0), (1, 1), (2, 0), (2, 1), (3, 0), (3, 1)])
+        self.assertIsNone(view[0, 0])
+
+    def test_wrapped(self):
+        universe = WrappedUniverse.from_data([
+            [1, 2, 3],
+            [4, 5, 6]
+        ])
+        view = TranslatedView(universe, 1, 1)
+
+        self.assertEqual(str(view), '6 4 5\n3 1 2')
+        self.assertEqual(len(list(view.alive())), 6)
+
+        view[0, 0] = None
+        self.assertIsNone(universe[2, 1])
+
+    def test_step_wrapped(self):
+        universe = WrappedUniverse(6, 6)
+
+        for y in (1, 2, 3):
+            universe[0, y] = 1
+
+        view = TranslatedView(universe, 0, 0)
+        next_view = next(originate_from(view, lambda: 1, ScanEngine()))
+
+        self.assertEqual(sorted(next_view.alive()), [(0, 2), (1, 2), (5, 2)])
+        self.assertEqual(sum(cell is not None for cell in view.neighbours_of(5, 2)), 3)
+
+
+class WrappedViewTestCase(TestCase):
+    def test_projection(self):
+        view = WrappedView(numbers())
+
+        self.assertEqual(view[-1, -1], None)
+        self.assertEqual(view[4, 3], 1)
+        self.assertEqual(list(view.neighbours_of(0, 0)), [None, 7, 8, 2, 5, 4, None, None])
+        self.assertEqual(sorted(view.alive()), sorted(numbers().alive()))
+        self.assertEqual(view.population_in(0, 0, 2, 2), 4)
+
+    def test_step(self):
+        universe = ClosedUniverse(5, 5)
+
+        for x, y in ((0, 1), (0, 2), (0, 3)):
+            universe[x, y] = 1
+
+        wrapped = WrappedUniverse(5, 5)
+
+        for x, y in ((0, 1), (0, 2), (0, 3)):
+            wrapped[x, y] = 1
+
+        views = list(islice(originate_from(WrappedView(universe), lambda: 1, ScanEngine()), 3))
+        expected = list(islice(originate_from(wrapped, lambda: 1, ScanEngine()), 3))
+
+        self.assertEqual([sorted(view.alive()) for view in views], [sorted(u.alive()) for u in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
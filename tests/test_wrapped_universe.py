@@ -3,6 +3,19 @@ from unittest import TestCase
 from life import WrappedUniverse
 
 
+class CylinderUniverse(WrappedUniverse):
+    """Represents a universe whose left and right edges wrap around, but top and bottom edges do not."""
+
+    def adjust_position(self, x, y):
+        if not self.is_position_in_range(x, y):
+            raise IndexError()
+
+        return x % self.width, y
+
+    def is_position_in_range(self, x, y):
+        return 0 <= y < self.height
+
+
 class WrappedUniverseTestCase(TestCase):
     def test_init(self):
         with self.assertRaises(ValueError):
@@ -50,6 +63,40 @@ class WrappedUniverseTestCase(TestCase):
         neighbours = universe.neighbours_of(1, 1)
         self.assertEqual(list(neighbours), [1, 2, 3, 6, 9, 8, 7, 4])
 
+        neighbours = universe.neighbours_of(3, -1)
+        self.assertEqual(list(neighbours), [6, 4, 5, 8, 2, 1, 3, 9])
+
+    def test_neighbour_counts(self):
+        universe = WrappedUniverse.from_data([
+            [1, 0, 0],
+            [0, 0, 0],
+            [0, 0, 1]
+        ])
+
+        counts = universe.neighbour_counts()
+        self.assertEqual(counts, {
+            (0, 0): 1, (1, 0): 2, (2, 0): 2,
+            (0, 1): 2, (1, 1): 2, (2, 1): 2,
+            (0, 2): 2, (1, 2): 2, (2, 2): 1
+        })
+
+        universe = WrappedUniverse.from_data([[1]])
+        self.assertEqual(universe.neighbour_counts(), {(0, 0): 8})
+        self.assertEqual(list(universe.neighbours_of(0, 0)), [1] * 8)
+
+    def test_neighbours_of_redefined_edges(self):
+        universe = CylinderUniverse.from_data([
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ])
+
+        self.assertEqual(list(universe.neighbours_of(0, 1)), [3, 1, 2, 5, 8, 7, 9, 6])
+        self.assertEqual(list(universe.neighbours_of(0, 0)), [2, 5, 4, 6, 3])
+        self.assertEqual(universe.neighbour_counts([(0, 1)]), {
+            (2, 0): 1, (0, 0): 1, (1, 0): 1, (2, 1): 1, (1, 1): 1, (2, 2): 1, (0, 2): 1, (1, 2): 1
+        })
+
     def test_adjust_position(self):
         universe = WrappedUniverse(2, 2)
 
@@ -189,6 +236,20 @@ class WrappedUniverseTestCase(TestCase):
         self.assertEqual(universe[0, 1], 1)
         self.assertEqual(universe[1, 1], 1)
 
+    def test_random_with_probability(self):
+        universe = WrappedUniverse.random(64, 32, lambda: 1, probability=.25, seed=7)
+
+        self.assertEqual((universe.width, universe.height), (64, 32))
+        self.assertTrue(all(universe[position] == 1 for position in universe.alive()))
+        self.assertTrue(.2 < len(list(universe.alive())) / (64 * 32) < .3)
+        self.assertEqual(universe, WrappedUniverse.random(64, 32, lambda: 1, probability=.25, seed=7))
+
+        self.assertEqual(list(WrappedUniverse.random(4, 4, lambda: 1, probability=0).alive()), [])
+        self.assertEqual(len(list(WrappedUniverse.random(4, 4, lambda: 1, probability=1).alive())), 16)
+
+        with self.assertRaises(ValueError):
+            WrappedUniverse.random(4, 4, lambda: 1, probability=1.5)
+
 
 if __name__ == '__main__':
     unittest.main()